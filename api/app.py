@@ -4,40 +4,170 @@ Composition root for the read side: builds the document store, loads the persist
 index, and picks the query embedder (must match the one that built the index — handled
 by core.factory). All ranking logic lives in core; this module only does HTTP.
 
+The api follows the pipeline's published index versions without a restart (see
+`_reload`). Routes are `async def`: the embedding call is awaited, so a query waiting
+on Gemini holds no worker thread; only the short in-memory ranking borrows one.
+
 Run:  uv run fastapi dev app.py   (from api/)
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 from typing import Literal
 
 import structlog
 from core.adapters.document_store import LocalDocumentStore
-from core.adapters.search_backend import LocalSearchBackend
+from core.adapters.embedding import (
+    CachedEmbeddingProvider,
+    CoalescingEmbeddingProvider,
+)
+from core.cache import CacheStats
 from core.config import settings
-from core.factory import build_embedding_provider, build_fusion_strategy
-from core.search import SearchResult, SearchService, SongView
-from fastapi import FastAPI, HTTPException, Query
+from core.factory import (
+    build_embedding_provider,
+    build_fusion_strategy,
+    build_index_versions,
+    build_search_backend,
+)
+from core.metrics import REGISTRY, Sample
+from core.search import (
+    LexicalIndex,
+    SearchPage,
+    SearchRanking,
+    SearchResult,
+    SearchService,
+    SearchTrace,
+    SimilarityGraph,
+    SongView,
+    Suggestion,
+    TitleIndex,
+)
+from fastapi import FastAPI, HTTPException, Query, Response
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from pydantic import BaseModel
 
 logger = structlog.get_logger(__name__).bind(context="api")
 
 
+class IndexStatus(BaseModel):
+    version: str | None  # None: unversioned index (or none loaded)
+    reloaded: bool
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Build the SearchService once at startup; load the index into memory."""
-    store = LocalDocumentStore(settings.data_dir)
-    backend = LocalSearchBackend(settings.data_dir / "index")
-    try:
-        backend.load()
-        app.state.search = SearchService(
-            store, backend, build_embedding_provider(), build_fusion_strategy()
-        )
-        logger.info("search ready", model=app.state.search.embedder.model_id)
-    except FileNotFoundError:
-        app.state.search = None
+    """Build the SearchService at startup from the published index version, then
+    keep following `CURRENT` for newer ones."""
+    app.state.store = LocalDocumentStore(settings.data_dir)
+    app.state.embedder = build_embedding_provider(serving=True)
+    app.state.versions = build_index_versions()
+    app.state.search = None
+    app.state.index_version = None
+    app.state.reload_lock = asyncio.Lock()
+    await _reload(app)
+    if app.state.search is None:
         logger.warning(
             "no index found — run `pipeline.cli all` first; /search disabled"
         )
+    watcher = None
+    if settings.index_poll_seconds > 0:
+        watcher = asyncio.create_task(_watch_index(app))
+
+    def collect() -> list[Sample]:
+        return _cache_samples(app)
+
+    REGISTRY.register_collector(collect)
     yield
+    REGISTRY.unregister_collector(collect)
+    if watcher is not None:
+        watcher.cancel()
+
+
+async def _reload(app: FastAPI) -> bool:
+    """Swap in the published index version if it isn't the one being served.
+
+    The pipeline publishes each build as a new version (`core.index_versions`); this
+    runs every `index_poll_seconds` and on `POST /admin/reload`. Loading (index +
+    song catalog) runs on a worker thread, so the current SearchService keeps
+    answering meanwhile; the swap itself is a single reference assignment, and
+    requests already running finish on the service they started with."""
+    async with app.state.reload_lock:
+        version = app.state.versions.current()
+        if app.state.search is not None and version == app.state.index_version:
+            return False
+        try:
+            service = await asyncio.to_thread(_load_service, app, version)
+        except FileNotFoundError:
+            return False
+        app.state.search = service
+        app.state.index_version = version
+        logger.info("search ready", version=version, model=service.embedder.model_id)
+        return True
+
+
+def _load_service(app: FastAPI, version: str | None) -> SearchService:
+    versions = app.state.versions
+    index_dir = versions.root / version if version else versions.root
+    return SearchService(
+        app.state.store,
+        build_search_backend(index_dir).load(),
+        app.state.embedder,
+        build_fusion_strategy(),
+        lexical=(
+            LexicalIndex.load(index_dir) if LexicalIndex.exists(index_dir) else None
+        ),
+        titles=TitleIndex.load(index_dir) if TitleIndex.exists(index_dir) else None,
+        similar=(
+            SimilarityGraph.load(index_dir)
+            if settings.similar_songs_k > 0 and SimilarityGraph.exists(index_dir)
+            else None
+        ),
+    )
+
+
+def _cache_stats(app: FastAPI) -> dict[str, CacheStats]:
+    stats: dict[str, CacheStats] = {}
+    if isinstance(app.state.embedder, CachedEmbeddingProvider):
+        stats["query_embeddings"] = app.state.embedder.stats()
+    search = app.state.search
+    if search is not None:
+        stats["search_results"] = search.results.stats()
+        if search.semantic is not None:
+            stats["semantic_results"] = search.semantic.stats()
+    return stats
+
+
+def _cache_samples(app: FastAPI) -> list[Sample]:
+    """Scrape-time samples for /metrics: cache counters and the coalescer's."""
+    samples: list[Sample] = []
+    for cache, s in _cache_stats(app).items():
+        labels = {"cache": cache}
+        samples += [
+            ("ira_cache_hits_total", "counter", labels, s.hits),
+            ("ira_cache_misses_total", "counter", labels, s.misses),
+            ("ira_cache_entries", "gauge", labels, s.size),
+        ]
+    embedder = app.state.embedder
+    if isinstance(embedder, CachedEmbeddingProvider):
+        labels = {"cache": "query_embeddings"}
+        disk_hits = embedder.stats().disk_hits
+        samples.append(("ira_cache_disk_hits_total", "counter", labels, disk_hits))
+        embedder = embedder.inner
+    if isinstance(embedder, CoalescingEmbeddingProvider):
+        for name, value in embedder.stats().items():
+            samples.append((f"ira_embed_coalesce_{name}_total", "counter", {}, value))
+    return samples
+
+
+async def _watch_index(app: FastAPI) -> None:
+    while True:
+        await asyncio.sleep(settings.index_poll_seconds)
+        try:
+            await _reload(app)
+        except Exception:
+            logger.exception(
+                "index reload failed — still serving", version=app.state.index_version
+            )
 
 
 app = FastAPI(title="ira", lifespan=lifespan)
@@ -55,20 +185,147 @@ def health() -> Literal["IRA"]:
 
 
 @app.get("/search", description="Hybrid semantic search over the songs")
-def search(
+async def search(
     q: str = Query(..., min_length=1, description="search query (English or Bengali)"),
     top_k: int = Query(10, ge=1, le=50),
     fusion: Literal["rrf", "weighted_sum"] | None = Query(
         None, description="override the fusion strategy for this call only"
     ),
+    debug: bool = Query(False, description="stage timings in a Server-Timing header"),
+    *,
+    response: Response,
 ) -> list[SearchResult]:
     override = build_fusion_strategy(fusion) if fusion else None
-    return _service(app).search(q, top_k=top_k, fusion=override)
+    trace = SearchTrace() if debug else None
+    results = await _service(app).asearch(q, top_k=top_k, fusion=override, trace=trace)
+    if trace is not None:
+        response.headers["Server-Timing"] = trace.server_timing()
+    return results
+
+
+@app.get(
+    "/search/stream",
+    description="Hybrid search, streamed: ranking frame first, then each result",
+    response_class=StreamingResponse,
+)
+async def search_stream(
+    q: str = Query(..., min_length=1, description="search query (English or Bengali)"),
+    top_k: int = Query(10, ge=1, le=50),
+    fusion: Literal["rrf", "weighted_sum"] | None = Query(
+        None, description="override the fusion strategy for this call only"
+    ),
+    format: Literal["ndjson", "sse"] = Query("ndjson", description="framing"),
+) -> StreamingResponse:
+    """NDJSON (default) or Server-Sent Events: a `{"ranking": [{song_id, score}, ...]}`
+    frame first, then one SearchResult per frame as each is hydrated, so a UI can
+    render the top hits before the last one is ready."""
+    override = build_fusion_strategy(fusion) if fusion else None
+    frames = _service(app).aiter_search(q, top_k=top_k, fusion=override)
+
+    async def body():
+        async for frame in frames:
+            data = frame.model_dump_json()
+            if format == "ndjson":
+                yield data + "\n"
+            else:
+                event = "ranking" if isinstance(frame, SearchRanking) else "result"
+                yield f"event: {event}\ndata: {data}\n\n"
+        if format == "sse":
+            yield "event: done\ndata: {}\n\n"
+
+    media_type = "application/x-ndjson" if format == "ndjson" else "text/event-stream"
+    return StreamingResponse(body(), media_type=media_type)
+
+
+@app.get("/search/pages", description="Paginated search: `q` first, then `cursor`")
+async def search_pages(
+    q: str | None = Query(None, min_length=1, description="query (first page)"),
+    cursor: str | None = Query(None, description="`next_cursor` of the previous page"),
+    page_size: int = Query(10, ge=1, le=50),
+    fusion: Literal["rrf", "weighted_sum"] | None = Query(
+        None, description="override the fusion strategy (first page only)"
+    ),
+) -> SearchPage:
+    """`?q=` returns the first page and a `next_cursor`; `?cursor=` the next page from
+    the ranking snapshot, hydrating only that page. An expired cursor (TTL, eviction,
+    or an index swap) answers 410."""
+    service = _service(app)
+    if cursor is not None:
+        try:
+            return service.page(cursor, page_size)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        except KeyError as e:
+            raise HTTPException(
+                status_code=410, detail="cursor expired — search again"
+            ) from e
+    if q is None:
+        raise HTTPException(status_code=400, detail="pass `q` or `cursor`")
+    override = build_fusion_strategy(fusion) if fusion else None
+    return await service.asearch_page(q, page_size=page_size, fusion=override)
+
+
+@app.get("/suggest", description="Title completions for a typed prefix (typeahead)")
+async def suggest(
+    q: str = Query(..., min_length=1, description="typed prefix (any script)"),
+    limit: int = Query(10, ge=1, le=50),
+) -> list[Suggestion]:
+    """From the version's `TitleIndex`: no embedding call, so it can run on every
+    keystroke."""
+    return _service(app).suggest(q, limit)
+
+
+@app.get("/facets", description="Song counts per metadata value (e.g. per raag/taal)")
+async def facets(
+    key: list[str] = Query(["raag", "taal"], description="metadata keys to count"),
+    limit: int | None = Query(None, ge=1, description="top values per key"),
+) -> dict[str, dict[str, int]]:
+    try:
+        return _service(app).facets(key, limit)
+    except KeyError as e:
+        raise HTTPException(
+            status_code=400, detail=f"metadata key not indexed: {e.args[0]}"
+        ) from e
 
 
 @app.get("/songs/{song_id}", description="Full song detail (Bengali + en + translit)")
-def get_song(song_id: str) -> SongView:
-    song = _service(app).get_song(song_id)
+async def get_song(song_id: str) -> SongView:
+    song = await _service(app).aget_song(song_id)
     if song is None:
         raise HTTPException(status_code=404, detail="song not found")
     return song
+
+
+@app.get("/songs/{song_id}/similar", description="Songs most like this one")
+async def similar_songs(
+    song_id: str, limit: int = Query(10, ge=1, le=50)
+) -> list[SearchResult]:
+    """A row of the version's precomputed `SimilarityGraph`: no embedding, no scan."""
+    similar = _service(app).similar_songs(song_id, limit)
+    if similar is None:
+        raise HTTPException(status_code=404, detail="song not found")
+    return similar
+
+
+@app.post("/admin/reload", description="Swap to the latest published index version")
+async def reload_index() -> IndexStatus:
+    reloaded = await _reload(app)
+    return IndexStatus(version=app.state.index_version, reloaded=reloaded)
+
+
+@app.get("/admin/cache", description="Hit/miss counters of the in-process caches")
+async def cache_stats() -> dict[str, CacheStats]:
+    return _cache_stats(app)
+
+
+@app.get(
+    "/metrics",
+    description="Prometheus metrics: search stage latencies, cache counters",
+    response_class=PlainTextResponse,
+)
+async def metrics() -> PlainTextResponse:
+    """Per-stage search latency histograms and event counters (`core.search.trace`),
+    plus cache and embedding-coalescer counters read at scrape time."""
+    return PlainTextResponse(
+        REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
@@ -48,3 +48,19 @@ class LocalDocumentStore(DocumentStore):
             return
         for path in sorted(directory.glob("*.json")):
             yield model.model_validate_json(path.read_text(encoding="utf-8"))
+
+    def ids(self, collection: str) -> Iterator[str]:
+        """File stems — equal to the ids for anything `_UNSAFE` leaves untouched,
+        which includes every uuid song id."""
+        directory = self.root / collection
+        if not directory.exists():
+            return
+        for path in sorted(directory.glob("*.json")):
+            yield path.stem
+
+    def stamp(self, collection: str, id: str) -> str | None:
+        try:
+            stat = self._path(collection, id).stat()
+        except FileNotFoundError:
+            return None
+        return f"{stat.st_mtime_ns}-{stat.st_size}"
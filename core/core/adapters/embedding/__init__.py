@@ -1,8 +1,12 @@
+from core.adapters.embedding.cached import CachedEmbeddingProvider
+from core.adapters.embedding.coalescing import CoalescingEmbeddingProvider
 from core.adapters.embedding.fake import FakeEmbeddingProvider
 from core.adapters.embedding.gemini import GeminiEmbeddingProvider
 from core.adapters.embedding.gemini_batch import GeminiBatchEmbeddingProvider
 
 __all__ = [
+    "CachedEmbeddingProvider",
+    "CoalescingEmbeddingProvider",
     "FakeEmbeddingProvider",
     "GeminiBatchEmbeddingProvider",
     "GeminiEmbeddingProvider",
@@ -0,0 +1,201 @@
+"""Caching EmbeddingProvider — a decorator in front of any other provider.
+
+Search queries repeat (popular songs, the same phrase retyped, paging through results),
+and each miss is a blocking round-trip to the embedding API, so query vectors are kept
+in an in-memory LRU (`core.cache.LRUCache`, bounded by entries and age) keyed by
+(model_id, task_type, normalized text). With `disk_path` set, a SQLite file backs the
+LRU: misses fall through to it before the API, and every fetched vector is written to
+it, so a restarted api starts warm. Keys include the model id, so switching models
+never serves vectors from the old space.
+
+Only the task types in `task_types` are cached (QUERY by default) — corpus texts are
+embedded once by the pipeline and persisted as records already. Texts are normalized
+(`core.cache.normalize_text`) before both keying and embedding, so a hit returns
+exactly the vector a miss would have.
+"""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+import numpy as np
+import structlog
+
+from core.cache import CacheStats, LRUCache, normalize_text
+from core.domain import TaskType
+from core.ports import EmbeddingProvider
+
+# (model_id, task_type, normalized text)
+_Key = tuple[str, str, str]
+
+# The disk tier trims itself back to its bound every this many writes, not per write.
+_DISK_TRIM_EVERY = 256
+
+
+class CachedEmbeddingProvider(EmbeddingProvider):
+    def __init__(
+        self,
+        inner: EmbeddingProvider,
+        max_entries: int = 4096,
+        ttl_seconds: float | None = None,
+        disk_path: Path | None = None,
+        disk_max_entries: int = 100_000,
+        task_types: Iterable[TaskType] = (TaskType.QUERY,),
+    ):
+        """`ttl_seconds` bounds both tiers; None keeps entries until evicted."""
+        self.inner = inner
+        self.task_types = frozenset(task_types)
+        self.memory: LRUCache[_Key, list[float]] = LRUCache(max_entries, ttl_seconds)
+        self.ttl_seconds = ttl_seconds
+        self.disk_max_entries = disk_max_entries
+        self.disk_hits = 0
+        self.logger = structlog.get_logger(__name__).bind(
+            class_name="CachedEmbeddingProvider"
+        )
+        self._disk: sqlite3.Connection | None = None
+        self._disk_lock = threading.Lock()
+        self._disk_writes = 0
+        if disk_path is not None:
+            self._disk = _open_disk(Path(disk_path))
+
+    @property
+    def model_id(self) -> str:
+        return self.inner.model_id
+
+    @property
+    def dimensions(self) -> int:
+        return self.inner.dimensions
+
+    def embed(self, texts: list[str], task_type: TaskType) -> list[list[float]]:
+        if task_type not in self.task_types:
+            return self.inner.embed(texts, task_type)
+        keys, out, missing = self._lookup(texts, task_type)
+        if missing:
+            found = self._disk_get(missing)
+            fetch = [key for key in missing if key not in found]
+            if fetch:
+                vectors = self.inner.embed([key[2] for key in fetch], task_type)
+                fetched = dict(zip(fetch, vectors, strict=True))
+                self._disk_put(fetched)
+                found.update(fetched)
+            out = self._fill(keys, out, found)
+        return out
+
+    async def aembed(self, texts: list[str], task_type: TaskType) -> list[list[float]]:
+        """`embed` with the inner provider's `aembed`; the (blocking) disk tier runs
+        on worker threads."""
+        if task_type not in self.task_types:
+            return await self.inner.aembed(texts, task_type)
+        keys, out, missing = self._lookup(texts, task_type)
+        if missing:
+            found = await asyncio.to_thread(self._disk_get, missing)
+            fetch = [key for key in missing if key not in found]
+            if fetch:
+                vectors = await self.inner.aembed([key[2] for key in fetch], task_type)
+                fetched = dict(zip(fetch, vectors, strict=True))
+                await asyncio.to_thread(self._disk_put, fetched)
+                found.update(fetched)
+            out = self._fill(keys, out, found)
+        return out
+
+    def _lookup(
+        self, texts: list[str], task_type: TaskType
+    ) -> tuple[list[_Key], list[list[float] | None], list[_Key]]:
+        """Keys per text, memory hits (None for misses), and the distinct missing
+        keys in first-seen order — a batch repeating a text embeds it once."""
+        keys = [(self.model_id, task_type.value, normalize_text(t)) for t in texts]
+        out = [self.memory.get(key) for key in keys]
+        missing = list(
+            dict.fromkeys(k for k, v in zip(keys, out, strict=True) if v is None)
+        )
+        return keys, out, missing
+
+    def _fill(
+        self,
+        keys: list[_Key],
+        out: list[list[float] | None],
+        found: dict[_Key, list[float]],
+    ) -> list[list[float]]:
+        """Remember what the disk tier / inner provider `found`; complete `out`."""
+        for key, vector in found.items():
+            self.memory.put(key, vector)
+        return [
+            v if v is not None else found[k] for k, v in zip(keys, out, strict=True)
+        ]
+
+    def stats(self) -> CacheStats:
+        """Memory-tier counters; `disk_hits` of its misses were served from disk."""
+        return self.memory.stats().model_copy(update={"disk_hits": self.disk_hits})
+
+    # --- disk tier: one row per key, vectors as float32 blobs ---
+
+    def _disk_get(self, keys: list[_Key]) -> dict[_Key, list[float]]:
+        if self._disk is None:
+            return {}
+        oldest = 0.0 if self.ttl_seconds is None else time.time() - self.ttl_seconds
+        found = {}
+        with self._disk_lock:
+            try:
+                for key in keys:
+                    row = self._disk.execute(
+                        "SELECT vector FROM embeddings WHERE model = ? AND task = ?"
+                        " AND text = ? AND created >= ?",
+                        (*key, oldest),
+                    ).fetchone()
+                    if row is not None:
+                        found[key] = np.frombuffer(row[0], dtype=np.float32).tolist()
+            except sqlite3.Error:
+                self.logger.warning("disk cache read failed", exc_info=True)
+            self.disk_hits += len(found)
+        return found
+
+    def _disk_put(self, vectors: dict[_Key, list[float]]) -> None:
+        if self._disk is None:
+            return
+        now = time.time()
+        rows = [
+            (*key, np.asarray(vector, dtype=np.float32).tobytes(), now)
+            for key, vector in vectors.items()
+        ]
+        with self._disk_lock:
+            try:
+                with self._disk:
+                    self._disk.executemany(
+                        "INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?, ?, ?)",
+                        rows,
+                    )
+                self._disk_writes += len(rows)
+                if self._disk_writes >= _DISK_TRIM_EVERY:
+                    self._disk_writes = 0
+                    self._trim_disk()
+            except sqlite3.Error:
+                # the disk tier is an optimisation; a locked or full file must not
+                # fail the query waiting on these vectors (reads degrade the same way)
+                self.logger.warning("disk cache write failed", exc_info=True)
+
+    def _trim_disk(self) -> None:
+        with self._disk:
+            self._disk.execute(
+                "DELETE FROM embeddings WHERE rowid IN (SELECT rowid FROM embeddings"
+                " ORDER BY created DESC LIMIT -1 OFFSET ?)",
+                (self.disk_max_entries,),
+            )
+
+
+def _open_disk(path: Path) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # shared by the threads of this process (guarded by `_disk_lock`) and, via WAL,
+    # by other api workers reading and writing the same file
+    conn = sqlite3.connect(path, timeout=5.0, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS embeddings ("
+        " model TEXT NOT NULL, task TEXT NOT NULL, text TEXT NOT NULL,"
+        " vector BLOB NOT NULL, created REAL NOT NULL,"
+        " PRIMARY KEY (model, task, text))"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS embeddings_created ON embeddings(created)")
+    return conn
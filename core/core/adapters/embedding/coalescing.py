@@ -0,0 +1,121 @@
+"""Coalescing EmbeddingProvider — micro-batches concurrent `aembed` calls.
+
+Under load many `/search` requests each want one query vector at about the same time.
+This wrapper parks every requested text for at most `max_wait_ms` (or until
+`max_batch` texts are waiting), sends them upstream as one `aembed` call, and resolves
+each caller's future with its vector. A text already waiting or in flight is not sent
+twice: later callers share the first caller's future. Upstream call volume (and
+rate-limit pressure) falls with concurrency, while the added latency is capped by
+`max_wait_ms`. A failed upstream call fails every caller in its batch; retrying is
+the inner provider's job.
+
+Only the async path coalesces — concurrent callers are coroutines on one event loop.
+Sync `embed` (pipeline batches, CLI) passes straight through. It sits under the
+query-embedding cache, so only cache misses are batched.
+"""
+
+import asyncio
+
+import structlog
+
+from core.domain import TaskType
+from core.ports import EmbeddingProvider
+
+
+class CoalescingEmbeddingProvider(EmbeddingProvider):
+    def __init__(
+        self, inner: EmbeddingProvider, max_batch: int = 32, max_wait_ms: float = 5.0
+    ):
+        self.inner = inner
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self.logger = structlog.get_logger(__name__).bind(
+            class_name="CoalescingEmbeddingProvider"
+        )
+        # waiting or in-flight texts, per task type: text -> its shared future
+        self._inflight: dict[tuple[TaskType, str], asyncio.Future] = {}
+        self._queued: dict[TaskType, list[str]] = {}
+        self._timers: dict[TaskType, asyncio.TimerHandle] = {}
+        self._sends: set[asyncio.Task] = set()  # strong refs until each send finishes
+        self.requested = 0  # texts asked for
+        self.merged = 0  # ... of which shared an identical waiting/in-flight text
+        self.upstream_calls = 0  # batched `aembed` calls made to the inner provider
+
+    @property
+    def model_id(self) -> str:
+        return self.inner.model_id
+
+    @property
+    def dimensions(self) -> int:
+        return self.inner.dimensions
+
+    def embed(self, texts: list[str], task_type: TaskType) -> list[list[float]]:
+        return self.inner.embed(texts, task_type)
+
+    async def aembed(self, texts: list[str], task_type: TaskType) -> list[list[float]]:
+        futures = [self._submit(text, task_type) for text in texts]
+        # shielded: a cancelled caller must not cancel a future other callers share
+        return list(await asyncio.gather(*(asyncio.shield(f) for f in futures)))
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "requested": self.requested,
+            "merged": self.merged,
+            "upstream_calls": self.upstream_calls,
+        }
+
+    def _submit(self, text: str, task_type: TaskType) -> asyncio.Future:
+        self.requested += 1
+        future = self._inflight.get((task_type, text))
+        if future is not None:
+            self.merged += 1
+            return future
+        loop = asyncio.get_running_loop()
+        future = self._inflight[(task_type, text)] = loop.create_future()
+        queued = self._queued.setdefault(task_type, [])
+        queued.append(text)
+        if len(queued) >= self.max_batch:
+            self._flush(task_type)
+        elif task_type not in self._timers:
+            self._timers[task_type] = loop.call_later(
+                self.max_wait, self._flush, task_type
+            )
+        return future
+
+    def _flush(self, task_type: TaskType) -> None:
+        timer = self._timers.pop(task_type, None)
+        if timer is not None:
+            timer.cancel()
+        texts = self._queued.pop(task_type, [])
+        if texts:
+            send = asyncio.get_running_loop().create_task(self._send(texts, task_type))
+            self._sends.add(send)
+            send.add_done_callback(self._sends.discard)
+
+    async def _send(self, texts: list[str], task_type: TaskType) -> None:
+        self.upstream_calls += 1
+        vectors: list[list[float]] = []
+        error: BaseException | None = None
+        try:
+            vectors = await self.inner.aembed(texts, task_type)
+            if len(vectors) != len(texts):
+                raise ValueError(
+                    f"embedder returned {len(vectors)} vectors for {len(texts)} texts"
+                )
+        except Exception as e:
+            # handed to every caller below; this background task itself succeeds
+            error = e
+            self.logger.warning("batched embed failed", texts=len(texts), error=str(e))
+        finally:
+            # every future is resolved, whatever happened (cancellation included):
+            # a future left in `_inflight` would hang each later caller of its text
+            if error is None and len(vectors) != len(texts):
+                error = RuntimeError("batched embed did not complete")
+            for i, text in enumerate(texts):
+                future = self._inflight.pop((task_type, text), None)
+                if future is None or future.done():
+                    continue
+                if error is None:
+                    future.set_result(vectors[i])
+                else:
+                    future.set_exception(error)
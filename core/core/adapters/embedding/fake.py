@@ -32,3 +32,6 @@ class FakeEmbeddingProvider(EmbeddingProvider):
             rng = np.random.default_rng(seed)
             out.append(rng.standard_normal(self._dims).astype(np.float32).tolist())
         return out
+
+    async def aembed(self, texts: list[str], task_type: TaskType) -> list[list[float]]:
+        return self.embed(texts, task_type)  # pure CPU, microseconds: no thread needed
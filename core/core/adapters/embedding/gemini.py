@@ -5,8 +5,14 @@ runs them **concurrently** on a thread pool, retrying transient errors. Output i
 L2-normalized downstream by the SearchBackend (001 does not normalize truncated vectors
 itself). For the one-time full corpus run prefer `GeminiBatchEmbeddingProvider` (50%
 cheaper via the Batch API).
+
+`aembed` uses the SDK's async client (`client.aio`): batches run as concurrent
+coroutines, at most `embedding_concurrency` in flight, so the api waits on the network
+without holding a thread per request.
 """
 
+import asyncio
+
 from google import genai
 from google.genai import types
 from tenacity import retry, stop_after_attempt, wait_exponential_jitter
@@ -43,22 +49,39 @@ class GeminiEmbeddingProvider(EmbeddingProvider):
     def dimensions(self) -> int:
         return self._dims
 
-    @retry(
-        stop=stop_after_attempt(5),
-        wait=wait_exponential_jitter(initial=1, max=30, jitter=2),
-    )
-    def _embed_batch(self, batch: list[str], task_type: TaskType) -> list[list[float]]:
+    def _request(self, batch: list[str], task_type: TaskType) -> dict:
         # defense-in-depth: trim each item to the safe-tokens cap before sending, so a
         # single over-length input can't fail the whole batch.
-        batch = [truncate_to_tokens(t, settings.embedding_safe_tokens) for t in batch]
-        resp = self._client.models.embed_content(
+        return dict(
             model=self._model,
-            contents=batch,
+            contents=[
+                truncate_to_tokens(t, settings.embedding_safe_tokens) for t in batch
+            ],
             config=types.EmbedContentConfig(
                 task_type=_TASK_TYPE[task_type],
                 output_dimensionality=self._dims,
             ),
         )
+
+    @retry(
+        stop=stop_after_attempt(5),
+        wait=wait_exponential_jitter(initial=1, max=30, jitter=2),
+    )
+    def _embed_batch(self, batch: list[str], task_type: TaskType) -> list[list[float]]:
+        resp = self._client.models.embed_content(**self._request(batch, task_type))
+        return [list(e.values) for e in resp.embeddings]
+
+    @retry(
+        stop=stop_after_attempt(5),
+        wait=wait_exponential_jitter(initial=1, max=30, jitter=2),
+    )
+    async def _aembed_batch(
+        self, batch: list[str], task_type: TaskType, limit: asyncio.Semaphore
+    ) -> list[list[float]]:
+        async with limit:
+            resp = await self._client.aio.models.embed_content(
+                **self._request(batch, task_type)
+            )
         return [list(e.values) for e in resp.embeddings]
 
     def embed(self, texts: list[str], task_type: TaskType) -> list[list[float]]:
@@ -76,3 +99,13 @@ class GeminiEmbeddingProvider(EmbeddingProvider):
         for batch_vectors in results:
             out.extend(batch_vectors)
         return out
+
+    async def aembed(self, texts: list[str], task_type: TaskType) -> list[list[float]]:
+        limit = asyncio.Semaphore(settings.embedding_concurrency)
+        results = await asyncio.gather(
+            *(
+                self._aembed_batch(texts[i : i + _BATCH_SIZE], task_type, limit)
+                for i in range(0, len(texts), _BATCH_SIZE)
+            )
+        )
+        return [vector for batch_vectors in results for vector in batch_vectors]
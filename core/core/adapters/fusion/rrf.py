@@ -6,8 +6,14 @@ Only ranks matter (raw scores are ignored), so signals with different score scal
 (cosine similarities vs. filter-match fractions vs. future BM25 scores) combine cleanly.
 `k = 60` is the canonical constant — it damps the long tail without overwhelming the
 top of each list. Default fusion strategy.
+
+Contributions are computed per list as one array and summed by `fuse_contributions`
+(int-coded scatter-add + partial top-k selection).
 """
 
+import numpy as np
+
+from core.adapters.fusion.scatter import fuse_contributions
 from core.ports.fusion import FusionStrategy, RankedList
 
 
@@ -19,12 +25,13 @@ class RRFFusion(FusionStrategy):
         self,
         lists: list[RankedList],
         weights: dict[str, float],
+        top_k: int | None = None,
     ) -> list[tuple[str, float]]:
-        scores: dict[str, float] = {}
+        contributions = []
         for ranked in lists:
             w = weights.get(ranked.name, 1.0)
             if w == 0:
                 continue
-            for rank, song_id in enumerate(ranked.songs, start=1):
-                scores[song_id] = scores.get(song_id, 0.0) + w / (self.k + rank)
-        return sorted(scores.items(), key=lambda kv: kv[1], reverse=True)
+            ranks = np.arange(1, len(ranked.songs) + 1, dtype=np.float64)
+            contributions.append((ranked.songs, w / (self.k + ranks)))
+        return fuse_contributions(contributions, top_k)
@@ -0,0 +1,61 @@
+"""Array kernel shared by the fusion adapters.
+
+Each adapter turns its ranked lists into per-entry contributions (`w / (k + rank)`
+for RRF, `w · score` for weighted sum); `fuse_contributions` does the rest without a
+per-song Python dict:
+
+  1. map song ids to dense int codes, in first-seen order across the lists
+  2. scatter-add every list's contributions into one score array (`np.bincount`)
+  3. pick the best `top_k` with `argpartition` and sort only those
+
+Ties are broken by first appearance, matching a stable sort over an insertion-ordered
+dict — the adapters' original (pure-Python) behaviour.
+"""
+
+from collections.abc import Iterable
+
+import numpy as np
+
+
+def fuse_contributions(
+    contributions: Iterable[tuple[list[str], np.ndarray]],
+    top_k: int | None = None,
+) -> list[tuple[str, float]]:
+    """`contributions`: (song ids, per-entry score) per list; a song listed several
+    times sums its entries. Returns `[(song_id, fused_score)]`, best first — the best
+    `top_k`, or all when None."""
+    codes: dict[str, int] = {}
+    code_parts: list[np.ndarray] = []
+    value_parts: list[np.ndarray] = []
+    for songs, values in contributions:
+        code_parts.append(
+            np.fromiter(
+                (codes.setdefault(s, len(codes)) for s in songs),
+                dtype=np.int64,
+                count=len(songs),
+            )
+        )
+        value_parts.append(np.asarray(values, dtype=np.float64))
+    if not codes:
+        return []
+    scores = np.bincount(
+        np.concatenate(code_parts),
+        weights=np.concatenate(value_parts),
+        minlength=len(codes),
+    )
+    best = _top(scores, top_k)
+    song_ids = list(codes)
+    return [(song_ids[c], float(scores[c])) for c in best.tolist()]
+
+
+def _top(scores: np.ndarray, top_k: int | None) -> np.ndarray:
+    """Codes of the `top_k` highest scores, best first, ties by lower code."""
+    candidates = np.arange(scores.size)
+    if top_k is not None and top_k < scores.size:
+        if top_k <= 0:
+            return candidates[:0]
+        kth = np.partition(scores, scores.size - top_k)[scores.size - top_k]
+        # everything tied with the k-th score stays in, so the tie-break is exact
+        candidates = np.flatnonzero(scores >= kth)
+    order = np.lexsort((candidates, -scores[candidates]))
+    return candidates[order][:top_k]
@@ -11,6 +11,9 @@ Requires `scores` populated on each RankedList — RRF doesn't, so this adapter
 strictly less flexible. Use RRF unless you have a reason.
 """
 
+import numpy as np
+
+from core.adapters.fusion.scatter import fuse_contributions
 from core.ports.fusion import FusionStrategy, RankedList
 
 
@@ -19,8 +22,9 @@ class WeightedSumFusion(FusionStrategy):
         self,
         lists: list[RankedList],
         weights: dict[str, float],
+        top_k: int | None = None,
     ) -> list[tuple[str, float]]:
-        scores: dict[str, float] = {}
+        contributions = []
         for ranked in lists:
             w = weights.get(ranked.name, 1.0)
             if w == 0:
@@ -29,6 +33,11 @@ class WeightedSumFusion(FusionStrategy):
                 raise ValueError(
                     f"WeightedSumFusion needs `scores` on RankedList '{ranked.name}'"
                 )
-            for song_id, score in zip(ranked.songs, ranked.scores, strict=True):
-                scores[song_id] = scores.get(song_id, 0.0) + w * score
-        return sorted(scores.items(), key=lambda kv: kv[1], reverse=True)
+            if len(ranked.scores) != len(ranked.songs):
+                raise ValueError(
+                    f"RankedList '{ranked.name}' has {len(ranked.songs)} songs but "
+                    f"{len(ranked.scores)} scores"
+                )
+            scores = w * np.asarray(ranked.scores, dtype=np.float64)
+            contributions.append((ranked.songs, scores))
+        return fuse_contributions(contributions, top_k)
@@ -1,3 +1,11 @@
+from core.adapters.search_backend.hnsw import HNSWSearchBackend
+from core.adapters.search_backend.ivf import IVFSearchBackend
 from core.adapters.search_backend.local import LocalSearchBackend
+from core.adapters.search_backend.sharded import ShardedSearchBackend
 
-__all__ = ["LocalSearchBackend"]
+__all__ = [
+    "HNSWSearchBackend",
+    "IVFSearchBackend",
+    "LocalSearchBackend",
+    "ShardedSearchBackend",
+]
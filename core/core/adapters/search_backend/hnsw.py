@@ -0,0 +1,340 @@
+"""HNSW SearchBackend — hierarchical navigable small-world graph, pure Python/numpy.
+
+Each row is a graph node; a sparse hierarchy of upper layers gives long-range hops and
+layer 0 links every node to its ~2·M nearest (diversity-pruned) neighbours. A query
+descends greedily from the top entry point, then runs a best-first walk on layer 0 with
+a beam of `ef_search`, scoring only the nodes it visits — sub-linear in corpus size.
+
+Build knobs are `m` (links per node; memory and recall) and `ef_construction` (beam
+while inserting; build time and graph quality). `ef_search` is the per-query recall vs.
+latency knob: set on the instance, or pass `ef_search=` to `search` / `search_many`.
+Building is a Python loop over rows (~a minute at 14k rows), which is fine offline.
+
+Field/lang restrictions (and tombstones) are honoured during the walk: filtered-out
+nodes are still traversed (so the graph stays connected) but never enter the result
+beam, and the walk keeps going until the beam holds `ef` allowed nodes. When a filter
+leaves only a small set of rows, scanning them exactly is cheaper than walking, so
+that's done instead. Rows added by `upsert` sit in the local delta segments (scanned
+exactly) until `compact()` rebuilds the graph.
+
+Built on `LocalSearchBackend` (columns, mmap persistence); the graph is stored beside
+them as `hnsw.npz`: per-node levels, the (rows, 2·M) layer-0 adjacency padded with -1,
+and a (nodes, M) adjacency plus node ids for each upper layer. Like the scan copies it
+is listed in the manifest, so a base rewritten by another backend type drops it and it
+is rebuilt.
+"""
+
+import heapq
+import math
+from collections.abc import Callable, Iterable, Sequence
+from pathlib import Path
+
+import numpy as np
+
+from core.adapters.search_backend.local import LocalSearchBackend, _Found, _no_rows
+from core.domain import Field, Hit, Lang, SongHit
+from core.files import replace_file
+
+_GRAPH_FILE = "hnsw.npz"
+
+# Filters leaving at most this many rows are scanned exactly rather than walked.
+_EXACT_SCAN_ROWS = 2048
+
+
+class HNSWSearchBackend(LocalSearchBackend):
+    def __init__(
+        self,
+        index_dir: Path,
+        m: int = 16,
+        ef_construction: int = 100,
+        ef_search: int = 64,
+        seed: int = 0,
+    ):
+        super().__init__(index_dir)
+        self.logger = self.logger.bind(class_name="HNSWSearchBackend")
+        self.m = m
+        self.ef_construction = ef_construction
+        self.ef_search = ef_search
+        self.seed = seed
+        self._levels: np.ndarray = np.empty(0, dtype=np.int8)
+        self._layer0: np.ndarray = np.empty((0, 2 * m), dtype=np.int32)
+        # upper layers, index l-1 for layer l: (node ids, (nodes, m) adjacency)
+        self._upper: list[tuple[np.ndarray, np.ndarray]] = []
+        self._upper_pos: list[dict[int, int]] = []
+        self._entry: int = -1
+
+    def _build_structures(self) -> None:
+        super()._build_structures()
+        self._build()
+
+    def search(
+        self,
+        vector: list[float],
+        top_k: int = 20,
+        fields: Iterable[Field] | None = None,
+        langs: Iterable[Lang] | None = None,
+        ef_search: int | None = None,
+    ) -> list[Hit]:
+        return self.search_many([vector], top_k, fields, langs, ef_search)[0]
+
+    def search_many(
+        self,
+        vectors: list[list[float]],
+        top_k: int = 20,
+        fields: Iterable[Field] | None = None,
+        langs: Iterable[Lang] | None = None,
+        ef_search: int | None = None,
+    ) -> list[list[Hit]]:
+        return self._search_many(vectors, top_k, fields, langs, ef_search=ef_search)
+
+    def search_songs(
+        self,
+        vector: list[float],
+        top_k: int = 20,
+        fields: Iterable[Field] | None = None,
+        langs: Iterable[Lang] | None = None,
+        ef_search: int | None = None,
+    ) -> list[SongHit]:
+        return self.search_songs_many([vector], top_k, fields, langs, ef_search)[0]
+
+    def search_songs_many(
+        self,
+        vectors: list[list[float]],
+        top_k: int = 20,
+        fields: Iterable[Field] | None = None,
+        langs: Iterable[Lang] | None = None,
+        ef_search: int | None = None,
+    ) -> list[list[SongHit]]:
+        return self._search_songs_many(
+            vectors, top_k, fields, langs, ef_search=ef_search
+        )
+
+    def _scans_exactly(self) -> bool:
+        return False
+
+    def _search_base(
+        self,
+        queries: np.ndarray,
+        mask: np.ndarray | None,
+        top_k: int,
+        ef_search: int | None = None,
+    ) -> list[_Found]:
+        if self._entry < 0:  # empty base: live rows, if any, are all in the deltas
+            return [_no_rows() for _ in queries]
+        if mask is not None:
+            allowed_rows = np.flatnonzero(mask)
+            if allowed_rows.size <= _EXACT_SCAN_ROWS:
+                return [self._exact(q, allowed_rows, top_k) for q in queries]
+        ef = max(ef_search or self.ef_search, top_k)
+        out: list[_Found] = []
+        for q in queries:
+            found = sorted(self._walk(q, ef, mask), reverse=True)[:top_k]
+            out.append(
+                (
+                    np.asarray([node for _, node in found], dtype=np.int64),
+                    np.asarray([score for score, _ in found], dtype=np.float32),
+                )
+            )
+        return out
+
+    def _exact(self, q: np.ndarray, rows: np.ndarray, top_k: int) -> _Found:
+        if rows.size == 0:
+            return _no_rows()
+        scores = self._vectors[rows] @ q
+        k = min(top_k, rows.size)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return rows[top], scores[top]
+
+    def _walk(
+        self, q: np.ndarray, ef: int, allowed: np.ndarray | None
+    ) -> list[tuple[float, int]]:
+        """Greedy descent through the upper layers, then the layer-0 beam search."""
+        entry = [self._entry]
+        for layer in range(len(self._upper), 0, -1):
+            best = self._search_layer(q, entry, 1, self._upper_neighbors(layer))
+            entry = [max(best)[1]]
+        return self._search_layer(q, entry, ef, self._layer0_neighbors, allowed)
+
+    def _layer0_neighbors(self, node: int) -> Sequence[int]:
+        row = self._layer0[node]
+        return row[row >= 0].tolist()
+
+    def _upper_neighbors(self, layer: int) -> Callable[[int], Sequence[int]]:
+        nodes_adj = self._upper[layer - 1][1]
+        pos = self._upper_pos[layer - 1]
+
+        def neighbors(node: int) -> Sequence[int]:
+            row = nodes_adj[pos[node]]
+            return row[row >= 0].tolist()
+
+        return neighbors
+
+    def _search_layer(
+        self,
+        q: np.ndarray,
+        entry: list[int],
+        ef: int,
+        neighbors_of: Callable[[int], Sequence[int]],
+        allowed: np.ndarray | None = None,
+    ) -> list[tuple[float, int]]:
+        """Best-first walk; returns up to `ef` (score, node) pairs, unordered.
+
+        `candidates` is a max-heap (negated scores) of nodes to expand; `results` a
+        min-heap of the best `ef` allowed nodes, so results[0] is the worst kept."""
+        visited = set(entry)
+        entry_scores = (self._vectors[entry] @ q).tolist()
+        candidates = [(-s, node) for s, node in zip(entry_scores, entry, strict=True)]
+        heapq.heapify(candidates)
+        results = [
+            (s, node)
+            for s, node in zip(entry_scores, entry, strict=True)
+            if allowed is None or allowed[node]
+        ]
+        heapq.heapify(results)
+        while candidates:
+            neg_score, node = heapq.heappop(candidates)
+            if len(results) >= ef and -neg_score < results[0][0]:
+                break
+            fresh = [n for n in neighbors_of(node) if n not in visited]
+            if not fresh:
+                continue
+            visited.update(fresh)
+            for s, n in zip((self._vectors[fresh] @ q).tolist(), fresh, strict=True):
+                if len(results) < ef or s > results[0][0]:
+                    heapq.heappush(candidates, (-s, n))
+                    if allowed is None or allowed[n]:
+                        heapq.heappush(results, (s, n))
+                        if len(results) > ef:
+                            heapq.heappop(results)
+        return results
+
+    # --- build ---
+
+    def _build(self) -> None:
+        n = self._vectors.shape[0]
+        if n == 0:
+            self._levels = np.empty(0, dtype=np.int8)
+            self._layer0 = np.empty((0, 2 * self.m), dtype=np.int32)
+            self._upper, self._upper_pos = [], []
+            self._entry = -1
+            return
+        rng = np.random.default_rng(self.seed)
+        level_mult = 1 / math.log(self.m)
+        levels = np.floor(-np.log(1.0 - rng.random(n)) * level_mult).astype(np.int8)
+        # while building, adjacency lives in python lists: graph[layer][node]
+        graph: list[dict[int, list[int]]] = [{} for _ in range(int(levels.max()) + 1)]
+        entry, top = 0, int(levels[0])
+        for layer in range(top + 1):
+            graph[layer][0] = []
+
+        for node in range(1, n):
+            q = self._vectors[node]
+            node_level = int(levels[node])
+            nearest = [entry]
+            for layer in range(top, node_level, -1):
+                best = self._search_layer(q, nearest, 1, graph[layer].__getitem__)
+                nearest = [max(best)[1]]
+            for layer in range(min(top, node_level), -1, -1):
+                found = self._search_layer(
+                    q, nearest, self.ef_construction, graph[layer].__getitem__
+                )
+                cap = 2 * self.m if layer == 0 else self.m
+                links = self._select(q, [n for _, n in found], self.m)
+                graph[layer][node] = links
+                for other in links:
+                    adj = graph[layer][other]
+                    adj.append(node)
+                    if len(adj) > cap:
+                        graph[layer][other] = self._select(
+                            self._vectors[other], adj, cap
+                        )
+                nearest = [n for _, n in found]
+            for layer in range(top + 1, node_level + 1):
+                graph[layer][node] = []
+            if node_level > top:
+                entry, top = node, node_level
+            if node % 2000 == 0:
+                self.logger.info("building", nodes=node, total=n)
+
+        self._levels = levels
+        self._entry = entry
+        self._layer0 = _pack(range(n), graph[0], 2 * self.m)
+        self._upper = []
+        for layer in range(1, top + 1):
+            nodes = np.asarray(sorted(graph[layer]), dtype=np.int32)
+            self._upper.append((nodes, _pack(nodes, graph[layer], self.m)))
+        self._refresh_upper_pos()
+        self.logger.info("built", rows=n, layers=top + 1, m=self.m)
+
+    def _select(self, q: np.ndarray, candidates: list[int], cap: int) -> list[int]:
+        """Diversity heuristic: keep a candidate only if it is closer to `q` than to
+        every neighbour already kept, so links spread across directions instead of
+        piling into one cluster. Tops up with the nearest leftovers if short."""
+        candidates = list(dict.fromkeys(candidates))
+        vectors = self._vectors[candidates]
+        to_q = vectors @ q
+        order = np.argsort(-to_q)
+        pairwise = vectors @ vectors.T
+        kept: list[int] = []
+        skipped: list[int] = []
+        for i in order.tolist():
+            if len(kept) >= cap:
+                break
+            if all(pairwise[i, j] < to_q[i] for j in kept):
+                kept.append(i)
+            else:
+                skipped.append(i)
+        kept.extend(skipped[: cap - len(kept)])
+        return [candidates[i] for i in kept]
+
+    def _refresh_upper_pos(self) -> None:
+        self._upper_pos = [
+            {node: i for i, node in enumerate(nodes.tolist())}
+            for nodes, _ in self._upper
+        ]
+
+    # --- persistence: the local columns plus hnsw.npz ---
+
+    def _save_structures(self) -> list[str]:
+        written = super()._save_structures()
+        arrays = {
+            "levels": self._levels,
+            "layer0": self._layer0,
+            "entry": np.asarray(self._entry, dtype=np.int64),
+        }
+        for layer, (nodes, adj) in enumerate(self._upper, start=1):
+            arrays[f"nodes{layer}"] = nodes
+            arrays[f"adj{layer}"] = adj
+        replace_file(self.dir / _GRAPH_FILE, lambda f: np.savez(f, **arrays))
+        return [*written, _GRAPH_FILE]
+
+    def _load_structures(self) -> None:
+        super()._load_structures()
+        if not self._stored(_GRAPH_FILE):
+            self.logger.warning("index has no HNSW graph for this base — building now")
+            self._build()
+            self._structures_dirty = True
+            return
+        with np.load(self.dir / _GRAPH_FILE) as graph:
+            self._levels = graph["levels"]
+            self._layer0 = graph["layer0"]
+            self._entry = int(graph["entry"])
+            top = int(self._levels.max()) if self._levels.size else 0
+            self._upper = [
+                (graph[f"nodes{layer}"], graph[f"adj{layer}"])
+                for layer in range(1, top + 1)
+            ]
+        self._refresh_upper_pos()
+
+
+def _pack(
+    nodes: Iterable[int], adjacency: dict[int, list[int]], width: int
+) -> np.ndarray:
+    """Python adjacency lists -> (len(nodes), width) int32 array padded with -1."""
+    nodes = list(nodes)
+    packed = np.full((len(nodes), width), -1, dtype=np.int32)
+    for i, node in enumerate(nodes):
+        links = adjacency[node][:width]
+        packed[i, : len(links)] = links
+    return packed
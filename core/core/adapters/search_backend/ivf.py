@@ -0,0 +1,162 @@
+"""IVF (inverted-file) SearchBackend — k-means partitioned approximate search.
+
+`index()` trains spherical k-means centroids over the normalized rows and files every
+row under its nearest centroid; a query scores the centroids, then scans only the rows
+in its `nprobe` best lists. Cost per query is ~`nlist + nprobe * rows / nlist` dot
+products instead of `rows`, which is what keeps multi-domain corpora interactive.
+
+Built on `LocalSearchBackend`: the columnar rows, mmap persistence, and field/lang
+codes are shared, and the IVF structure is three extra files in the same index dir,
+listed in its manifest like the scan copies (so a base rewritten by another backend
+type drops them, and they are retrained):
+
+    ivf_centroids.npy   float32 (nlist, dims), L2-normalized
+    ivf_offsets.npy     int64   (nlist + 1) — list l is rows[offsets[l]:offsets[l+1]]
+    ivf_rows.npy        int32   row ids grouped by list
+
+Field/lang restrictions and tombstones are applied to the rows of each probed list. A
+restrictive filter can leave fewer than `top_k` candidates in `nprobe` lists, so
+probing continues down the centroid ranking until `top_k` candidates are found or every
+list is scanned.
+Rows within the probed lists are scored exactly at float32 (no quantized scan). Rows
+added by `upsert` live in the local delta segments, scanned exactly, until `compact()`
+retrains the lists over everything.
+"""
+
+from pathlib import Path
+
+import numpy as np
+
+from core.adapters.search_backend.local import (
+    LocalSearchBackend,
+    _Found,
+    _no_rows,
+    _normalize,
+)
+from core.files import write_array
+
+_CENTROIDS_FILE = "ivf_centroids.npy"
+_OFFSETS_FILE = "ivf_offsets.npy"
+_ROWS_FILE = "ivf_rows.npy"
+
+# Rows assigned per step while training — bounds the (block, nlist) score matrix.
+_ASSIGN_BLOCK = 8192
+
+
+class IVFSearchBackend(LocalSearchBackend):
+    def __init__(
+        self,
+        index_dir: Path,
+        nlist: int = 0,
+        nprobe: int = 8,
+        train_iterations: int = 10,
+        seed: int = 0,
+    ):
+        """`nlist=0` picks ~4·sqrt(rows) lists at index time."""
+        super().__init__(index_dir)
+        self.logger = self.logger.bind(class_name="IVFSearchBackend")
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.train_iterations = train_iterations
+        self.seed = seed
+        self._centroids: np.ndarray = np.empty((0, 0), dtype=np.float32)
+        self._offsets: np.ndarray = np.zeros(1, dtype=np.int64)
+        self._list_rows: np.ndarray = np.empty(0, dtype=np.int32)
+
+    def _build_structures(self) -> None:
+        super()._build_structures()
+        self._train()
+
+    def _scans_exactly(self) -> bool:
+        return False
+
+    def _search_base(
+        self, queries: np.ndarray, mask: np.ndarray | None, top_k: int
+    ) -> list[_Found]:
+        list_order = np.argsort(-(queries @ self._centroids.T), axis=1)
+        return [
+            self._search_lists(q, order, top_k, mask)
+            for q, order in zip(queries, list_order, strict=True)
+        ]
+
+    def _search_lists(
+        self, q: np.ndarray, list_order: np.ndarray, top_k: int, mask: np.ndarray | None
+    ) -> _Found:
+        """Scan lists best-centroid first: at least `nprobe`, more if the filters left
+        fewer than `top_k` candidates."""
+        parts: list[np.ndarray] = []
+        found = 0
+        for probed, lst in enumerate(list_order, start=1):
+            rows = self._list_rows[self._offsets[lst] : self._offsets[lst + 1]]
+            if mask is not None:
+                rows = rows[mask[rows]]
+            parts.append(rows)
+            found += rows.size
+            if probed >= self.nprobe and found >= top_k:
+                break
+        rows = np.concatenate(parts) if parts else np.empty(0, dtype=np.int32)
+        if rows.size == 0:
+            return _no_rows()
+        scores = self._vectors[rows] @ q
+        k = min(top_k, rows.size)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return rows[top], scores[top]
+
+    def _train(self) -> None:
+        """Spherical k-means (cosine) over the normalized rows, then bucket rows."""
+        n = self._vectors.shape[0]
+        if n == 0:  # an emptied base: no lists, so searches only see the deltas
+            self._centroids = np.empty((0, self._vectors.shape[1]), dtype=np.float32)
+            self._offsets = np.zeros(1, dtype=np.int64)
+            self._list_rows = np.empty(0, dtype=np.int32)
+            return
+        nlist = self.nlist or max(1, int(4 * np.sqrt(n)))
+        nlist = min(nlist, n)
+        rng = np.random.default_rng(self.seed)
+        centroids = np.array(self._vectors[rng.choice(n, size=nlist, replace=False)])
+        for _ in range(self.train_iterations):
+            assign = self._assign(centroids)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assign, self._vectors)
+            counts = np.bincount(assign, minlength=nlist)
+            empty = np.flatnonzero(counts == 0)
+            # reseed empty lists with random rows so every centroid stays useful
+            sums[empty] = self._vectors[rng.choice(n, size=empty.size)]
+            centroids = _normalize(sums)
+        assign = self._assign(centroids)
+        self._centroids = centroids.astype(np.float32)
+        self._list_rows = np.argsort(assign, kind="stable").astype(np.int32)
+        self._offsets = np.concatenate(
+            [[0], np.cumsum(np.bincount(assign, minlength=nlist))]
+        ).astype(np.int64)
+        self.logger.info("trained", nlist=nlist, rows=n)
+
+    def _assign(self, centroids: np.ndarray) -> np.ndarray:
+        assign = np.empty(self._vectors.shape[0], dtype=np.int64)
+        for start in range(0, self._vectors.shape[0], _ASSIGN_BLOCK):
+            block = self._vectors[start : start + _ASSIGN_BLOCK]
+            assign[start : start + _ASSIGN_BLOCK] = np.argmax(
+                block @ centroids.T, axis=1
+            )
+        return assign
+
+    # --- persistence: the local columns plus the three IVF files ---
+
+    def _save_structures(self) -> list[str]:
+        written = super()._save_structures()
+        write_array(self.dir / _CENTROIDS_FILE, self._centroids)
+        write_array(self.dir / _OFFSETS_FILE, self._offsets)
+        write_array(self.dir / _ROWS_FILE, self._list_rows)
+        return [*written, _CENTROIDS_FILE, _OFFSETS_FILE, _ROWS_FILE]
+
+    def _load_structures(self) -> None:
+        super()._load_structures()
+        if not self._stored(_CENTROIDS_FILE):
+            self.logger.warning("index has no IVF lists for this base — training now")
+            self._train()
+            self._structures_dirty = True
+            return
+        self._centroids = np.load(self.dir / _CENTROIDS_FILE)
+        self._offsets = np.load(self.dir / _OFFSETS_FILE)
+        self._list_rows = np.load(self.dir / _ROWS_FILE)
@@ -6,20 +6,50 @@ mmap-load it at startup. Swap for Typesense/Turbopuffer behind the same port lat
 
 Vectors are L2-normalized on index and query, so cosine similarity == dot product.
 (gemini-embedding-001 does not auto-normalize truncated outputs, so we do it here.)
+
+Rows are stored columnar, one file per column (see `save`), with the base sorted into
+(field, lang) partitions so a filtered query scans only its slices. `upsert` and
+`delete` add delta segments and tombstones until `compact()` folds them into a new
+base. The base can be scanned through a reduced copy — quantized and/or a Matryoshka
+prefix — with the shortlist rescored at float32 (see `__init__`).
 """
 
 import json
 from collections.abc import Iterable
 from pathlib import Path
+from typing import Literal
 
 import numpy as np
 import structlog
 
-from core.domain import Embedding, Field, Hit, Lang
+from core.domain import Embedding, Field, Hit, Lang, SongHit
+from core.files import write_array, write_json
 from core.ports import SearchBackend
 
+Quantization = Literal["none", "float16", "int8"]
+
+_FORMAT_VERSION = 3
+_READABLE_FORMATS = {2, 3}
+_MANIFEST_FILE = "manifest.json"
 _VECTORS_FILE = "vectors.npy"
-_META_FILE = "meta.json"
+_DELTA_FILE = "delta-{:04d}.npy"
+_SONG_CODES_FILE = "song_codes.npy"
+_FIELDS_FILE = "fields.npy"
+_LANGS_FILE = "langs.npy"
+_CHUNKS_FILE = "chunk_index.npy"
+_TOMBSTONES_FILE = "tombstones.npy"
+_SONG_IDS_FILE = "song_ids.json"
+_LEGACY_META_FILE = "meta.json"  # v1: one dict per row
+_F16_FILE = "vectors.f16.npy"
+_I8_FILE = "vectors.i8.npy"
+_I8_SCALE_FILE = "i8_scale.npy"
+_PREFIX_TAG = ".p{}"  # inserted before the suffix of scan-copy files for prefix scans
+
+# Rows upcast to float32 per step of a quantized scan — bounds the temporary copy.
+_SCAN_BLOCK = 4096
+
+# One query's candidates: (row ids, scores), sorted by descending score.
+_Found = tuple[np.ndarray, np.ndarray]
 
 
 def _normalize(matrix: np.ndarray) -> np.ndarray:
@@ -28,38 +58,219 @@ def _normalize(matrix: np.ndarray) -> np.ndarray:
     return matrix / norms
 
 
+def _top_k(scores: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+    """Row-wise top-k of a (queries, candidates) matrix: (indices, scores), sorted
+    descending."""
+    top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    top_scores = np.take_along_axis(scores, top, axis=1)
+    order = np.argsort(-top_scores, axis=1)
+    return (
+        np.take_along_axis(top, order, axis=1),
+        np.take_along_axis(top_scores, order, axis=1),
+    )
+
+
+def _no_rows() -> _Found:
+    return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+
 class LocalSearchBackend(SearchBackend):
-    def __init__(self, index_dir: Path):
+    def __init__(
+        self,
+        index_dir: Path,
+        quantization: Quantization = "none",
+        rescore_factor: int = 4,
+        prefix_dims: int = 0,
+    ):
+        """`prefix_dims=0` scans full vectors; `rescore_factor` sizes the shortlist
+        (`top_k * rescore_factor`) of any reduced scan — quantized and/or prefix.
+
+        `quantization="float16" | "int8"`: a compact copy of the base matrix
+        (`vectors.f16.npy`, or `vectors.i8.npy` + per-dimension `i8_scale.npy`) is
+        scanned for the shortlist, which is then rescored exactly against the float32
+        rows. Only the compact copy is touched on every query, so the float32 matrix
+        stays mostly on disk behind the mmap — resident memory for the scan drops 2x /
+        4x. numpy has no low-precision BLAS, so every query upcasts the copy block by
+        block: the scan trades latency for memory (float16 ran ~6x slower than float32
+        on the test data; see `pipeline.cli bench`).
+
+        `prefix_dims=128 | 256 | ...`: gemini-embedding-001 vectors are
+        Matryoshka-trained, so the first `prefix_dims` components are themselves a valid
+        (lower-fidelity) embedding. The scan copy then holds only those components,
+        normalized on their own, and the shortlist is rescored at full dimensionality
+        exactly as above — a 128-dim prefix cuts the per-query scan ~6x for a small
+        recall cost, recovered by a larger `rescore_factor`. Combines with quantization
+        (an int8 prefix is 24x smaller than the float32 rows). Files:
+        `vectors.p{dims}.npy` / `.f16.npy` / `.i8.npy`."""
         self.dir = Path(index_dir)
+        self.quantization = quantization
+        self.rescore_factor = rescore_factor
+        self.prefix_dims = prefix_dims
         self.logger = structlog.get_logger(__name__).bind(
             class_name="LocalSearchBackend"
         )
-        self._vectors: np.ndarray = np.empty((0, 0), dtype=np.float32)
-        self._meta: list[
-            dict
-        ] = []  # parallel to rows: song_id, field, lang, chunk_index
-        self._fields: np.ndarray = np.empty(0, dtype=object)
-        self._langs: np.ndarray = np.empty(0, dtype=object)
+        self._vectors: np.ndarray = np.empty((0, 0), dtype=np.float32)  # base rows
+        self._delta: np.ndarray = np.empty((0, 0), dtype=np.float32)  # appended rows
+        self._delta_files: list[tuple[str, int]] = []  # persisted (file, rows)
+        self._base_dirty = False  # base rewritten since the last save/load
+        # derived-structure files (scan copy, ANN files) saved for the current base,
+        # as listed in manifest.json; anything else in the dir is stale
+        self._structure_files: list[str] = []
+        self._structures_dirty = False  # derived since the last save/load
+        # columns parallel to base + delta rows; codes index into the tables below
+        self._song_codes: np.ndarray = np.empty(0, dtype=np.int32)
+        self._fields: np.ndarray = np.empty(0, dtype=np.uint8)
+        self._langs: np.ndarray = np.empty(0, dtype=np.uint8)
+        self._chunks: np.ndarray = np.empty(0, dtype=np.int16)
+        self._live: np.ndarray = np.empty(0, dtype=bool)  # False = tombstoned
+        self._song_ids: list[str] = []
+        self._song_lookup: dict[str, int] = {}
+        self._field_table: list[Field] = list(Field)
+        self._lang_table: list[Lang] = list(Lang)
+        # reduced scan copy of the base (None when scanning the float32 rows as-is)
+        self._scan: np.ndarray | None = None
+        self._scale: np.ndarray | None = None  # int8 only: per-dimension step
+        # base (field, lang) code pair -> its contiguous row range; None if unsorted
+        self._partitions: dict[tuple[int, int], tuple[int, int]] | None = {}
+        # rows grouped by song, derived lazily for song-level search (see _song_groups)
+        self._groups: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None
+        self._generation = 0  # bumped on every change to the searchable rows
 
     def index(self, embeddings: Iterable[Embedding]) -> None:
+        self._song_ids, self._song_lookup = [], {}
+        vectors, song_codes, fields, langs, chunks = self._columns(embeddings)
+        self._set_base(vectors, song_codes, fields, langs, chunks)
+        self.logger.info("indexed", rows=len(chunks), dims=self._vectors.shape[1])
+
+    # --- incremental updates ---
+
+    def upsert(self, song_id: str, embeddings: Iterable[Embedding]) -> None:
+        """Replace one song's rows: tombstone the old ones, append the new ones."""
+        self.delete(song_id)
+        vectors, song_codes, fields, langs, chunks = self._columns(embeddings)
+        if not chunks.size:
+            return
+        if self._vectors.shape[1] == 0:  # first rows ever: nothing to append to
+            self._set_base(vectors, song_codes, fields, langs, chunks)
+            return
+        if self._delta.shape[0] == 0:
+            self._delta = np.empty((0, self._vectors.shape[1]), dtype=np.float32)
+        self._delta = np.concatenate([self._delta, vectors])
+        self._song_codes = np.concatenate([self._song_codes, song_codes])
+        self._fields = np.concatenate([self._fields, fields])
+        self._langs = np.concatenate([self._langs, langs])
+        self._chunks = np.concatenate([self._chunks, chunks])
+        self._live = np.concatenate([self._live, np.ones(chunks.size, dtype=bool)])
+        self._groups = None
+        self._generation += 1
+
+    def delete(self, song_id: str) -> None:
+        """Tombstone every live row of `song_id` (no-op for unknown songs)."""
+        code = self._song_lookup.get(song_id)
+        if code is not None:
+            self._live[self._song_codes == code] = False
+            self._generation += 1
+
+    def compact(self) -> None:
+        """Fold live base + delta rows into a new base; drops tombstones and deltas
+        and rebuilds the scan copy / ANN structures. Worth it once they pile up."""
+        live = np.flatnonzero(self._live)
+        n_base = self._vectors.shape[0]
+        base_rows, delta_rows = live[live < n_base], live[live >= n_base] - n_base
+        vectors = np.concatenate([self._vectors[base_rows], self._delta[delta_rows]])
+        kept_songs, song_codes = np.unique(self._song_codes[live], return_inverse=True)
+        self._song_ids = [self._song_ids[c] for c in kept_songs.tolist()]
+        self._song_lookup = {sid: i for i, sid in enumerate(self._song_ids)}
+        self._set_base(
+            vectors,
+            song_codes.astype(np.int32),
+            self._fields[live],
+            self._langs[live],
+            self._chunks[live],
+        )
+        self.logger.info("compacted", rows=live.size)
+
+    @property
+    def version(self) -> str:
+        return f"{self.dir.name}/{self._generation}"
+
+    @property
+    def rows(self) -> int:
+        """Rows held, base + delta, tombstoned ones included."""
+        return self._live.size
+
+    @property
+    def dead_fraction(self) -> float:
+        """Share of rows that are tombstoned or sit in delta segments."""
+        rows = self._live.size
+        if rows == 0:
+            return 0.0
+        dead = rows - int(np.count_nonzero(self._live))
+        return (dead + self._delta.shape[0]) / rows
+
+    def _columns(self, embeddings: Iterable[Embedding]) -> tuple[np.ndarray, ...]:
+        """Embeddings -> (normalized vectors, song codes, fields, langs, chunks), with
+        new song ids appended to the string table."""
         vectors: list[list[float]] = []
-        meta: list[dict] = []
+        song_codes: list[int] = []
+        fields: list[int] = []
+        langs: list[int] = []
+        chunks: list[int] = []
+        field_lookup = {f: i for i, f in enumerate(self._field_table)}
+        lang_lookup = {lang: i for i, lang in enumerate(self._lang_table)}
         for e in embeddings:
             if e.vector is None:
                 raise ValueError(f"embedding {e.id} has no vector")
             vectors.append(e.vector)
-            meta.append(
-                {
-                    "song_id": e.song_id,
-                    "field": e.field.value,
-                    "lang": e.lang.value,
-                    "chunk_index": e.chunk_index,
-                }
-            )
-        self._vectors = _normalize(np.asarray(vectors, dtype=np.float32))
-        self._meta = meta
-        self._refresh_masks()
-        self.logger.info("indexed", rows=len(meta), dims=self._vectors.shape[1])
+            code = self._song_lookup.get(e.song_id)
+            if code is None:
+                code = self._song_lookup[e.song_id] = len(self._song_ids)
+                self._song_ids.append(e.song_id)
+            song_codes.append(code)
+            fields.append(field_lookup[e.field])
+            langs.append(lang_lookup[e.lang])
+            chunks.append(e.chunk_index)
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if matrix.ndim != 2:  # no embeddings at all
+            matrix = matrix.reshape(0, self._vectors.shape[1])
+        return (
+            _normalize(matrix),
+            np.asarray(song_codes, dtype=np.int32),
+            np.asarray(fields, dtype=np.uint8),
+            np.asarray(langs, dtype=np.uint8),
+            np.asarray(chunks, dtype=np.int16),
+        )
+
+    def _set_base(
+        self,
+        vectors: np.ndarray,
+        song_codes: np.ndarray,
+        fields: np.ndarray,
+        langs: np.ndarray,
+        chunks: np.ndarray,
+    ) -> None:
+        """Install `vectors` as the whole index (no deltas, nothing tombstoned), with
+        rows sorted into (field, lang) partitions, by song within each."""
+        order = np.lexsort((chunks, song_codes, langs, fields))
+        self._vectors = vectors[order]
+        self._delta = np.empty((0, vectors.shape[1]), dtype=np.float32)
+        self._delta_files = []
+        self._song_codes = song_codes[order]
+        self._fields = fields[order]
+        self._langs = langs[order]
+        self._chunks = chunks[order]
+        self._live = np.ones(chunks.size, dtype=bool)
+        self._groups = None
+        self._generation += 1
+        self._partition()
+        self._base_dirty = True
+        self._build_structures()
+
+    def _build_structures(self) -> None:
+        """Derive the base's search structures. Subclasses add ANN structures."""
+        self._build_scan()
+
+    # --- search ---
 
     def search(
         self,
@@ -68,50 +279,548 @@ class LocalSearchBackend(SearchBackend):
         fields: Iterable[Field] | None = None,
         langs: Iterable[Lang] | None = None,
     ) -> list[Hit]:
-        if self._vectors.shape[0] == 0:
+        return self.search_many([vector], top_k, fields, langs)[0]
+
+    def search_many(
+        self,
+        vectors: list[list[float]],
+        top_k: int = 20,
+        fields: Iterable[Field] | None = None,
+        langs: Iterable[Lang] | None = None,
+    ) -> list[list[Hit]]:
+        """One matrix-matrix product for the whole batch, then a row-wise top-k."""
+        return self._search_many(vectors, top_k, fields, langs)
+
+    def _search_many(
+        self,
+        vectors: list[list[float]],
+        top_k: int,
+        fields: Iterable[Field] | None,
+        langs: Iterable[Lang] | None,
+        **base_options,
+    ) -> list[list[Hit]]:
+        if not vectors:
+            return []
+        if self._live.size == 0:
+            return [[] for _ in vectors]
+        queries = _normalize(np.asarray(vectors, dtype=np.float32))
+        found = self._search_rows(
+            queries, self._allowed(fields, langs), top_k, **base_options
+        )
+        return [
+            [
+                self._hit(row, float(score))
+                for row, score in zip(rows, scores, strict=True)
+            ]
+            for rows, scores in found
+        ]
+
+    def _search_rows(
+        self, queries: np.ndarray, mask: np.ndarray | None, top_k: int, **base_options
+    ) -> list[_Found]:
+        """Search the base with `_search_base` (overridden by ANN subclasses, which
+        receive `base_options`), scan the deltas exactly, and merge."""
+        n_base = self._vectors.shape[0]
+        found = self._search_base(
+            queries, None if mask is None else mask[:n_base], top_k, **base_options
+        )
+        if self._delta.shape[0]:
+            delta_rows = (
+                np.arange(self._delta.shape[0])
+                if mask is None
+                else np.flatnonzero(mask[n_base:])
+            )
+            if delta_rows.size:
+                delta_scores = queries @ self._delta[delta_rows].T
+                found = [
+                    self._merge(base, (delta_rows + n_base, scores), top_k)
+                    for base, scores in zip(found, delta_scores, strict=True)
+                ]
+        return found
+
+    # --- song-level search: reduce to each song's best chunk before the top_k cut ---
+
+    def search_songs_many(
+        self,
+        vectors: list[list[float]],
+        top_k: int = 20,
+        fields: Iterable[Field] | None = None,
+        langs: Iterable[Lang] | None = None,
+    ) -> list[list[SongHit]]:
+        """Max-reduce row scores per song (`np.maximum.reduceat` over song-contiguous
+        rows), then take the top_k songs — no chunk over-fetch, so a song with many
+        strong chunks can't crowd others out."""
+        return self._search_songs_many(vectors, top_k, fields, langs)
+
+    def _search_songs_many(
+        self,
+        vectors: list[list[float]],
+        top_k: int,
+        fields: Iterable[Field] | None,
+        langs: Iterable[Lang] | None,
+        **base_options,
+    ) -> list[list[SongHit]]:
+        """Exact scans score every row in one product. Reduced (quantized / prefix)
+        and ANN scans first shortlist `top_k * rescore_factor` rows, then score every
+        row of the shortlisted songs exactly, so each song's max is still exact."""
+        if not vectors:
             return []
-        q = np.asarray(vector, dtype=np.float32)
-        q = q / (np.linalg.norm(q) or 1.0)
-        scores = self._vectors @ q  # cosine, since both normalized
-
-        mask = np.ones(scores.shape[0], dtype=bool)
-        if fields is not None:
-            mask &= np.isin(self._fields, [f.value for f in fields])
-        if langs is not None:
-            mask &= np.isin(self._langs, [lang.value for lang in langs])
-        candidate_idx = np.flatnonzero(mask)
-        if candidate_idx.size == 0:
+        if self._live.size == 0:
+            return [[] for _ in vectors]
+        queries = _normalize(np.asarray(vectors, dtype=np.float32))
+        mask = self._allowed(fields, langs)
+        order, starts, group_of = self._song_groups()
+
+        if self._scans_exactly():
+            n_base = self._vectors.shape[0]
+            scores = np.full((queries.shape[0], self._live.size), -np.inf, np.float32)
+            rows, base_scores = self._scan_base(
+                queries, None if mask is None else mask[:n_base]
+            )
+            scores[:, rows] = base_scores
+            if self._delta.shape[0]:
+                scores[:, n_base:] = queries @ self._delta.T
+            if mask is not None:
+                scores[:, ~mask] = -np.inf
+            return [
+                self._best_songs(row_scores[order], order, starts, top_k)
+                for row_scores in scores
+            ]
+
+        ends = np.append(starts[1:], order.size)
+        shortlists = self._search_rows(
+            queries, mask, top_k * self.rescore_factor, **base_options
+        )
+        out: list[list[SongHit]] = []
+        for q, (rows, _) in zip(queries, shortlists, strict=True):
+            groups = group_of[np.unique(self._song_codes[rows])]
+            if groups.size == 0:
+                out.append([])
+                continue
+            sizes = ends[groups] - starts[groups]
+            song_rows = np.concatenate(
+                [order[s:e] for s, e in zip(starts[groups], ends[groups], strict=True)]
+            )
+            row_scores = self._row_vectors(song_rows) @ q
+            if mask is not None:
+                row_scores[~mask[song_rows]] = -np.inf
+            sub_starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+            out.append(self._best_songs(row_scores, song_rows, sub_starts, top_k))
+        return out
+
+    def _best_songs(
+        self, scores: np.ndarray, rows: np.ndarray, starts: np.ndarray, top_k: int
+    ) -> list[SongHit]:
+        """`scores` of `rows`, grouped by song at `starts` (-inf = not allowed) -> the
+        top_k songs with their matched (field, lang) pairs."""
+        best = np.maximum.reduceat(scores, starts)
+        k = min(top_k, int(np.count_nonzero(best > -np.inf)))
+        if k == 0:
             return []
+        top, top_scores = _top_k(best[None, :], k)
+        top, top_scores = top[0], top_scores[0]
+        cutoff = top_scores[-1]
+        ends = np.append(starts[1:], rows.size)
+        hits: list[SongHit] = []
+        for group, score in zip(top.tolist(), top_scores.tolist(), strict=True):
+            group_rows = rows[starts[group] : ends[group]]
+            group_scores = scores[starts[group] : ends[group]]
+            matched: list[tuple[Field, Lang]] = []
+            for i in np.argsort(-group_scores, kind="stable"):
+                if group_scores[i] < cutoff:
+                    break
+                row = group_rows[i]
+                pair = (
+                    self._field_table[self._fields[row]],
+                    self._lang_table[self._langs[row]],
+                )
+                if pair not in matched:
+                    matched.append(pair)
+            hits.append(
+                SongHit(
+                    song_id=self._song_ids[self._song_codes[group_rows[0]]],
+                    score=score,
+                    matched=matched,
+                )
+            )
+        return hits
+
+    def _song_groups(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(rows ordered by song, start of each song's run in that order, song code ->
+        run index). Built once per change to the rows."""
+        if self._groups is None:
+            order = np.argsort(self._song_codes, kind="stable")
+            codes = self._song_codes[order]
+            starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+            group_of = np.full(len(self._song_ids), -1, dtype=np.int64)
+            group_of[codes[starts]] = np.arange(starts.size)
+            self._groups = order, starts, group_of
+        return self._groups
+
+    def _scans_exactly(self) -> bool:
+        """Whether `_search_base` scores every allowed base row at float32. ANN
+        subclasses return False."""
+        return self._scan is None
 
-        cand_scores = scores[candidate_idx]
-        k = min(top_k, candidate_idx.size)
-        top = candidate_idx[np.argpartition(-cand_scores, k - 1)[:k]]
-        top = top[np.argsort(-scores[top])]
+    def _row_vectors(self, rows: np.ndarray) -> np.ndarray:
+        """float32 vectors of base + delta `rows`."""
+        n_base = self._vectors.shape[0]
+        in_base = rows < n_base
+        if in_base.all():
+            return np.asarray(self._vectors[rows])
+        out = np.empty((rows.size, self._vectors.shape[1]), dtype=np.float32)
+        out[in_base] = self._vectors[rows[in_base]]
+        out[~in_base] = self._delta[rows[~in_base] - n_base]
+        return out
+
+    def _search_base(
+        self, queries: np.ndarray, mask: np.ndarray | None, top_k: int
+    ) -> list[_Found]:
+        """Exact (or reduced scan + rescored) top-k over the base rows `mask` allows."""
+        rows, scores = self._scan_base(queries, mask)
+        allowed = rows.size if mask is None else int(np.count_nonzero(mask[rows]))
+        k = min(top_k, allowed)
+        if k == 0:
+            return [_no_rows() for _ in queries]
+        if self._scan is None:
+            top, top_scores = _top_k(scores, k)  # cosine
+        else:
+            shortlist, _ = _top_k(scores, min(k * self.rescore_factor, allowed))
+            exact = np.einsum("qmd,qd->qm", self._vectors[rows[shortlist]], queries)
+            top, top_scores = _top_k(exact, k)
+            top = np.take_along_axis(shortlist, top, axis=1)
+        return list(zip(rows[top], top_scores, strict=True))
+
+    def _scan_base(
+        self, queries: np.ndarray, mask: np.ndarray | None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """(row ids, (queries, rows) scores) over the base partitions `mask` touches,
+        from the reduced scan copy if there is one (float32 rows otherwise). Rows the
+        mask rejects inside those partitions (tombstones) score -inf."""
+        matrix = self._vectors if self._scan is None else self._scan
+        q = queries
+        if self._scan is not None:
+            if self._scan_dims() < queries.shape[1]:
+                q = _normalize(queries[:, : self._scan_dims()])
+            # int8 codes decode as codes * scale, so fold the scale into the query
+            if self._scale is not None:
+                q = q * self._scale
+        pieces = self._base_pieces(mask, upcast=matrix.dtype != np.float32)
+        ids = [
+            np.arange(p.start, p.stop) if isinstance(p, slice) else p for p in pieces
+        ]
+        if not ids:
+            return np.empty(0, dtype=np.int64), np.empty((q.shape[0], 0), np.float32)
+        parts = [q @ np.asarray(matrix[piece], dtype=np.float32).T for piece in pieces]
+        rows = ids[0] if len(ids) == 1 else np.concatenate(ids)
+        scores = parts[0] if len(parts) == 1 else np.concatenate(parts, axis=1)
+        if mask is not None:
+            scores[:, ~mask[rows]] = -np.inf
+        return rows, scores
+
+    def _base_pieces(
+        self, mask: np.ndarray | None, upcast: bool
+    ) -> list[slice | np.ndarray]:
+        """The base rows to scan: contiguous slices of the (field, lang) partitions
+        `mask` touches — views, no copy — cut into `_SCAN_BLOCK` steps when the scan
+        copy has to be upcast. A base that isn't partitioned (saved before rows were
+        grouped) falls back to gathering the allowed rows."""
+        n_base = self._vectors.shape[0]
+        if mask is None:
+            spans = [(0, n_base)]
+        elif self._partitions is not None:
+            spans = [(s, e) for s, e in self._partitions.values() if mask[s:e].any()]
+        else:
+            allowed = np.flatnonzero(mask)
+            return [
+                allowed[i : i + _SCAN_BLOCK]
+                for i in range(0, allowed.size, _SCAN_BLOCK)
+            ]
         return [
-            Hit(
-                song_id=self._meta[i]["song_id"],
-                score=float(scores[i]),
-                field=Field(self._meta[i]["field"]),
-                lang=Lang(self._meta[i]["lang"]),
-                chunk_index=self._meta[i]["chunk_index"],
-            )
-            for i in top
+            slice(i, min(i + _SCAN_BLOCK, e) if upcast else e)
+            for s, e in spans
+            for i in range(s, e, _SCAN_BLOCK if upcast else max(e - s, 1))
         ]
 
+    @staticmethod
+    def _merge(a: _Found, b: _Found, top_k: int) -> _Found:
+        rows = np.concatenate([a[0], b[0]])
+        scores = np.concatenate([a[1], b[1]])
+        order = np.argsort(-scores, kind="stable")[:top_k]
+        return rows[order], scores[order]
+
+    def _scan_dims(self) -> int:
+        """Leading dimensions the coarse scan uses (all of them without a prefix)."""
+        dims = self._vectors.shape[1]
+        return self.prefix_dims if 0 < self.prefix_dims < dims else dims
+
+    def _build_scan(self) -> None:
+        """(Re)build the reduced scan copy (prefix and/or quantized) from the float32
+        base matrix."""
+        self._scan, self._scale = None, None
+        rows = self._vectors
+        if self._scan_dims() < rows.shape[1]:
+            rows = _normalize(np.asarray(rows[:, : self._scan_dims()]))
+        match self.quantization:
+            case "none":
+                if rows is not self._vectors:
+                    self._scan = rows
+            case "float16":
+                self._scan = rows.astype(np.float16)
+            case "int8":
+                # symmetric per-dimension scale: the largest |value| maps to 127
+                scale = np.abs(rows).max(axis=0) / 127.0
+                scale[scale == 0] = 1.0
+                self._scale = scale.astype(np.float32)
+                codes = np.rint(rows / self._scale)
+                self._scan = np.clip(codes, -127, 127).astype(np.int8)
+            case _:
+                raise ValueError(f"unknown quantization: {self.quantization!r}")
+
+    def _scan_name(self, name: str) -> str:
+        """Scan-copy file `name`, tagged with the prefix size when one is used."""
+        if self._scan_dims() == self._vectors.shape[1]:
+            return name
+        stem, suffix = name.split(".", 1)
+        return f"{stem}{_PREFIX_TAG.format(self._scan_dims())}.{suffix}"
+
+    def _allowed(
+        self, fields: Iterable[Field] | None, langs: Iterable[Lang] | None
+    ) -> np.ndarray | None:
+        """Row mask of live rows passing the field/lang restriction over base + delta
+        rows; None means every row. Base rows are set a partition at a time; the
+        (few) delta rows go through a (field, lang) lookup table."""
+        if fields is None and langs is None:
+            return None if self._live.all() else self._live.copy()
+        wanted = np.zeros((len(self._field_table), len(self._lang_table)), dtype=bool)
+        wanted[
+            np.ix_(
+                self._field_codes(fields if fields is not None else self._field_table),
+                self._lang_codes(langs if langs is not None else self._lang_table),
+            )
+        ] = True
+        n_base = self._vectors.shape[0]
+        mask = np.zeros(self._live.size, dtype=bool)
+        if self._partitions is not None:
+            for (field, lang), (start, end) in self._partitions.items():
+                mask[start:end] = wanted[field, lang]
+        else:
+            mask[:n_base] = wanted[self._fields[:n_base], self._langs[:n_base]]
+        mask[n_base:] = wanted[self._fields[n_base:], self._langs[n_base:]]
+        mask &= self._live
+        return mask
+
+    def _partition(self) -> None:
+        """Locate the base's (field, lang) partitions — one contiguous row range per
+        pair. None when the base isn't grouped that way (indexes saved before it
+        was), which sends filtered scans down the gather path."""
+        n_base = self._vectors.shape[0]
+        fields, langs = self._fields[:n_base], self._langs[:n_base]
+        if n_base == 0:
+            self._partitions = {}
+            return
+        changed = (fields[1:] != fields[:-1]) | (langs[1:] != langs[:-1])
+        starts = np.flatnonzero(np.r_[True, changed])
+        ends = np.append(starts[1:], n_base)
+        pairs = list(zip(fields[starts].tolist(), langs[starts].tolist(), strict=True))
+        if len(set(pairs)) < len(pairs):
+            self._partitions = None
+            return
+        self._partitions = {
+            pair: (int(s), int(e))
+            for pair, s, e in zip(pairs, starts.tolist(), ends.tolist(), strict=True)
+        }
+
+    def _hit(self, row: int, score: float) -> Hit:
+        return Hit(
+            song_id=self._song_ids[self._song_codes[row]],
+            score=score,
+            field=self._field_table[self._fields[row]],
+            lang=self._lang_table[self._langs[row]],
+            chunk_index=int(self._chunks[row]),
+        )
+
+    def _field_codes(self, fields: Iterable[Field]) -> list[int]:
+        wanted = set(fields)
+        return [i for i, f in enumerate(self._field_table) if f in wanted]
+
+    def _lang_codes(self, langs: Iterable[Lang]) -> list[int]:
+        wanted = set(langs)
+        return [i for i, lang in enumerate(self._lang_table) if lang in wanted]
+
     # --- persistence (used by index stage to write, api to read) ---
 
     def save(self) -> None:
+        """Write what changed since the last save/load: the base (and its derived
+        structures) only if it was rebuilt, new delta rows as one new segment, and
+        the small columns — the base matrix and earlier deltas are never rewritten
+        by an incremental save.
+
+        Format (v3, columnar) — one file per column, all parallel to the rows:
+
+            manifest.json     format version, shape, field/lang code tables, delta
+                              segments, the derived-structure files saved for this base
+            vectors.npy       float32 (base rows, dims), opened with mmap_mode="r"
+            delta-NNNN.npy    float32 appended rows, one file per save that added any
+            song_codes.npy    int32  -> index into song_ids.json
+            fields.npy        uint8  -> index into manifest["fields"]
+            langs.npy         uint8  -> index into manifest["langs"]
+            chunk_index.npy   int16
+            tombstones.npy    packed bits, one per row: set = deleted
+            song_ids.json     the song-id string table
+
+        Loading parses no per-row JSON and builds no Python objects, and the vector
+        pages are shared between api workers through the OS page cache. v2 indexes (no
+        deltas, no tombstones) load as-is; the v1 layout (`vectors.npy` + a `meta.json`
+        list of dicts) loads converted to columns in memory."""
         self.dir.mkdir(parents=True, exist_ok=True)
-        np.save(self.dir / _VECTORS_FILE, self._vectors)
-        (self.dir / _META_FILE).write_text(json.dumps(self._meta), encoding="utf-8")
-        self.logger.info("saved", dir=str(self.dir), rows=len(self._meta))
+        if self._base_dirty or not (self.dir / _VECTORS_FILE).exists():
+            write_array(self.dir / _VECTORS_FILE, self._vectors)
+            for stale in self.dir.glob(_DELTA_FILE.replace("{:04d}", "*")):
+                stale.unlink()
+            self._base_dirty = False
+            self._structures_dirty = True
+        if self._structures_dirty:
+            written = self._save_structures()
+            # copies derived from an earlier base (or under other settings, or by
+            # another backend type) must not outlive it
+            for stale in set(self._structure_files) - set(written):
+                (self.dir / stale).unlink(missing_ok=True)
+            self._structure_files = written
+            self._structures_dirty = False
+        persisted = sum(rows for _, rows in self._delta_files)
+        if self._delta.shape[0] > persisted:
+            name = _DELTA_FILE.format(len(self._delta_files) + 1)
+            write_array(self.dir / name, self._delta[persisted:])
+            self._delta_files.append((name, self._delta.shape[0] - persisted))
+        write_array(self.dir / _SONG_CODES_FILE, self._song_codes)
+        write_array(self.dir / _FIELDS_FILE, self._fields)
+        write_array(self.dir / _LANGS_FILE, self._langs)
+        write_array(self.dir / _CHUNKS_FILE, self._chunks)
+        write_array(self.dir / _TOMBSTONES_FILE, np.packbits(~self._live))
+        write_json(self.dir / _SONG_IDS_FILE, self._song_ids)
+        # manifest last: its presence marks a complete index
+        manifest = {
+            "format": _FORMAT_VERSION,
+            "rows": int(self._live.size),
+            "base_rows": int(self._vectors.shape[0]),
+            "dims": int(self._vectors.shape[1]),
+            "deltas": [{"file": f, "rows": r} for f, r in self._delta_files],
+            "structures": self._structure_files,
+            "fields": [f.value for f in self._field_table],
+            "langs": [lang.value for lang in self._lang_table],
+        }
+        write_json(self.dir / _MANIFEST_FILE, manifest)
+        (self.dir / _LEGACY_META_FILE).unlink(missing_ok=True)
+        self.logger.info("saved", dir=str(self.dir), rows=manifest["rows"])
 
     def load(self) -> "LocalSearchBackend":
-        self._vectors = np.load(self.dir / _VECTORS_FILE)
-        self._meta = json.loads((self.dir / _META_FILE).read_text(encoding="utf-8"))
-        self._refresh_masks()
+        manifest_path = self.dir / _MANIFEST_FILE
+        if not manifest_path.exists():
+            if not (self.dir / _LEGACY_META_FILE).exists():
+                raise FileNotFoundError(f"no index in {self.dir}")
+            return self._load_legacy()
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        if manifest["format"] not in _READABLE_FORMATS:
+            raise ValueError(
+                f"unsupported index format {manifest['format']} in {self.dir}"
+            )
+        self._vectors = np.load(self.dir / _VECTORS_FILE, mmap_mode="r")
+        dims = self._vectors.shape[1]
+        self._delta_files = [(d["file"], d["rows"]) for d in manifest.get("deltas", [])]
+        self._delta = np.concatenate(
+            [np.empty((0, dims), dtype=np.float32)]
+            + [np.load(self.dir / f) for f, _ in self._delta_files]
+        )
+        self._song_codes = np.load(self.dir / _SONG_CODES_FILE)
+        self._fields = np.load(self.dir / _FIELDS_FILE)
+        self._langs = np.load(self.dir / _LANGS_FILE)
+        self._chunks = np.load(self.dir / _CHUNKS_FILE)
+        rows = self._chunks.size
+        self._live = np.ones(rows, dtype=bool)
+        if (self.dir / _TOMBSTONES_FILE).exists():
+            tombstones = np.load(self.dir / _TOMBSTONES_FILE)
+            self._live = ~np.unpackbits(tombstones, count=rows).astype(bool)
+        self._song_ids = json.loads(
+            (self.dir / _SONG_IDS_FILE).read_text(encoding="utf-8")
+        )
+        self._song_lookup = {sid: i for i, sid in enumerate(self._song_ids)}
+        self._field_table = [Field(v) for v in manifest["fields"]]
+        self._lang_table = [Lang(v) for v in manifest["langs"]]
+        self._groups = None
+        self._generation += 1
+        self._partition()
+        self._base_dirty = False
+        # only files the manifest lists belong to this base; an index saved before
+        # they were listed rebuilds its structures (and saves them on the next save)
+        self._structure_files = manifest.get("structures", [])
+        self._structures_dirty = False
+        self._load_structures()
+        self.logger.info("loaded", dir=str(self.dir), rows=rows)
         return self
 
-    def _refresh_masks(self) -> None:
-        self._fields = np.array([m["field"] for m in self._meta], dtype=object)
-        self._langs = np.array([m["lang"] for m in self._meta], dtype=object)
+    def _save_structures(self) -> list[str]:
+        """Persist what `_build_structures` derived; returns the file names written.
+        Subclasses add their files."""
+        match self.quantization:
+            case "none" if self._scan is not None:
+                names = {self._scan_name(_VECTORS_FILE): self._scan}
+            case "float16":
+                names = {self._scan_name(_F16_FILE): self._scan}
+            case "int8":
+                names = {
+                    self._scan_name(_I8_FILE): self._scan,
+                    self._scan_name(_I8_SCALE_FILE): self._scale,
+                }
+            case _:
+                names = {}
+        for name, array in names.items():
+            write_array(self.dir / name, array)
+        return list(names)
+
+    def _load_structures(self) -> None:
+        """mmap the persisted scan copy; derive it if the index was saved under a
+        different `quantization` / `prefix_dims` or for an earlier base (costs one
+        full read of the float32 matrix)."""
+        prefix = self._scan_dims() < self._vectors.shape[1]
+        match self.quantization:
+            case "none" if not prefix:
+                self._scan, self._scale = None, None
+            case "none" if self._stored(self._scan_name(_VECTORS_FILE)):
+                self._scan, self._scale = self._load_scan(_VECTORS_FILE), None
+            case "float16" if self._stored(self._scan_name(_F16_FILE)):
+                self._scan, self._scale = self._load_scan(_F16_FILE), None
+            case "int8" if self._stored(self._scan_name(_I8_FILE)):
+                self._scan = self._load_scan(_I8_FILE)
+                self._scale = np.load(self.dir / self._scan_name(_I8_SCALE_FILE))
+            case _:
+                self._build_scan()
+                self._structures_dirty = True
+
+    def _stored(self, name: str) -> bool:
+        """Whether structure file `name` was saved for the current base."""
+        return name in self._structure_files and (self.dir / name).exists()
+
+    def _load_scan(self, name: str) -> np.ndarray:
+        return np.load(self.dir / self._scan_name(name), mmap_mode="r")
+
+    def _load_legacy(self) -> "LocalSearchBackend":
+        """v1 index: full `np.load` + per-row JSON. Re-run `index` to upgrade."""
+        self.logger.warning("loading legacy v1 index", dir=str(self.dir))
+        vectors = np.load(self.dir / _VECTORS_FILE)
+        meta = json.loads((self.dir / _LEGACY_META_FILE).read_text(encoding="utf-8"))
+        self.index(
+            Embedding(
+                id=Embedding.make_id(
+                    m["song_id"], m["field"], m["lang"], m["chunk_index"]
+                ),
+                song_id=m["song_id"],
+                field=Field(m["field"]),
+                lang=Lang(m["lang"]),
+                chunk_index=m["chunk_index"],
+                text="",
+                vector=vector,
+            )
+            for m, vector in zip(meta, vectors.tolist(), strict=True)
+        )
+        return self
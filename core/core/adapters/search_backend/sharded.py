@@ -0,0 +1,183 @@
+"""Sharded SearchBackend — scatter-gather over N disjoint local shards.
+
+Songs are split across `shards` LocalSearchBackend instances by a stable hash of the
+song id, so all of a song's multi-vectors live in one shard and song-level results
+merge without cross-shard aggregation. A query fans out to every shard on a thread
+pool and the per-shard top-k lists are merged by score: each shard scans 1/N of the
+rows, and numpy releases the GIL inside the matrix products, so one query uses N
+cores and per-query latency tracks the largest shard instead of the whole index.
+
+Each shard is a complete index of its own (any local flavour: exact, quantized,
+prefix, IVF, HNSW — whatever `make_shard` builds), persisted under
+`{index_dir}/shard-NN/` and mmap-loaded like an unsharded index, so api workers still
+share the vector pages through the OS page cache. `shards.json` records the shard
+count; loading follows the count on disk.
+
+A SongHit's `matched` pairs are cut at its own shard's k-th song score, which can sit
+below the merged k-th score, so a song may list a pair or two more than an unsharded
+search would.
+"""
+
+import json
+import zlib
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import structlog
+
+from core.adapters.search_backend.local import LocalSearchBackend
+from core.domain import Embedding, Field, Hit, Lang, SongHit
+from core.files import write_json
+from core.ports import SearchBackend
+
+_SHARDS_FILE = "shards.json"
+_SHARD_DIR = "shard-{:02d}"
+
+
+def shard_of(song_id: str, shards: int) -> int:
+    """Stable across processes (unlike `hash`), so writer and readers agree."""
+    return zlib.crc32(song_id.encode("utf-8")) % shards
+
+
+class ShardedSearchBackend(SearchBackend):
+    def __init__(
+        self,
+        index_dir: Path,
+        shards: int = 4,
+        make_shard: Callable[[Path], LocalSearchBackend] = LocalSearchBackend,
+    ):
+        """`make_shard(shard_dir)` builds one (unloaded) shard; default exact local."""
+        if shards < 1:
+            raise ValueError(f"shards must be >= 1, got {shards}")
+        self.dir = Path(index_dir)
+        self.make_shard = make_shard
+        self.logger = structlog.get_logger(__name__).bind(
+            class_name="ShardedSearchBackend"
+        )
+        self._set_shards(shards)
+
+    def _set_shards(self, shards: int) -> None:
+        self.shards = [
+            self.make_shard(self.dir / _SHARD_DIR.format(i)) for i in range(shards)
+        ]
+        self._pool = ThreadPoolExecutor(
+            max_workers=shards, thread_name_prefix="search-shard"
+        )
+
+    def index(self, embeddings: Iterable[Embedding]) -> None:
+        parts: list[list[Embedding]] = [[] for _ in self.shards]
+        for e in embeddings:
+            parts[shard_of(e.song_id, len(self.shards))].append(e)
+        # building is CPU-bound python for the ANN flavours; parallel threads would
+        # only contend on the GIL, so shards are built one after another
+        for shard, part in zip(self.shards, parts, strict=True):
+            shard.index(part)
+        self.logger.info("indexed", shards=len(self.shards), rows=sum(map(len, parts)))
+
+    # --- incremental updates: each song lives in exactly one shard ---
+
+    def upsert(self, song_id: str, embeddings: Iterable[Embedding]) -> None:
+        self._shard_for(song_id).upsert(song_id, embeddings)
+
+    def delete(self, song_id: str) -> None:
+        self._shard_for(song_id).delete(song_id)
+
+    def compact(self) -> None:
+        for shard in self.shards:
+            if shard.dead_fraction > 0:
+                shard.compact()
+
+    @property
+    def dead_fraction(self) -> float:
+        rows = [shard.rows for shard in self.shards]
+        if not sum(rows):
+            return 0.0
+        dead = sum(
+            shard.dead_fraction * n for shard, n in zip(self.shards, rows, strict=True)
+        )
+        return dead / sum(rows)
+
+    @property
+    def version(self) -> str:
+        return f"{self.dir.name}[{','.join(shard.version for shard in self.shards)}]"
+
+    def _shard_for(self, song_id: str) -> LocalSearchBackend:
+        return self.shards[shard_of(song_id, len(self.shards))]
+
+    # --- search: scatter to every shard, gather by score ---
+
+    def search(
+        self,
+        vector: list[float],
+        top_k: int = 20,
+        fields: Iterable[Field] | None = None,
+        langs: Iterable[Lang] | None = None,
+    ) -> list[Hit]:
+        return self.search_many([vector], top_k, fields, langs)[0]
+
+    def search_many(
+        self,
+        vectors: list[list[float]],
+        top_k: int = 20,
+        fields: Iterable[Field] | None = None,
+        langs: Iterable[Lang] | None = None,
+    ) -> list[list[Hit]]:
+        fields = list(fields) if fields is not None else None
+        langs = list(langs) if langs is not None else None
+        per_shard = self._scatter(
+            lambda shard: shard.search_many(vectors, top_k, fields, langs)
+        )
+        return [_gather(hits, top_k) for hits in zip(*per_shard, strict=True)]
+
+    def search_songs_many(
+        self,
+        vectors: list[list[float]],
+        top_k: int = 20,
+        fields: Iterable[Field] | None = None,
+        langs: Iterable[Lang] | None = None,
+    ) -> list[list[SongHit]]:
+        fields = list(fields) if fields is not None else None
+        langs = list(langs) if langs is not None else None
+        per_shard = self._scatter(
+            lambda shard: shard.search_songs_many(vectors, top_k, fields, langs)
+        )
+        return [_gather(hits, top_k) for hits in zip(*per_shard, strict=True)]
+
+    def _scatter(self, call: Callable[[LocalSearchBackend], list]) -> list[list]:
+        if len(self.shards) == 1:
+            return [call(self.shards[0])]
+        return list(self._pool.map(call, self.shards))
+
+    # --- persistence: one local index per shard dir, plus shards.json ---
+
+    def save(self) -> None:
+        self.dir.mkdir(parents=True, exist_ok=True)
+        for shard in self.shards:
+            shard.save()
+        write_json(self.dir / _SHARDS_FILE, {"shards": len(self.shards)})
+        self.logger.info("saved", dir=str(self.dir), shards=len(self.shards))
+
+    def load(self) -> "ShardedSearchBackend":
+        if not (self.dir / _SHARDS_FILE).exists():
+            raise FileNotFoundError(f"no sharded index in {self.dir}")
+        meta = json.loads((self.dir / _SHARDS_FILE).read_text(encoding="utf-8"))
+        if meta["shards"] != len(self.shards):
+            self.logger.warning(
+                "shard count on disk differs from configured — using disk",
+                disk=meta["shards"],
+                configured=len(self.shards),
+            )
+            self._pool.shutdown()
+            self._set_shards(meta["shards"])
+        for shard in self.shards:
+            shard.load()
+        self.logger.info("loaded", dir=str(self.dir), shards=len(self.shards))
+        return self
+
+
+def _gather(per_shard: Iterable[list], top_k: int) -> list:
+    """Merge per-shard result lists (each sorted by score) into the global top_k."""
+    merged = [hit for hits in per_shard for hit in hits]
+    merged.sort(key=lambda hit: hit.score, reverse=True)
+    return merged[:top_k]
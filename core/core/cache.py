@@ -0,0 +1,103 @@
+"""Shared in-process cache — used by the embedding, search-result, and cursor caches.
+
+`LRUCache` is a thread-safe mapping bounded by entry count (least recently used goes
+first) and optionally by age (entries older than `ttl_seconds` read as misses and are
+dropped). It counts hits and misses so callers can report hit rates without wrapping
+every lookup. Entries live in this process only; a persistent tier, where wanted, sits
+in front of or behind it in the caller (see `CachedEmbeddingProvider`).
+
+`normalize_text` is the shared key normalizer for text-keyed caches.
+"""
+
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel, computed_field
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """NFC + collapsed, stripped whitespace — so the same Bengali query typed with
+    decomposed vowel signs, or pasted with stray spaces/newlines, keys the same."""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+class CacheStats(BaseModel):
+    hits: int
+    misses: int
+    size: int
+    max_entries: int
+    disk_hits: int = 0  # misses served by a persistent tier behind this cache
+
+    @computed_field
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LRUCache(Generic[K, V]):
+    def __init__(self, max_entries: int, ttl_seconds: float | None = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry[0]):
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: K, value: V) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: K) -> V | None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        return None if entry is None else entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            size=len(self._entries),
+            max_entries=self.max_entries,
+        )
+
+    def _expired(self, stored_at: float) -> bool:
+        return (
+            self.ttl_seconds is not None
+            and time.monotonic() - stored_at > self.ttl_seconds
+        )
@@ -50,16 +50,79 @@ class Settings(BaseSettings):
     chunk_overlap_tokens: int = 100
 
     # --- search (hybrid ranking, via FusionStrategy port) ---
-    search_overfetch: int = (
-        10  # chunk hits per requested song (multi-vector aggregation)
+    search_candidates: int = (
+        50  # songs (not chunks) the semantic stage hands to filtering + fusion
     )
     fusion_strategy: Literal["rrf", "weighted_sum"] = "rrf"
     fusion_w_semantic: float = 1.0  # weight on the semantic ranked list
     fusion_w_filter: float = 0.5  # weight on the soft-metadata-filter ranked list
+    fusion_w_lexical: float = 0.5  # weight on the BM25 ranked list (if indexed)
+    lexical_max_postings: int = (
+        5000  # BM25: impact-ordered postings read per query term; 0 -> all
+    )
     rrf_k: int = 60  # RRF damping constant — canonical default
+    metadata_index_keys: list[str] = [  # inverted-indexed for soft filters + facets
+        "raag",
+        "taal",
+        "composition_date",
+        "composition_location",
+        "gitabitan_index",
+    ]
+
+    # --- search backend (vector storage / scan) ---
+    search_backend: Literal["local", "ivf", "hnsw"] = "local"  # exact / IVF / graph
+    # scan a quantized copy, then rescore the shortlist at float32. Saves memory at a
+    # latency cost: numpy has no float16 / int8 BLAS, so every query upcasts the copy
+    # block by block (float16 ran ~6x slower per query than float32 on the test data)
+    search_quantization: Literal["none", "float16", "int8"] = "none"
+    search_rescore_factor: int = 4  # quantized / prefix shortlist = top_k * this
+    search_prefix_dims: int = (
+        0  # >0: coarse-scan a Matryoshka prefix this wide, rescore at full dims
+    )
+    ivf_nlist: int = 0  # k-means lists; 0 -> ~4·sqrt(rows), chosen at index time
+    ivf_nprobe: int = 8  # lists scanned per query (recall vs. latency knob)
+    hnsw_m: int = 16  # graph links per node (2x on layer 0)
+    hnsw_ef_construction: int = 100  # insert beam width (build time vs. graph quality)
+    hnsw_ef_search: int = 64  # query beam width (recall vs. latency knob)
+    search_shards: int = 1  # >1: split songs across shards, searched in parallel
+
+    # --- index versions (hot swap: pipeline publishes, api follows CURRENT) ---
+    index_keep_versions: int = 3  # published index versions kept on disk
+    index_poll_seconds: float = 5.0  # api checks CURRENT this often; 0 disables
+    index_compact_fraction: float = (
+        0.2  # incremental index: compact once deltas + tombstones pass this share
+    )
+
+    # --- query-embedding cache (repeat queries skip the embedding round-trip) ---
+    query_cache_size: int = 4096  # query vectors kept in memory; 0 disables the cache
+    query_cache_ttl_seconds: float = 30 * 24 * 3600.0  # both tiers; 0 -> no expiry
+    query_cache_disk: bool = True  # api: back the LRU with {data_dir}/cache/*.sqlite
+    query_cache_disk_size: int = 100_000  # disk-tier rows kept (newest first)
+
+    # --- search-result caches (keyed by query + params + index version) ---
+    result_cache_size: int = 1024  # result lists kept in memory; 0 disables the cache
+    result_cache_ttl_seconds: float = 600.0  # caps staleness of song records; 0 -> none
+
+    semantic_cache_size: int = 0  # >0: also reuse results of near-duplicate queries
+    semantic_cache_threshold: float = 0.95  # min query-vector cosine to count as one
+
+    # --- "more like this" (`similar_songs`: precomputed song-to-song graph) ---
+    similar_songs_k: int = 20  # neighbours kept per song; 0 disables the graph
+
+    # --- paginated search (`search_page` / `page(cursor)`) ---
+    search_page_depth: int = 500  # songs ranked + snapshotted per paginated query
+    search_snapshot_size: int = 256  # snapshots kept; 0 -> first pages only, no cursor
+    search_snapshot_ttl_seconds: float = 900.0  # cursor lifetime after its first page
+
+    # --- observability ---
+    search_metrics: bool = True  # per-stage timers + counters (/metrics); off -> no-op
 
     # --- concurrency (Gemini calls are blocking HTTP -> threads help) ---
     embedding_concurrency: int = 8  # parallel embed batches
+    embedding_coalesce_ms: float = (
+        5.0  # api: concurrent query embeds wait this long to share a call; 0 disables
+    )
+    embedding_coalesce_max: int = 32  # ... or until this many texts are waiting
     translation_concurrency: int = 8  # parallel render calls
 
     # --- batch api (50% cheaper, async; for the one-time full run) ---
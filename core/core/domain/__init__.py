@@ -6,6 +6,7 @@ from core.domain.models import (
     Rendering,
     Song,
     SongEmbeddings,
+    SongHit,
     SongTranslation,
     TaskType,
     TextSnippet,
@@ -20,6 +21,7 @@ __all__ = [
     "Rendering",
     "Song",
     "SongEmbeddings",
+    "SongHit",
     "SongTranslation",
     "TaskType",
     "TextSnippet",
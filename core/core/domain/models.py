@@ -140,3 +140,16 @@ class Hit(BaseModel):
     field: Field
     lang: Lang
     chunk_index: int = 0
+
+
+class SongHit(BaseModel):
+    """A search match aggregated to song level: the song's best chunk score.
+
+    `matched` lists, best first, every (field, lang) whose own best chunk scores at
+    least as high as the weakest song returned — i.e. each pair that alone would have
+    put the song in the results. Always includes the pair of the best chunk.
+    """
+
+    song_id: str
+    score: float
+    matched: list[tuple[Field, Lang]] = []
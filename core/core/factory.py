@@ -1,29 +1,69 @@
-"""Provider factories — one place that decides Gemini vs. fake.
+"""Provider factories — one place that decides Gemini vs. fake (and which backend).
 
 Both pipeline (CLI) and api use these so they always pick the *same* embedder; a query
 must be embedded by the same model that built the index, or similarity is meaningless.
 Falls back to fake providers when no API key is set (offline/dev), or when forced.
 """
 
+from pathlib import Path
+
 import structlog
 
 from core.adapters.embedding import (
+    CachedEmbeddingProvider,
+    CoalescingEmbeddingProvider,
     FakeEmbeddingProvider,
     GeminiBatchEmbeddingProvider,
     GeminiEmbeddingProvider,
 )
 from core.adapters.fusion import RRFFusion, WeightedSumFusion
+from core.adapters.search_backend import (
+    HNSWSearchBackend,
+    IVFSearchBackend,
+    LocalSearchBackend,
+    ShardedSearchBackend,
+)
 from core.adapters.translation import (
     FakeTranslationProvider,
     GeminiTranslationProvider,
 )
 from core.config import settings
+from core.index_versions import IndexVersions
 from core.ports import EmbeddingProvider, FusionStrategy, TranslationProvider
 
 logger = structlog.get_logger(__name__).bind(context="factory")
 
 
-def build_embedding_provider(fake: bool = False) -> EmbeddingProvider:
+def build_embedding_provider(
+    fake: bool = False, serving: bool = False
+) -> EmbeddingProvider:
+    """The configured embedder, wrapped (outermost first) in the query-embedding
+    cache and the async call coalescer, each unless disabled in settings. Document
+    embedding passes straight through both. Only `serving` (the api) backs the cache
+    with its SQLite disk tier; pipeline processes embed documents, not queries."""
+    provider = _build_raw_embedding_provider(fake)
+    if settings.embedding_coalesce_ms > 0:
+        provider = CoalescingEmbeddingProvider(
+            provider,
+            max_batch=settings.embedding_coalesce_max,
+            max_wait_ms=settings.embedding_coalesce_ms,
+        )
+    if settings.query_cache_size <= 0:
+        return provider
+    return CachedEmbeddingProvider(
+        provider,
+        max_entries=settings.query_cache_size,
+        ttl_seconds=settings.query_cache_ttl_seconds or None,
+        disk_path=(
+            settings.data_dir / "cache" / "query_embeddings.sqlite"
+            if serving and settings.query_cache_disk
+            else None
+        ),
+        disk_max_entries=settings.query_cache_disk_size,
+    )
+
+
+def _build_raw_embedding_provider(fake: bool) -> EmbeddingProvider:
     if fake or not settings.gemini_api_key:
         if not fake:
             logger.warning("no GEMINI_API_KEY — using fake embedding provider")
@@ -58,3 +98,51 @@ def build_fusion_strategy(name: str | None = None) -> FusionStrategy:
             return WeightedSumFusion()
         case _:
             raise ValueError(f"unknown fusion strategy: {choice!r}")
+
+
+def build_search_backend(
+    index_dir: Path | None = None,
+) -> LocalSearchBackend | ShardedSearchBackend:
+    """The configured backend over `index_dir`, unloaded. Defaults to the published
+    index version (see `build_index_versions`), or the unversioned root if there is
+    none yet.
+
+    Pipeline (writer) and api (reader) both build it here, so the structures the index
+    stage persists (quantized copy, IVF lists, HNSW graph) are the ones the api loads
+    instead of re-deriving. With `search_shards > 1` every shard is one of these."""
+    if index_dir is None:
+        versions = build_index_versions()
+        index_dir = versions.current_dir() or versions.root
+    if settings.search_shards > 1:
+        return ShardedSearchBackend(
+            index_dir, shards=settings.search_shards, make_shard=_build_local_backend
+        )
+    return _build_local_backend(index_dir)
+
+
+def build_index_versions() -> IndexVersions:
+    return IndexVersions(settings.data_dir / "index", keep=settings.index_keep_versions)
+
+
+def _build_local_backend(index_dir: Path) -> LocalSearchBackend:
+    match settings.search_backend:
+        case "local":
+            return LocalSearchBackend(
+                index_dir,
+                quantization=settings.search_quantization,
+                rescore_factor=settings.search_rescore_factor,
+                prefix_dims=settings.search_prefix_dims,
+            )
+        case "ivf":
+            return IVFSearchBackend(
+                index_dir, nlist=settings.ivf_nlist, nprobe=settings.ivf_nprobe
+            )
+        case "hnsw":
+            return HNSWSearchBackend(
+                index_dir,
+                m=settings.hnsw_m,
+                ef_construction=settings.hnsw_ef_construction,
+                ef_search=settings.hnsw_ef_search,
+            )
+        case _:
+            raise ValueError(f"unknown search backend: {settings.search_backend!r}")
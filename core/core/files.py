@@ -0,0 +1,61 @@
+"""Shared file-writing helpers — used by every index that persists to a version dir.
+
+Index files are never rewritten in place: an incremental build starts from a
+hard-linked copy of the current version (see `core.index_versions`), and api workers
+mmap the files of the version they serve. Each write goes to a temp file that is then
+renamed over the target, so the new version gets a fresh inode and every reader keeps
+the one it has open.
+
+The small indexes beside the vectors (lexical, titles, similar) are each a dir of
+such files, written by `save_dir` with one of them — the marker — last: readers test
+for the marker, so a half-written dir reads as absent.
+"""
+
+import json
+import os
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any, BinaryIO
+
+import numpy as np
+
+
+def replace_file(path: Path, write: Callable[[BinaryIO], Any]) -> None:
+    """`write(f)` to a temp file, then rename it over `path`."""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        write(f)
+    os.replace(tmp, path)
+
+
+def write_array(path: Path, array: np.ndarray) -> None:
+    replace_file(path, lambda f: np.save(f, array))
+
+
+def write_json(path: Path, obj: Any) -> None:
+    replace_file(path, lambda f: f.write(json.dumps(obj).encode("utf-8")))
+
+
+def write_text(path: Path, text: str) -> None:
+    replace_file(path, lambda f: f.write(text.encode("utf-8")))
+
+
+def save_dir(target: Path, files: dict[str, Any]) -> None:
+    """Write `files` (name -> array, saved as `.npy`, or JSON-able value) into
+    `target` in order; the last one is the marker."""
+    target.mkdir(parents=True, exist_ok=True)
+    for name, value in files.items():
+        if isinstance(value, np.ndarray):
+            write_array(target / name, value)
+        else:
+            write_json(target / name, value)
+
+
+def load_dir(source: Path, names: Iterable[str]) -> list[Any]:
+    """The files `save_dir` wrote, in `names` order; arrays are mmapped read-only."""
+    return [
+        np.load(source / name, mmap_mode="r")
+        if name.endswith(".npy")
+        else json.loads((source / name).read_text(encoding="utf-8"))
+        for name in names
+    ]
@@ -0,0 +1,97 @@
+"""Versioned index directories — how the index stage publishes and the api follows.
+
+Every index build writes a fresh version dir under one root and only then flips a
+`CURRENT` pointer file to it (temp file + `os.replace`, so readers see the old name or
+the new one, never a partial write). The api loads whatever `CURRENT` names and can
+swap to a newer version while serving; nothing it has open is ever modified.
+
+    {data_dir}/index/
+        CURRENT                         -> "v-20260301T101500123456"
+        v-20260301T101500123456/        a complete index (manifest.json, ...)
+        v-20260228T093000654321/        previous versions, pruned down to `keep`
+
+An incremental build starts from a hard-linked copy of the current version: unchanged
+files (the big base matrix, ANN structures) cost no space or I/O, and because every
+index file is written through a temp file + rename (`core.files`), rewriting a file in
+the new version replaces its link there without touching the inode the old version
+(and any process that mmapped it) still uses. Pruned versions stay readable by
+processes that still map them — POSIX keeps unlinked files alive until the last mapping
+goes away.
+
+A root with no `CURRENT` (an index written before versioning) still loads, from the
+root itself, until the next build publishes a version.
+"""
+
+import os
+import shutil
+from datetime import UTC, datetime
+from pathlib import Path
+
+import structlog
+
+from core.files import write_text
+
+logger = structlog.get_logger(__name__).bind(context="index_versions")
+
+_CURRENT_FILE = "CURRENT"
+_VERSION_PREFIX = "v-"
+
+
+class IndexVersions:
+    def __init__(self, root: Path, keep: int = 3):
+        """`keep`: published versions retained, the current one included."""
+        self.root = Path(root)
+        self.keep = max(keep, 1)
+
+    def current(self) -> str | None:
+        """Name of the published version, or None before the first publish."""
+        try:
+            name = (self.root / _CURRENT_FILE).read_text(encoding="utf-8").strip()
+        except FileNotFoundError:
+            return None
+        return name or None
+
+    def current_dir(self) -> Path | None:
+        name = self.current()
+        return self.root / name if name else None
+
+    def create(self, copy_from: Path | None = None) -> Path:
+        """A new, unpublished version dir — hard-linked from `copy_from` if given."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%S%f")
+        target = self.root / f"{_VERSION_PREFIX}{stamp}"
+        if copy_from is None:
+            target.mkdir()
+        else:
+            shutil.copytree(copy_from, target, copy_function=_link_or_copy)
+        return target
+
+    def publish(self, version_dir: Path) -> None:
+        """Point `CURRENT` at `version_dir` (atomically), then prune old versions."""
+        write_text(self.root / _CURRENT_FILE, version_dir.name)
+        logger.info("published", version=version_dir.name)
+        self.prune()
+
+    def discard(self, version_dir: Path) -> None:
+        """Drop an unpublished version (a build that failed or had nothing to do)."""
+        shutil.rmtree(version_dir, ignore_errors=True)
+
+    def prune(self) -> None:
+        """Delete all but the newest `keep` versions; never the current one."""
+        current = self.current()
+        versions = sorted(
+            (p for p in self.root.glob(f"{_VERSION_PREFIX}*") if p.is_dir()),
+            key=lambda p: p.name,
+            reverse=True,
+        )
+        for stale in versions[self.keep :]:
+            if stale.name != current:
+                shutil.rmtree(stale, ignore_errors=True)
+                logger.info("pruned", version=stale.name)
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    try:
+        os.link(src, dst)
+    except OSError:  # filesystem without hard links
+        shutil.copy2(src, dst)
@@ -0,0 +1,179 @@
+"""Process-local metrics, rendered in the Prometheus text exposition format.
+
+Just enough of the Prometheus data model for the search path — counters and
+histograms with labels, plus collectors that report values owned elsewhere (cache
+hit counters) at scrape time — so the api can serve `/metrics` without a client
+library. Thread-safe; every api worker process exposes its own series, as with the
+official client in multi-process deployments without a shared directory.
+
+    REGISTRY.histogram("ira_search_stage_seconds", "...", ("stage",)).observe(
+        0.004, stage="embed"
+    )
+    REGISTRY.render()  # -> "# HELP ...\n# TYPE ...\nira_search_stage_seconds_bucket{...
+"""
+
+import math
+import threading
+from collections.abc import Callable, Iterable
+
+# seconds: sub-millisecond in-memory stages up to multi-second embedding retries
+DEFAULT_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+
+# (name, type, labels, value) — one sample reported by a collector at scrape time
+Sample = tuple[str, str, dict[str, str], float]
+
+
+class Counter:
+    def __init__(self, name: str, help: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = tuple(labels[n] for n in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                labels = _labels(zip(self.labelnames, key, strict=True))
+                lines.append(f"{self.name}{labels} {_number(value)}")
+        return lines
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> (per-bucket counts, +Inf included; sum)
+        self._series: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(labels[n] for n in self.labelnames)
+        with self._lock:
+            counts, total = self._series.setdefault(
+                key, ([0] * (len(self.buckets) + 1), [0.0])
+            )
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            else:
+                counts[-1] += 1
+            total[0] += value
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, (counts, total) in sorted(self._series.items()):
+                pairs = list(zip(self.labelnames, key, strict=True))
+                cumulative = 0
+                for bound, n in zip((*self.buckets, math.inf), counts, strict=True):
+                    cumulative += n
+                    le = _labels([*pairs, ("le", _number(bound))])
+                    lines.append(f"{self.name}_bucket{le} {cumulative}")
+                lines.append(f"{self.name}_sum{_labels(pairs)} {_number(total[0])}")
+                lines.append(f"{self.name}_count{_labels(pairs)} {cumulative}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: dict[str, Counter | Histogram] = {}
+        self._collectors: list[Callable[[], Iterable[Sample]]] = []
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help: str, labelnames: Iterable[str] = ()) -> Counter:
+        """The counter called `name`, created on first use."""
+        return self._get(name, lambda: Counter(name, help, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """The histogram called `name`, created on first use."""
+        return self._get(name, lambda: Histogram(name, help, labelnames, buckets))
+
+    def register_collector(self, collect: Callable[[], Iterable[Sample]]) -> None:
+        """`collect()` is called on every `render` for values kept elsewhere."""
+        with self._lock:
+            self._collectors.append(collect)
+
+    def unregister_collector(self, collect: Callable[[], Iterable[Sample]]) -> None:
+        with self._lock:
+            if collect in self._collectors:
+                self._collectors.remove(collect)
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors)
+        lines = [line for metric in metrics for line in metric.render()]
+        typed: set[str] = set()
+        for collect in collectors:
+            for name, kind, labels, value in collect():
+                if name not in typed:
+                    lines.append(f"# TYPE {name} {kind}")
+                    typed.add(name)
+                lines.append(f"{name}{_labels(labels.items())} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+    def _get(self, name: str, make: Callable[[], Counter | Histogram]):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = make()
+            return metric
+
+
+REGISTRY = Registry()
+
+
+def _labels(pairs: Iterable[tuple[str, str]]) -> str:
+    pairs = list(pairs)
+    if not pairs:
+        return ""
+    body = ",".join(f'{k}="{_escape(v)}"' for k, v in pairs)
+    return "{" + body + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
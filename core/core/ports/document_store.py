@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
 from typing import TypeVar
@@ -23,9 +24,24 @@ class DocumentStore(ABC):
     @abstractmethod
     def load(self, collection: str, id: str, model: type[T]) -> T | None: ...
 
+    async def aload(self, collection: str, id: str, model: type[T]) -> T | None:
+        """`load` without blocking the event loop; the default uses a worker thread."""
+        return await asyncio.to_thread(self.load, collection, id, model)
+
     @abstractmethod
     def exists(self, collection: str, id: str) -> bool: ...
 
     @abstractmethod
     def iter(self, collection: str, model: type[T]) -> Iterator[T]:
         """Iterate every record in a collection, parsed as `model`."""
+
+    @abstractmethod
+    def ids(self, collection: str) -> Iterator[str]:
+        """Iterate every record id in a collection, without parsing the records."""
+
+    def stamp(self, collection: str, id: str) -> str | None:
+        """Opaque change marker for one record: equal stamps mean unchanged content.
+
+        Lets incremental stages skip records without loading them. None means
+        "unknown" and must be treated as changed; that is the default."""
+        return None
@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 
 from core.domain import TaskType
@@ -23,3 +24,10 @@ class EmbeddingProvider(ABC):
         Implementations handle provider batch limits internally; callers may pass a
         large list.
         """
+
+    async def aembed(self, texts: list[str], task_type: TaskType) -> list[list[float]]:
+        """`embed` without blocking the event loop.
+
+        The default runs `embed` on a worker thread; providers with a native async
+        client override it so a request waiting on the network holds no thread."""
+        return await asyncio.to_thread(self.embed, texts, task_type)
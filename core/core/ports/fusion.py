@@ -31,5 +31,7 @@ class FusionStrategy(ABC):
         self,
         lists: list[RankedList],
         weights: dict[str, float],
+        top_k: int | None = None,
     ) -> list[tuple[str, float]]:
-        """Return `[(song_id, fused_score)]` sorted descending by fused_score."""
+        """Return `[(song_id, fused_score)]` sorted descending by fused_score — the
+        best `top_k` entries, or every fused song when None."""
@@ -1,7 +1,11 @@
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
 
-from core.domain import Embedding, Field, Hit, Lang
+from core.domain import Embedding, Field, Hit, Lang, SongHit
+
+# Chunk hits fetched per requested song by the default `search_songs_many`, which has
+# to aggregate chunk-level results (one song contributes many multi-vectors).
+_SONG_OVERFETCH = 10
 
 
 class SearchBackend(ABC):
@@ -26,3 +30,88 @@ class SearchBackend(ABC):
     ) -> list[Hit]:
         """Return the top_k nearest embeddings as Hits, optionally restricted to
         certain fields/languages."""
+
+    def upsert(self, song_id: str, embeddings: Iterable[Embedding]) -> None:
+        """Replace every embedding of one song, without rebuilding the rest.
+
+        Optional: backends that only support full `index()` builds raise
+        NotImplementedError, and callers fall back to a full build."""
+        raise NotImplementedError(f"{type(self).__name__} does not support upsert")
+
+    def delete(self, song_id: str) -> None:
+        """Remove every embedding of one song. Optional, like `upsert`."""
+        raise NotImplementedError(f"{type(self).__name__} does not support delete")
+
+    def compact(self) -> None:
+        """Reclaim space left by `upsert` / `delete`. No-op unless overridden."""
+
+    @property
+    def version(self) -> str | None:
+        """Token that changes whenever the searchable contents do (build, load,
+        upsert, delete, compact), so callers can key caches on it. None means the
+        backend can't tell — callers must not cache its results."""
+        return None
+
+    def search_many(
+        self,
+        vectors: list[list[float]],
+        top_k: int = 20,
+        fields: Iterable[Field] | None = None,
+        langs: Iterable[Lang] | None = None,
+    ) -> list[list[Hit]]:
+        """`search` for a batch of query vectors; one Hit list per vector, in order.
+
+        The default loops over `search`; backends that can score a whole batch at once
+        (one matrix-matrix product) should override it.
+        """
+        fields = list(fields) if fields is not None else None
+        langs = list(langs) if langs is not None else None
+        return [self.search(v, top_k, fields, langs) for v in vectors]
+
+    def search_songs(
+        self,
+        vector: list[float],
+        top_k: int = 20,
+        fields: Iterable[Field] | None = None,
+        langs: Iterable[Lang] | None = None,
+    ) -> list[SongHit]:
+        """The top_k songs by best matching chunk, with their matched (field, lang)
+        pairs."""
+        return self.search_songs_many([vector], top_k, fields, langs)[0]
+
+    def search_songs_many(
+        self,
+        vectors: list[list[float]],
+        top_k: int = 20,
+        fields: Iterable[Field] | None = None,
+        langs: Iterable[Lang] | None = None,
+    ) -> list[list[SongHit]]:
+        """`search_songs` for a batch of query vectors; one SongHit list per vector.
+
+        The default over-fetches chunk hits via `search_many` and aggregates them, so
+        a song whose many chunks crowd the window can push others out. Backends that
+        can reduce per song before cutting to top_k should override it.
+        """
+        batch = self.search_many(vectors, top_k * _SONG_OVERFETCH, fields, langs)
+        return [_aggregate(hits, top_k) for hits in batch]
+
+
+def _aggregate(hits: list[Hit], top_k: int) -> list[SongHit]:
+    """Chunk hits (best first) -> the top_k songs, with `SongHit.matched` semantics."""
+    best: dict[str, list[tuple[float, Field, Lang]]] = {}
+    for hit in hits:
+        pairs = best.setdefault(hit.song_id, [])
+        if all((f, lang) != (hit.field, hit.lang) for _, f, lang in pairs):
+            pairs.append((hit.score, hit.field, hit.lang))
+    songs = sorted(best.items(), key=lambda kv: kv[1][0][0], reverse=True)[:top_k]
+    if not songs:
+        return []
+    cutoff = songs[-1][1][0][0]
+    return [
+        SongHit(
+            song_id=song_id,
+            score=pairs[0][0],
+            matched=[(f, lang) for score, f, lang in pairs if score >= cutoff],
+        )
+        for song_id, pairs in songs
+    ]
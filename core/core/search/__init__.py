@@ -1,4 +1,33 @@
-from core.search.models import MatchedField, SearchResult, SongView
+from core.search.catalog import SongCatalog
+from core.search.lexical import LexicalIndex
+from core.search.models import (
+    MatchedField,
+    RankedSong,
+    SearchPage,
+    SearchRanking,
+    SearchResult,
+    SongView,
+    Suggestion,
+)
+from core.search.semantic_cache import SemanticCache
 from core.search.service import SearchService
+from core.search.similar import SimilarityGraph
+from core.search.titles import TitleIndex
+from core.search.trace import SearchTrace
 
-__all__ = ["MatchedField", "SearchResult", "SearchService", "SongView"]
+__all__ = [
+    "LexicalIndex",
+    "MatchedField",
+    "RankedSong",
+    "SearchPage",
+    "SearchRanking",
+    "SearchResult",
+    "SearchService",
+    "SearchTrace",
+    "SemanticCache",
+    "SimilarityGraph",
+    "SongCatalog",
+    "SongView",
+    "Suggestion",
+    "TitleIndex",
+]
@@ -0,0 +1,173 @@
+"""SongCatalog — the song fields search needs, preloaded into memory column by column.
+
+Filtering and hydration touch a handful of fields for each of ~50 candidates per query;
+reading them through the DocumentStore meant a file open and a pydantic parse per song,
+twice. The catalog reads every song + translation record once (at startup, and again
+whenever the api swaps index versions) and keeps just those fields:
+
+    song_ids        row -> song id            (+ `_rows`: song id -> row)
+    titles          Bengali title
+    titles_en       English title             (None when not translated yet)
+    titles_translit transliterated title      (None when not translated yet)
+    metadata[key]   str(value) per row        (None when the song lacks the key)
+
+Columns are plain lists indexed by row; repeated metadata values (a few dozen raags
+and taals across thousands of songs) are interned, so each distinct string is stored
+once. The soft filter and facet counts go through a `MetadataIndex` over the keys in
+`index_keys`; filters on any other key fall back to a scan of a normalized copy of its
+column. Either way a query never touches the store.
+"""
+
+import sys
+from collections.abc import Iterable
+
+import structlog
+
+from core.domain import Song, SongTranslation
+from core.ports import DocumentStore
+from core.search.metadata_index import MetadataIndex, normalize_value
+from core.search.models import MatchedField, SearchResult, Suggestion
+
+logger = structlog.get_logger(__name__).bind(class_name="SongCatalog")
+
+
+class SongCatalog:
+    def __init__(
+        self,
+        songs: Iterable[Song],
+        translations: Iterable[SongTranslation],
+        index_keys: Iterable[str] = (),
+    ):
+        by_song = {t.song_id: t for t in translations}
+        self.song_ids: list[str] = []
+        self.titles: list[str] = []
+        self.titles_en: list[str | None] = []
+        self.titles_translit: list[str | None] = []
+        self.metadata: dict[str, list[str | None]] = {}
+        for row, song in enumerate(songs):
+            t = by_song.get(song.id)
+            self.song_ids.append(song.id)
+            self.titles.append(song.title)
+            self.titles_en.append(t.title_en if t else None)
+            self.titles_translit.append(t.title_translit if t else None)
+            for key, value in song.metadata.items():
+                if value is None:
+                    continue
+                column = self.metadata.setdefault(key, [None] * row)
+                column.append(sys.intern(str(value)))
+            for column in self.metadata.values():
+                if len(column) == row:  # this song lacks the key
+                    column.append(None)
+        self._rows = {sid: row for row, sid in enumerate(self.song_ids)}
+        self.index = MetadataIndex(self.metadata, index_keys)
+        self._normalized = {
+            key: [sys.intern(normalize_value(v)) if v else "" for v in column]
+            for key, column in self.metadata.items()
+            if key not in self.index
+        }
+
+    @classmethod
+    def from_store(
+        cls, store: DocumentStore, index_keys: Iterable[str] = ()
+    ) -> "SongCatalog":
+        catalog = cls(
+            store.iter("songs", Song),
+            store.iter("translations", SongTranslation),
+            index_keys,
+        )
+        logger.info(
+            "loaded",
+            songs=len(catalog),
+            metadata_keys=sorted(catalog.metadata),
+            indexed=catalog.index.keys,
+        )
+        return catalog
+
+    def __len__(self) -> int:
+        return len(self.song_ids)
+
+    def __contains__(self, song_id: str) -> bool:
+        return song_id in self._rows
+
+    def get(self, song_id: str, key: str) -> str | None:
+        """One metadata value of one song (None: unknown song, or key not set)."""
+        row = self._rows.get(song_id)
+        column = self.metadata.get(key)
+        return column[row] if row is not None and column is not None else None
+
+    def filter_scores(
+        self, filters: dict[str, str], song_ids: list[str]
+    ) -> list[float]:
+        """Per song: the fraction of `filters` whose value occurs in the song's value
+        for that key (normalized substring match) — the soft-filter signal. Unknown
+        songs score 0."""
+        if not filters:
+            return [0.0] * len(song_ids)
+        bitmaps = [self._matching(key, value) for key, value in filters.items()]
+        scores = []
+        for song_id in song_ids:
+            row = self._rows.get(song_id)
+            hits = 0 if row is None else sum((b >> row) & 1 for b in bitmaps)
+            scores.append(hits / len(filters))
+        return scores
+
+    def facets(
+        self, keys: Iterable[str], limit: int | None = None
+    ) -> dict[str, dict[str, int]]:
+        """`{key: {value: songs}}` for indexed keys, most common values first (top
+        `limit` per key). Raises KeyError for a key that isn't indexed."""
+        out: dict[str, dict[str, int]] = {}
+        for key in keys:
+            counts = sorted(
+                self.index.counts(key).items(), key=lambda kv: (-kv[1], kv[0])
+            )
+            out[key] = dict(counts[:limit])
+        return out
+
+    def _matching(self, key: str, value: str) -> int:
+        """Bitmap of catalog rows whose `key` value contains `value`."""
+        if key in self.index:
+            return self.index.matching(key, value)
+        needle = normalize_value(value)
+        rows = 0
+        if not needle:
+            return rows
+        for row, text in enumerate(self._normalized.get(key, ())):
+            if needle in text:
+                rows |= 1 << row
+        return rows
+
+    def result(
+        self, song_id: str, score: float, matched: list[MatchedField]
+    ) -> SearchResult | None:
+        """The SearchResult for one song, or None if it isn't in the catalog."""
+        row = self._rows.get(song_id)
+        if row is None:
+            return None
+        return SearchResult(
+            song_id=song_id,
+            score=score,
+            title=self.titles[row],
+            title_en=self.titles_en[row],
+            title_translit=self.titles_translit[row],
+            raag=self.get(song_id, "raag"),
+            taal=self.get(song_id, "taal"),
+            matched=matched,
+        )
+
+    def suggestion(self, song_id: str, source: str) -> Suggestion | None:
+        """The Suggestion for one song's `source` title, or None if the song isn't
+        in the catalog (or lacks that title)."""
+        row = self._rows.get(song_id)
+        if row is None:
+            return None
+        text = {
+            "bn": self.titles,
+            "en": self.titles_en,
+            "translit": self.titles_translit,
+        }[source][row]
+        if text is None:
+            return None
+        return Suggestion(
+            song_id=song_id, text=text, source=source, title=self.titles[row]
+        )
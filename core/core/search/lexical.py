@@ -0,0 +1,220 @@
+"""LexicalIndex — BM25 over song text, the "lexical" ranked list for fusion.
+
+Catches what embeddings blur: exact phrases, names, rare words, transliterated
+spellings. One document per song, built from its titles and lyrics in Bengali, English
+translation and transliteration (titles count `title_weight` times). Terms are tokens
+plus adjacent-token bigrams, so a quoted line scores its phrase, not just its words.
+
+Tokenization is script-aware: text is NFC-normalized and lower-cased; Bengali runs keep
+their vowel signs and hasanta (and lose ZWJ/ZWNJ, which only affect rendering), while
+Latin runs are folded to plain ASCII letters so "gāner" and "ganer" match.
+
+Postings are stored CSR-style in three arrays — `offsets[t]:offsets[t+1]` slices
+`docs` (song rows) and `impacts` (the precomputed BM25 contribution of term t to that
+song) — and each list is sorted by impact, highest first. A query is one `bincount`
+per term over a slice of at most `max_postings` entries, so very common terms cost a
+bounded, best-first prefix instead of their whole list.
+
+Built by the index stage into `{version dir}/lexical/` and mmap-loaded with the index.
+"""
+
+import re
+import unicodedata
+from collections import Counter
+from collections.abc import Iterable
+from itertools import pairwise
+from pathlib import Path
+
+import numpy as np
+import structlog
+
+from core.domain import Song, SongTranslation
+from core.files import load_dir, save_dir
+from core.ports import DocumentStore
+
+logger = structlog.get_logger(__name__).bind(class_name="LexicalIndex")
+
+_DIR = "lexical"
+_TERMS_FILE = "terms.json"
+_SONG_IDS_FILE = "song_ids.json"
+_OFFSETS_FILE = "offsets.npy"
+_DOCS_FILE = "docs.npy"
+_IMPACTS_FILE = "impacts.npy"
+
+_BENGALI_RUN = re.compile(r"([\u0980-\u09ff\u200c\u200d]+)")
+_TOKEN = re.compile(r"[\u0980-\u09ff]+|[a-z0-9]+")
+_JOINERS = str.maketrans("", "", "\u200c\u200d")  # ZWNJ, ZWJ
+
+
+def tokenize(text: str) -> list[str]:
+    """Script-aware word tokens (see module docstring)."""
+    parts = _BENGALI_RUN.split(unicodedata.normalize("NFC", text).lower())
+    folded = [
+        part.translate(_JOINERS) if i % 2 else _fold_latin(part)
+        for i, part in enumerate(parts)
+    ]
+    return _TOKEN.findall(" ".join(folded))
+
+
+def terms(text: str) -> list[str]:
+    """Index terms of a text: its tokens, then its adjacent-token bigrams."""
+    tokens = tokenize(text)
+    return tokens + [f"{a} {b}" for a, b in pairwise(tokens)]
+
+
+def _fold_latin(text: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+class LexicalIndex:
+    def __init__(
+        self,
+        song_ids: list[str],
+        vocabulary: list[str],
+        offsets: np.ndarray,
+        docs: np.ndarray,
+        impacts: np.ndarray,
+    ):
+        self.song_ids = song_ids
+        self._terms = {term: i for i, term in enumerate(vocabulary)}
+        self._vocabulary = vocabulary
+        self._offsets = offsets
+        self._docs = docs
+        self._impacts = impacts
+
+    @classmethod
+    def build(
+        cls,
+        documents: Iterable[tuple[str, list[tuple[str | None, float]]]],
+        k1: float = 1.2,
+        b: float = 0.75,
+    ) -> "LexicalIndex":
+        """`documents`: (song_id, [(text, weight), ...]) — a text's terms count
+        `weight` times toward the song's term frequencies and length."""
+        song_ids: list[str] = []
+        lengths: list[float] = []
+        vocabulary: dict[str, int] = {}
+        term_col: list[int] = []  # one (term, song, frequency) triple per posting
+        row_col: list[int] = []
+        freq_col: list[float] = []
+        for song_id, texts in documents:
+            row = len(song_ids)
+            song_ids.append(song_id)
+            tf: Counter[str] = Counter()
+            length = 0.0
+            for text, weight in texts:
+                if not text:
+                    continue
+                length += weight * len(tokenize(text))
+                for term in terms(text):
+                    tf[term] += weight
+            lengths.append(length)
+            for term, freq in tf.items():
+                term_col.append(vocabulary.setdefault(term, len(vocabulary)))
+                row_col.append(row)
+                freq_col.append(freq)
+
+        n = len(song_ids)
+        term_ids = np.asarray(term_col, dtype=np.int64)
+        rows = np.asarray(row_col, dtype=np.int32)
+        freqs = np.asarray(freq_col, dtype=np.float32)
+        doc_lengths = np.asarray(lengths, dtype=np.float32)
+        avg_length = float(doc_lengths.mean()) if n else 1.0
+        df = np.bincount(term_ids, minlength=len(vocabulary))
+        idf = np.log1p((n - df + 0.5) / (df + 0.5))
+        norm = k1 * (1 - b + b * doc_lengths[rows] / avg_length)
+        impacts = (idf[term_ids] * freqs * (k1 + 1) / (freqs + norm)).astype(np.float32)
+        order = np.lexsort((-impacts, term_ids))  # by term, then by impact, descending
+        offsets = np.concatenate([[0], np.cumsum(df)]).astype(np.int64)
+        index = cls(song_ids, list(vocabulary), offsets, rows[order], impacts[order])
+        logger.info("built", songs=n, terms=len(vocabulary), postings=rows.size)
+        return index
+
+    @classmethod
+    def from_store(
+        cls, store: DocumentStore, title_weight: float = 3.0
+    ) -> "LexicalIndex":
+        translations = {
+            t.song_id: t for t in store.iter("translations", SongTranslation)
+        }
+
+        def documents():
+            for song in store.iter("songs", Song):
+                t = translations.get(song.id)
+                yield (
+                    song.id,
+                    [
+                        (song.title, title_weight),
+                        (t.title_en if t else None, title_weight),
+                        (t.title_translit if t else None, title_weight),
+                        (song.lyrics, 1.0),
+                        (t.lyrics_en if t else None, 1.0),
+                        (t.lyrics_translit if t else None, 1.0),
+                    ],
+                )
+
+        return cls.build(documents())
+
+    def __len__(self) -> int:
+        return len(self.song_ids)
+
+    def search(
+        self, query: str, top_k: int = 50, max_postings: int | None = None
+    ) -> list[tuple[str, float]]:
+        """`[(song_id, bm25)]`, best first; only songs matching some query term.
+        `max_postings` caps how much of each term's (impact-ordered) list is read."""
+        scores = np.zeros(len(self.song_ids), dtype=np.float32)
+        matched = False
+        for term in dict.fromkeys(terms(query)):
+            t = self._terms.get(term)
+            if t is None:
+                continue
+            start, end = int(self._offsets[t]), int(self._offsets[t + 1])
+            if max_postings is not None:
+                end = min(end, start + max_postings)
+            scores += np.bincount(
+                self._docs[start:end],
+                weights=self._impacts[start:end],
+                minlength=scores.size,
+            ).astype(np.float32)
+            matched = True
+        if not matched:
+            return []
+        hits = np.flatnonzero(scores)
+        if hits.size > top_k:
+            hits = hits[np.argpartition(-scores[hits], top_k - 1)[:top_k]]
+        hits = hits[np.argsort(-scores[hits], kind="stable")]
+        return [(self.song_ids[row], float(scores[row])) for row in hits.tolist()]
+
+    # --- persistence: `{index_dir}/lexical/` ---
+
+    @staticmethod
+    def exists(index_dir: Path) -> bool:
+        return (Path(index_dir) / _DIR / _TERMS_FILE).exists()
+
+    def save(self, index_dir: Path) -> None:
+        target = Path(index_dir) / _DIR
+        save_dir(
+            target,
+            {
+                _OFFSETS_FILE: self._offsets,
+                _DOCS_FILE: self._docs,
+                _IMPACTS_FILE: self._impacts,
+                _SONG_IDS_FILE: self.song_ids,
+                _TERMS_FILE: self._vocabulary,  # marker: `exists` checks it
+            },
+        )
+        logger.info("saved", dir=str(target), terms=len(self._vocabulary))
+
+    @classmethod
+    def load(cls, index_dir: Path) -> "LexicalIndex":
+        source = Path(index_dir) / _DIR
+        index = cls(
+            *load_dir(
+                source,
+                (_SONG_IDS_FILE, _TERMS_FILE, _OFFSETS_FILE, _DOCS_FILE, _IMPACTS_FILE),
+            )
+        )
+        logger.info("loaded", dir=str(source), songs=len(index))
+        return index
@@ -0,0 +1,107 @@
+"""MetadataIndex — inverted index over song metadata, for soft filters and facets.
+
+For each indexed key (raag, taal, composition date/location, gitabitan index, ...):
+
+    values[v]     distinct value as stored            "ভৈরবী"
+    normalized[v] NFC, collapsed whitespace, lower    "ভৈরবী"
+    songs[v]      bitmap of catalog rows with that value
+    grams[g]      bitmap of distinct values containing trigram g
+
+Bitmaps are Python ints (bit r set = row r), so unions and intersections are single
+big-int operations and counts are `int.bit_count()`. A filter value keeps its
+substring semantics: the trigrams of the needle are intersected to find the few
+distinct values that can contain it, those are confirmed with a real substring test,
+and their song bitmaps are OR-ed — the work scales with the number of distinct values
+a key has, never with the number of songs. Needles shorter than a trigram check every
+distinct value of the key, which is still a short list.
+"""
+
+from collections.abc import Iterable
+
+from core.cache import normalize_text
+
+_GRAM = 3
+
+
+def normalize_value(text: str) -> str:
+    return normalize_text(text).lower()
+
+
+def iter_bits(bitmap: int) -> Iterable[int]:
+    """Positions of the set bits, lowest first."""
+    while bitmap:
+        low = bitmap & -bitmap
+        yield low.bit_length() - 1
+        bitmap ^= low
+
+
+class _KeyIndex:
+    def __init__(self, column: list[str | None]):
+        ids: dict[str, int] = {}
+        self.values: list[str] = []
+        self.songs: list[int] = []
+        for row, value in enumerate(column):
+            if value is None:
+                continue
+            v = ids.get(value)
+            if v is None:
+                v = ids[value] = len(self.values)
+                self.values.append(value)
+                self.songs.append(0)
+            self.songs[v] |= 1 << row
+        self.normalized = [normalize_value(value) for value in self.values]
+        self.grams: dict[str, int] = {}
+        for v, text in enumerate(self.normalized):
+            for gram in _grams(text):
+                self.grams[gram] = self.grams.get(gram, 0) | (1 << v)
+
+    def matching(self, needle: str) -> int:
+        if len(needle) < _GRAM:
+            candidates: Iterable[int] = range(len(self.values))
+        else:
+            bitmap = -1
+            for gram in _grams(needle):
+                bitmap &= self.grams.get(gram, 0)
+                if not bitmap:
+                    return 0
+            candidates = iter_bits(bitmap)
+        rows = 0
+        for v in candidates:
+            if needle in self.normalized[v]:
+                rows |= self.songs[v]
+        return rows
+
+
+class MetadataIndex:
+    def __init__(self, columns: dict[str, list[str | None]], keys: Iterable[str]):
+        """`columns`: catalog metadata columns (row -> value); only `keys` present
+        there are indexed."""
+        self._keys = {key: _KeyIndex(columns[key]) for key in keys if key in columns}
+
+    @property
+    def keys(self) -> list[str]:
+        return list(self._keys)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._keys
+
+    def matching(self, key: str, value: str) -> int:
+        """Bitmap of rows whose `key` value contains `value` (normalized, as a
+        substring). Raises KeyError for a key that isn't indexed."""
+        needle = normalize_value(value)
+        return self._keys[key].matching(needle) if needle else 0
+
+    def counts(self, key: str, within: int = -1) -> dict[str, int]:
+        """Songs per distinct value of `key`, restricted to the rows in `within`;
+        values with no songs there are left out. Raises KeyError like `matching`."""
+        index = self._keys[key]
+        counts = {}
+        for value, songs in zip(index.values, index.songs, strict=True):
+            n = (songs & within).bit_count()
+            if n:
+                counts[value] = n
+        return counts
+
+
+def _grams(text: str) -> set[str]:
+    return {text[i : i + _GRAM] for i in range(len(text) - _GRAM + 1)}
@@ -1,5 +1,7 @@
 """Search-facing view models — what the API returns. Composed from Song + translation."""
 
+from typing import Literal
+
 from pydantic import BaseModel
 
 from core.domain import Field, Lang, Song, SongTranslation
@@ -25,6 +27,35 @@ class SearchResult(BaseModel):
     matched: list[MatchedField] = []
 
 
+class RankedSong(BaseModel):
+    song_id: str
+    score: float
+
+
+class SearchRanking(BaseModel):
+    """First frame of a streamed search: the final order, before any hydration.
+    One `SearchResult` frame follows per entry, in this order."""
+
+    ranking: list[RankedSong]
+
+
+class SearchPage(BaseModel):
+    """One page of a paginated search; pass `next_cursor` back for the next one."""
+
+    results: list[SearchResult]
+    total: int  # songs in the ranking snapshot (its depth, not the whole corpus)
+    next_cursor: str | None = None  # None: last page (or snapshots disabled)
+
+
+class Suggestion(BaseModel):
+    """One typeahead completion: the title that matched, and the song's Bengali one."""
+
+    song_id: str
+    text: str  # the matching title, as written
+    source: Literal["bn", "en", "translit"]  # which title matched
+    title: str  # Bengali
+
+
 class SongView(BaseModel):
     """Full song detail — original Bengali + English translation + transliteration."""
 
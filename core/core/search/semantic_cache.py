@@ -0,0 +1,108 @@
+"""SemanticCache — reuse a past query's results for a near-duplicate query vector.
+
+Exact-text caching (`SearchService.results`) misses paraphrases: "monsoon longing" and
+"longing in the rains" embed close together and usually rank the same songs. This
+keeps the last `max_entries` query vectors as rows of one L2-normalized matrix, next to
+their finished result lists; a lookup is one matrix-vector product, and a row within
+`threshold` cosine of the new query (and recorded under the same context — top_k,
+filters, fusion, index version, ...) answers it without a backend scan or hydration.
+
+Eviction is least-recently-used: a full cache overwrites the row whose last hit (or
+insert) is oldest. Rows recorded under a context that no longer occurs (an old index
+version) are simply never hit again and age out the same way.
+"""
+
+import threading
+from collections.abc import Hashable
+from typing import Generic, TypeVar
+
+import numpy as np
+
+from core.cache import CacheStats
+
+V = TypeVar("V")
+
+
+class SemanticCache(Generic[V]):
+    def __init__(self, max_entries: int, threshold: float):
+        """`threshold`: minimum cosine similarity for a hit (1.0 ~ exact repeats)."""
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self._vectors: np.ndarray | None = None  # (max_entries, dims), rows unit-norm
+        self._contexts: list[Hashable] = []
+        self._values: list[V] = []
+        self._last_used = np.zeros(max_entries, dtype=np.int64)
+        self._clock = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, vector: list[float], context: Hashable) -> V | None:
+        """Results of the most similar past query under `context`, if close enough."""
+        q = _unit(vector)
+        with self._lock:
+            best = self._nearest(q, context)
+            if best is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._clock += 1
+            self._last_used[best] = self._clock
+            return self._values[best]
+
+    def put(self, vector: list[float], context: Hashable, value: V) -> None:
+        if self.max_entries <= 0:
+            return
+        q = _unit(vector)
+        with self._lock:
+            if self._vectors is None or self._vectors.shape[1] != q.size:
+                self._reset(q.size)
+            if len(self._values) < self.max_entries:
+                slot = len(self._values)
+                self._contexts.append(context)
+                self._values.append(value)
+            else:
+                slot = int(np.argmin(self._last_used))
+                self._contexts[slot] = context
+                self._values[slot] = value
+            self._vectors[slot] = q
+            self._clock += 1
+            self._last_used[slot] = self._clock
+
+    def clear(self) -> None:
+        with self._lock:
+            self._vectors = None
+            self._contexts, self._values = [], []
+            self._last_used[:] = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            size=len(self._values),
+            max_entries=self.max_entries,
+        )
+
+    def _nearest(self, q: np.ndarray, context: Hashable) -> int | None:
+        n = len(self._values)
+        if n == 0 or self._vectors is None or self._vectors.shape[1] != q.size:
+            return None
+        sims = self._vectors[:n] @ q
+        same = np.fromiter((c == context for c in self._contexts), dtype=bool, count=n)
+        sims[~same] = -np.inf
+        best = int(np.argmax(sims))
+        return best if sims[best] >= self.threshold else None
+
+    def _reset(self, dims: int) -> None:
+        self._vectors = np.zeros((self.max_entries, dims), dtype=np.float32)
+        self._contexts, self._values = [], []
+        self._last_used[:] = 0
+
+
+def _unit(vector: list[float]) -> np.ndarray:
+    v = np.asarray(vector, dtype=np.float32)
+    norm = float(np.linalg.norm(v))
+    return v / norm if norm > 0 else v
@@ -2,24 +2,36 @@
 
 Flow:
   1. embed the query (QUERY task type) with the same provider that built the index
-  2. fetch top chunk-level hits from the SearchBackend (over-fetched, since one song
-     contributes many multi-vectors)
-  3. aggregate hits to song level: a song's semantic rank = its best matching chunk
-  4. build the soft-metadata filter ranking — songs scoring 0 are *absent* (soft, never
+  2. fetch the top songs from the SearchBackend — it aggregates the multi-vectors, so
+     a song's semantic rank = its best matching chunk, with the (field, lang) pairs hit
+  3. keep those songs as the semantic ranked list (and their matched pairs)
+  4. if a LexicalIndex is attached, BM25-rank the query text as the lexical list
+  5. build the soft-metadata filter ranking — songs scoring 0 are *absent* (soft, never
      excluded; non-matchers just contribute nothing to the fused total)
-  5. fuse via the injected FusionStrategy (default RRF) with config-driven weights
-  6. hydrate top_k to SearchResult (titles in bn/en/translit + matched fields)
+  6. fuse via the injected FusionStrategy (default RRF) with config-driven weights
+  7. hydrate top_k to SearchResult (titles in bn/en/translit + matched fields)
 
 Depends only on ports — the search backend, embedder, document store, AND the fusion
-strategy are all swappable.
+strategy are all swappable. Steps 5 and 7 read the preloaded `SongCatalog`, not the
+DocumentStore, so the search path does no per-query disk I/O.
+
+Beside `search`, the same ranking is streamed (`iter_search`) and paginated
+(`search_page`); `suggest` and `similar_songs` answer from precomputed indexes with no
+embedding. Results are cached (see `__init__`) and every call is traced
+(`core.search.trace`).
 """
 
-from collections.abc import Iterable
+import asyncio
+import hashlib
+import secrets
+from collections.abc import AsyncIterator, Hashable, Iterable, Iterator
 
 import structlog
 
+from core.cache import LRUCache, normalize_text
 from core.config import settings
-from core.domain import Hit, Song, SongTranslation, TaskType
+from core.domain import Song, SongHit, SongTranslation, TaskType
+from core.metrics import REGISTRY
 from core.ports import (
     DocumentStore,
     EmbeddingProvider,
@@ -27,14 +39,35 @@ from core.ports import (
     RankedList,
     SearchBackend,
 )
-from core.search.models import MatchedField, SearchResult, SongView
+from core.search.catalog import SongCatalog
+from core.search.lexical import LexicalIndex
+from core.search.models import (
+    MatchedField,
+    RankedSong,
+    SearchPage,
+    SearchRanking,
+    SearchResult,
+    SongView,
+    Suggestion,
+)
+from core.search.semantic_cache import SemanticCache
+from core.search.similar import SimilarityGraph
+from core.search.titles import TitleIndex
+from core.search.trace import DISABLED, SearchTrace
 
 logger = structlog.get_logger(__name__).bind(class_name="SearchService")
 
 
+_STORE_READS = REGISTRY.counter(
+    "ira_store_reads_total", "DocumentStore loads made by SearchService."
+)
+
 # `state[song_id] = {"score": best_chunk_score, "matched": [MatchedField, ...]}`
 _SemanticState = dict[str, dict]
 
+# what `iter_search` yields: one SearchRanking, then the SearchResults in order
+SearchFrame = SearchRanking | SearchResult
+
 
 class SearchService:
     def __init__(
@@ -43,11 +76,48 @@ class SearchService:
         backend: SearchBackend,
         embedder: EmbeddingProvider,
         fusion: FusionStrategy,
+        catalog: SongCatalog | None = None,
+        lexical: LexicalIndex | None = None,
+        titles: TitleIndex | None = None,
+        similar: SimilarityGraph | None = None,
     ):
+        """`catalog` defaults to one loaded from `store` now; without `lexical` the
+        lexical signal is simply absent from fusion, without `titles` (`similar`)
+        `suggest` (`similar_songs`) returns nothing.
+
+        Finished result lists are cached in `results` (an LRU) keyed by the normalized
+        query, every parameter that shapes the ranking, and the backend's `version`:
+        any change to the index produces new keys, so stale entries are never served,
+        just aged out. Backends without a `version` are not cached. With
+        `semantic_cache_size > 0`, `semantic` also catches paraphrases: once a query
+        is embedded, a past query within `semantic_cache_threshold` cosine, under the
+        same parameters and index version, supplies the results instead of steps
+        2-7. `snapshots` keeps paginated rankings (see `search_page`)."""
         self.store = store
         self.backend = backend
         self.embedder = embedder
         self.fusion = fusion
+        self.lexical = lexical
+        self.titles = titles
+        self.similar = similar
+        self.catalog = (
+            catalog
+            if catalog is not None
+            else SongCatalog.from_store(store, settings.metadata_index_keys)
+        )
+        self.results: LRUCache[tuple, list[SearchResult]] = LRUCache(
+            settings.result_cache_size, settings.result_cache_ttl_seconds or None
+        )
+        self.semantic: SemanticCache[list[SearchResult]] | None = (
+            SemanticCache(
+                settings.semantic_cache_size, settings.semantic_cache_threshold
+            )
+            if settings.semantic_cache_size > 0
+            else None
+        )
+        self.snapshots: LRUCache[str, _Snapshot] = LRUCache(
+            settings.search_snapshot_size, settings.search_snapshot_ttl_seconds or None
+        )
 
     def search(
         self,
@@ -55,71 +125,581 @@ class SearchService:
         top_k: int = 10,
         filters: dict[str, str] | None = None,
         fusion: FusionStrategy | None = None,
+        trace: SearchTrace | None = None,
     ) -> list[SearchResult]:
         """Hybrid search. `fusion` overrides the default strategy for this call only
-        (handy for A/B testing during tuning)."""
-        query = query.strip()
-        if not query:
-            return []
-        filters = filters or {}
-        strategy = fusion or self.fusion
+        (handy for A/B testing during tuning); `trace` collects this call's timings."""
+        return self.search_many(
+            [query], top_k=top_k, filters=filters, fusion=fusion, trace=trace
+        )[0]
 
-        qvec = self.embedder.embed([query], TaskType.QUERY)[0]
-        chunk_hits = self.backend.search(qvec, top_k=top_k * settings.search_overfetch)
+    def search_many(
+        self,
+        queries: list[str],
+        top_k: int = 10,
+        filters: dict[str, str] | None = None,
+        fusion: FusionStrategy | None = None,
+        trace: SearchTrace | None = None,
+    ) -> list[list[SearchResult]]:
+        """`search` over a batch of queries; one result list per query, in order.
 
-        semantic_rl, semantic_state = self._semantic_ranked_list(chunk_hits)
-        filter_rl = self._filter_ranked_list(filters, semantic_rl.songs)
+        All non-blank queries are embedded in a single `embed` call and scored in a
+        single `backend.search_songs_many` call, so offline evaluation and bulk clients
+        pay one round-trip and one matrix-matrix product instead of one per query.
+        Queries answered from the result cache are left out of both.
+        """
+        trace = trace or _new_trace()
+        batch = self._start(queries, top_k, filters or {}, fusion or self.fusion, trace)
+        if batch.pending:
+            with trace.stage("embed"):
+                qvecs = self.embedder.embed(batch.texts(), TaskType.QUERY)
+            self._finish(batch, qvecs)
+        trace.record()
+        return batch.out
 
-        fused = strategy.fuse(
-            [semantic_rl, filter_rl],
-            weights={
-                "semantic": settings.fusion_w_semantic,
-                "filter": settings.fusion_w_filter,
-            },
+    async def asearch(
+        self,
+        query: str,
+        top_k: int = 10,
+        filters: dict[str, str] | None = None,
+        fusion: FusionStrategy | None = None,
+        trace: SearchTrace | None = None,
+    ) -> list[SearchResult]:
+        """`search` for async callers (see `asearch_many`)."""
+        results = await self.asearch_many(
+            [query], top_k=top_k, filters=filters, fusion=fusion, trace=trace
         )
+        return results[0]
 
-        results: list[SearchResult] = []
-        for song_id, score in fused[:top_k]:
-            result = self._hydrate(song_id, score, semantic_state)
+    async def asearch_many(
+        self,
+        queries: list[str],
+        top_k: int = 10,
+        filters: dict[str, str] | None = None,
+        fusion: FusionStrategy | None = None,
+        trace: SearchTrace | None = None,
+    ) -> list[list[SearchResult]]:
+        """`search_many` without holding a thread while the embedder is called.
+
+        The embedding round-trip — the only network wait — goes through `aembed`;
+        the in-memory rest (scan, fusion, hydration: milliseconds of numpy) runs on
+        a worker thread so it doesn't stall the event loop. A request waiting on the
+        embedding API therefore costs a coroutine, not a threadpool slot."""
+        trace = trace or _new_trace()
+        batch = self._start(queries, top_k, filters or {}, fusion or self.fusion, trace)
+        if batch.pending:
+            with trace.stage("embed"):
+                qvecs = await self.embedder.aembed(batch.texts(), TaskType.QUERY)
+            await asyncio.to_thread(self._finish, batch, qvecs)
+        trace.record()
+        return batch.out
+
+    def iter_search(
+        self,
+        query: str,
+        top_k: int = 10,
+        filters: dict[str, str] | None = None,
+        fusion: FusionStrategy | None = None,
+        trace: SearchTrace | None = None,
+    ) -> Iterator[SearchFrame]:
+        """`search`, streamed: a `SearchRanking` frame (ids + fused scores) once fusion
+        is done, then each `SearchResult` as soon as it is hydrated, so a client can
+        lay out the top hits before the last one is built. The frame lists only songs
+        the catalog can hydrate, so a result follows for every id in it, in frame
+        order; cache hits stream the cached list the same way. Only a fully consumed
+        stream fills the result caches."""
+        trace = trace or _new_trace()
+        batch = self._start([query], top_k, filters or {}, fusion or self.fusion, trace)
+        try:
+            if not batch.pending:
+                yield from _stream_cached(batch.out[0])
+                return
+            with trace.stage("embed"):
+                qvec = self.embedder.embed(batch.texts(), TaskType.QUERY)[0]
+            yield from self._stream(batch, qvec, self._fuse_one(batch, qvec))
+        finally:
+            trace.record()
+
+    async def aiter_search(
+        self,
+        query: str,
+        top_k: int = 10,
+        filters: dict[str, str] | None = None,
+        fusion: FusionStrategy | None = None,
+        trace: SearchTrace | None = None,
+    ) -> AsyncIterator[SearchFrame]:
+        """`iter_search` for async callers: the embedding is awaited and steps 2-6
+        run on a worker thread (as in `asearch_many`); hydration, a catalog lookup
+        per result, runs between yields."""
+        trace = trace or _new_trace()
+        batch = self._start([query], top_k, filters or {}, fusion or self.fusion, trace)
+        try:
+            if not batch.pending:
+                for frame in _stream_cached(batch.out[0]):
+                    yield frame
+                return
+            with trace.stage("embed"):
+                qvec = (await self.embedder.aembed(batch.texts(), TaskType.QUERY))[0]
+            fused = await asyncio.to_thread(self._fuse_one, batch, qvec)
+            for frame in self._stream(batch, qvec, fused):
+                yield frame
+        finally:
+            trace.record()
+
+    def search_page(
+        self,
+        query: str,
+        page_size: int = 10,
+        filters: dict[str, str] | None = None,
+        fusion: FusionStrategy | None = None,
+        trace: SearchTrace | None = None,
+    ) -> SearchPage:
+        """First page of a paginated search; `page(next_cursor)` serves the rest
+        from the ranking snapshot this call stores.
+
+        `search_page_depth` songs are ranked once and their fused ranking — ids,
+        scores, matched pairs — kept in `snapshots` (bounded, TTL), so each page
+        hydrates only its own slice and page 20 costs what page 2 does. Cursors are
+        opaque `{snapshot}.{offset}` strings; snapshots of cacheable queries are keyed
+        like result lists, so a repeated first page is reused too. They live on the
+        service, so an index swap expires every cursor."""
+        trace = trace or _new_trace()
+        query, filters = normalize_text(query), filters or {}
+        strategy = fusion or self.fusion
+        snapshot_id, snapshot = self._snapshot_get(query, filters, strategy, trace)
+        if snapshot is None:
+            with trace.stage("embed"):
+                qvec = self.embedder.embed([query], TaskType.QUERY)[0]
+            snapshot = self._snapshot(
+                snapshot_id, query, qvec, filters, strategy, trace
+            )
+        page = self._page(snapshot_id, snapshot, 0, page_size, trace)
+        trace.record()
+        return page
+
+    async def asearch_page(
+        self,
+        query: str,
+        page_size: int = 10,
+        filters: dict[str, str] | None = None,
+        fusion: FusionStrategy | None = None,
+        trace: SearchTrace | None = None,
+    ) -> SearchPage:
+        """`search_page` for async callers (embedding awaited, as in `asearch_many`)."""
+        trace = trace or _new_trace()
+        query, filters = normalize_text(query), filters or {}
+        strategy = fusion or self.fusion
+        snapshot_id, snapshot = self._snapshot_get(query, filters, strategy, trace)
+        if snapshot is None:
+            with trace.stage("embed"):
+                qvec = (await self.embedder.aembed([query], TaskType.QUERY))[0]
+            snapshot = await asyncio.to_thread(
+                self._snapshot, snapshot_id, query, qvec, filters, strategy, trace
+            )
+        page = self._page(snapshot_id, snapshot, 0, page_size, trace)
+        trace.record()
+        return page
+
+    def page(
+        self, cursor: str, page_size: int = 10, trace: SearchTrace | None = None
+    ) -> SearchPage:
+        """The page at `cursor` (a `next_cursor` from `search_page` or `page`).
+        Raises ValueError for a malformed cursor, KeyError once its snapshot expired
+        (or the index was swapped) — the client should search again."""
+        trace = trace or _new_trace()
+        snapshot_id, offset = _parse_cursor(cursor)
+        with trace.stage("result_cache"):
+            snapshot = self.snapshots.get(snapshot_id)
+        if snapshot is None:
+            raise KeyError(snapshot_id)
+        page = self._page(snapshot_id, snapshot, offset, page_size, trace)
+        trace.record()
+        return page
+
+    def suggest(self, prefix: str, limit: int = 10) -> list[Suggestion]:
+        """Title completions for a typed prefix, best first (see `TitleIndex`)."""
+        if self.titles is None:
+            return []
+        suggestions = []
+        for song_id, source in self.titles.complete(prefix, limit):
+            suggestion = self.catalog.suggestion(song_id, source)
+            if suggestion is not None:
+                suggestions.append(suggestion)
+        return suggestions
+
+    def similar_songs(self, song_id: str, limit: int = 10) -> list[SearchResult] | None:
+        """Songs most like `song_id` (centroid cosine as `score`), from the
+        precomputed `SimilarityGraph`; None if the song isn't in the catalog."""
+        if song_id not in self.catalog:
+            return None
+        if self.similar is None:
+            return []
+        results = []
+        for neighbor, score in self.similar.neighbors(song_id, limit):
+            result = self.catalog.result(neighbor, score, [])
             if result is not None:
                 results.append(result)
         return results
 
+    def facets(
+        self, keys: list[str], limit: int | None = None
+    ) -> dict[str, dict[str, int]]:
+        """Song counts per value of each metadata key (see `SongCatalog.facets`)."""
+        return self.catalog.facets(keys, limit)
+
     def get_song(self, song_id: str) -> SongView | None:
         song = self.store.load("songs", song_id, Song)
         if song is None:
+            _count_store_reads(1)
             return None
         translation = self.store.load("translations", song_id, SongTranslation)
+        _count_store_reads(2)
+        return SongView.from_records(song, translation)
+
+    async def aget_song(self, song_id: str) -> SongView | None:
+        song = await self.store.aload("songs", song_id, Song)
+        if song is None:
+            _count_store_reads(1)
+            return None
+        translation = await self.store.aload("translations", song_id, SongTranslation)
+        _count_store_reads(2)
         return SongView.from_records(song, translation)
 
     # --- internal helpers (split out so each signal is independently testable) ---
 
+    def _start(
+        self,
+        queries: list[str],
+        top_k: int,
+        filters: dict[str, str],
+        strategy: FusionStrategy,
+        trace: SearchTrace,
+    ) -> "_Batch":
+        """Normalize the queries and answer what the result cache can; the rest
+        are left `pending` for embedding."""
+        batch = _Batch(queries, top_k, filters, strategy, trace)
+        trace.count("queries", len(queries))
+        hits = 0
+        with trace.stage("result_cache"):
+            batch.keys = [
+                self._cache_key(q, top_k, filters, strategy) for q in batch.normalized
+            ]
+            for i, (query, key) in enumerate(
+                zip(batch.normalized, batch.keys, strict=True)
+            ):
+                if not query:
+                    continue
+                cached = self.results.get(key) if key is not None else None
+                if cached is not None:
+                    batch.out[i] = list(cached)
+                    hits += 1
+                else:
+                    batch.pending.append(i)
+        trace.count("result_cache_hit", hits)
+        return batch
+
+    def _finish(self, batch: "_Batch", qvecs: list[list[float]]) -> None:
+        """Steps 2-7 for the pending queries, given their embeddings."""
+        keys, out, trace = batch.keys, batch.out, batch.trace
+        vectors = dict(zip(batch.pending, qvecs, strict=True))
+        pending = batch.pending
+        if self.semantic is not None:
+            misses = []
+            with trace.stage("semantic_cache"):
+                for i in pending:
+                    cached = self._semantic_get(vectors[i], keys[i])
+                    if cached is None:
+                        misses.append(i)
+                    else:
+                        out[i] = cached
+                        self.results.put(keys[i], list(cached))
+            trace.count("semantic_cache_hit", len(pending) - len(misses))
+            pending = misses
+            if not pending:
+                return
+        with trace.stage("scan"):
+            batch_hits = self.backend.search_songs_many(
+                [vectors[i] for i in pending],
+                top_k=max(batch.top_k, settings.search_candidates),
+            )
+        trace.count("candidates", sum(len(hits) for hits in batch_hits))
+        trace.count(
+            "matched_fields",
+            sum(len(hit.matched) for hits in batch_hits for hit in hits),
+        )
+        for i, song_hits in zip(pending, batch_hits, strict=True):
+            with trace.stage("lexical"):
+                lexical_rl = self._lexical_ranked_list(batch.normalized[i])
+            trace.count("lexical_hits", len(lexical_rl.songs))
+            out[i] = self._rank(
+                song_hits, lexical_rl, batch.top_k, batch.filters, batch.strategy, trace
+            )
+            self._remember(keys[i], vectors[i], out[i])
+
+    def _fuse_one(
+        self, batch: "_Batch", qvec: list[float]
+    ) -> tuple[list[tuple[str, float]], _SemanticState] | None:
+        """`_finish` for a one-query batch, stopping before hydration: the fused
+        top_k and matched pairs — or None when the semantic cache answered (the
+        results are then in `batch.out[0]`)."""
+        trace, key = batch.trace, batch.keys[0]
+        if self.semantic is not None:
+            with trace.stage("semantic_cache"):
+                cached = self._semantic_get(qvec, key)
+            if cached is not None:
+                trace.count("semantic_cache_hit")
+                batch.out[0] = cached
+                self.results.put(key, list(cached))
+                return None
+        with trace.stage("scan"):
+            song_hits = self.backend.search_songs_many(
+                [qvec], top_k=max(batch.top_k, settings.search_candidates)
+            )[0]
+        trace.count("candidates", len(song_hits))
+        trace.count("matched_fields", sum(len(hit.matched) for hit in song_hits))
+        with trace.stage("lexical"):
+            lexical_rl = self._lexical_ranked_list(batch.normalized[0])
+        trace.count("lexical_hits", len(lexical_rl.songs))
+        return self._fuse(
+            song_hits, lexical_rl, batch.top_k, batch.filters, batch.strategy, trace
+        )
+
+    def _stream(
+        self,
+        batch: "_Batch",
+        qvec: list[float],
+        fused: tuple[list[tuple[str, float]], _SemanticState] | None,
+    ) -> Iterator[SearchFrame]:
+        """The frames of a `_fuse_one` outcome, hydrating one result per yield."""
+        if fused is None:
+            yield from _stream_cached(batch.out[0])
+            return
+        ranking, state = fused
+        # hydration drops exactly the songs missing from the catalog; leave them out
+        # of the frame too, so every announced song gets its result
+        ranking = [(sid, score) for sid, score in ranking if sid in self.catalog]
+        yield SearchRanking(
+            ranking=[RankedSong(song_id=sid, score=score) for sid, score in ranking]
+        )
+        results: list[SearchResult] = []
+        for song_id, score in ranking:
+            with batch.trace.stage("hydrate"):
+                result = self._hydrate(song_id, score, state)
+            if result is not None:
+                results.append(result)
+                yield result
+        self._remember(batch.keys[0], qvec, results)
+
+    def _remember(
+        self, key: tuple | None, vector: list[float], results: list[SearchResult]
+    ) -> None:
+        """Store a freshly ranked result list in the result (and semantic) cache."""
+        if key is None:
+            return
+        self.results.put(key, list(results))
+        if self.semantic is not None:
+            self.semantic.put(vector, key[1:], list(results))
+
+    def _semantic_get(
+        self, vector: list[float], key: tuple | None
+    ) -> list[SearchResult] | None:
+        """Results of a near-duplicate past query; the result-cache key minus the
+        query text is the context both must share."""
+        if key is None:
+            return None
+        cached = self.semantic.get(vector, key[1:])
+        return list(cached) if cached is not None else None
+
+    def _cache_key(
+        self,
+        query: str,
+        top_k: int,
+        filters: dict[str, str],
+        strategy: FusionStrategy,
+    ) -> tuple | None:
+        """Everything a result list depends on; None when it can't be cached."""
+        version = self.backend.version
+        if not query or version is None:
+            return None
+        return (
+            query,
+            top_k,
+            tuple(sorted(filters.items())),
+            _fusion_key(strategy),
+            settings.fusion_w_semantic,
+            settings.fusion_w_filter,
+            settings.fusion_w_lexical,
+            settings.search_candidates,
+            self.embedder.model_id,
+            version,
+        )
+
+    def _rank(
+        self,
+        song_hits: list[SongHit],
+        lexical_rl: RankedList,
+        top_k: int,
+        filters: dict[str, str],
+        strategy: FusionStrategy,
+        trace: SearchTrace = DISABLED,
+    ) -> list[SearchResult]:
+        """Steps 3 and 5-7 of the flow above, for one query's song hits and lexical
+        ranking."""
+        fused, semantic_state = self._fuse(
+            song_hits, lexical_rl, top_k, filters, strategy, trace
+        )
+        results: list[SearchResult] = []
+        with trace.stage("hydrate"):
+            for song_id, score in fused:
+                result = self._hydrate(song_id, score, semantic_state)
+                if result is not None:
+                    results.append(result)
+        return results
+
+    def _fuse(
+        self,
+        song_hits: list[SongHit],
+        lexical_rl: RankedList,
+        top_k: int,
+        filters: dict[str, str],
+        strategy: FusionStrategy,
+        trace: SearchTrace,
+    ) -> tuple[list[tuple[str, float]], _SemanticState]:
+        """Steps 3, 5 and 6: the fused top_k, plus matched pairs for hydration."""
+        with trace.stage("filter"):
+            semantic_rl, semantic_state = self._semantic_ranked_list(song_hits)
+            candidates = list(dict.fromkeys(semantic_rl.songs + lexical_rl.songs))
+            filter_rl = self._filter_ranked_list(filters, candidates)
+
+        with trace.stage("fusion"):
+            fused = strategy.fuse(
+                [semantic_rl, lexical_rl, filter_rl],
+                weights={
+                    "semantic": settings.fusion_w_semantic,
+                    "lexical": settings.fusion_w_lexical,
+                    "filter": settings.fusion_w_filter,
+                },
+                top_k=top_k,
+            )
+        return fused, semantic_state
+
+    def _snapshot_get(
+        self,
+        query: str,
+        filters: dict[str, str],
+        strategy: FusionStrategy,
+        trace: SearchTrace,
+    ) -> tuple[str, "_Snapshot | None"]:
+        """The snapshot id for a paginated query, and its snapshot if already stored
+        (a blank query gets an empty one, so it is never embedded)."""
+        trace.count("queries")
+        if not query:
+            return secrets.token_hex(8), _Snapshot([], [], {})
+        key = self._cache_key(query, settings.search_page_depth, filters, strategy)
+        if key is None:
+            return secrets.token_hex(8), None
+        snapshot_id = hashlib.blake2b(repr(key).encode(), digest_size=8).hexdigest()
+        with trace.stage("result_cache"):
+            snapshot = self.snapshots.get(snapshot_id)
+        if snapshot is not None:
+            trace.count("result_cache_hit")
+        return snapshot_id, snapshot
+
+    def _snapshot(
+        self,
+        snapshot_id: str,
+        query: str,
+        qvec: list[float],
+        filters: dict[str, str],
+        strategy: FusionStrategy,
+        trace: SearchTrace,
+    ) -> "_Snapshot":
+        """Rank the query `search_page_depth` deep and store the fused ranking."""
+        depth = settings.search_page_depth
+        with trace.stage("scan"):
+            song_hits = self.backend.search_songs_many(
+                [qvec], top_k=max(depth, settings.search_candidates)
+            )[0]
+        trace.count("candidates", len(song_hits))
+        with trace.stage("lexical"):
+            lexical_rl = self._lexical_ranked_list(query, depth)
+        fused, state = self._fuse(
+            song_hits, lexical_rl, depth, filters, strategy, trace
+        )
+        snapshot = _Snapshot(
+            [sid for sid, _ in fused],
+            [score for _, score in fused],
+            {sid: state[sid]["matched"] for sid, _ in fused if sid in state},
+        )
+        self.snapshots.put(snapshot_id, snapshot)
+        return snapshot
+
+    def _page(
+        self,
+        snapshot_id: str,
+        snapshot: "_Snapshot",
+        offset: int,
+        page_size: int,
+        trace: SearchTrace,
+    ) -> SearchPage:
+        end = offset + page_size
+        results: list[SearchResult] = []
+        with trace.stage("hydrate"):
+            for song_id, score in zip(
+                snapshot.song_ids[offset:end], snapshot.scores[offset:end], strict=True
+            ):
+                result = self.catalog.result(
+                    song_id, score, snapshot.matched.get(song_id, [])
+                )
+                if result is not None:
+                    results.append(result)
+        more = end < len(snapshot.song_ids) and self.snapshots.max_entries > 0
+        return SearchPage(
+            results=results,
+            total=len(snapshot.song_ids),
+            next_cursor=f"{snapshot_id}.{end}" if more else None,
+        )
+
     @staticmethod
     def _semantic_ranked_list(
-        chunk_hits: Iterable[Hit],
+        song_hits: Iterable[SongHit],
     ) -> tuple[RankedList, _SemanticState]:
-        """Aggregate chunk-level hits to song level: best chunk wins, collect matched
-        (field, lang) pairs for hydration."""
-        state: _SemanticState = {}
-        for hit in chunk_hits:
-            mf = MatchedField(field=hit.field, lang=hit.lang)
-            if hit.song_id not in state:
-                state[hit.song_id] = {"score": hit.score, "matched": [mf]}
-            else:
-                entry = state[hit.song_id]
-                entry["score"] = max(entry["score"], hit.score)
-                if mf not in entry["matched"]:
-                    entry["matched"].append(mf)
-        ordered = sorted(state.items(), key=lambda kv: kv[1]["score"], reverse=True)
+        """Song hits (already aggregated and ordered by the backend) -> the semantic
+        ranked list, plus matched (field, lang) pairs for hydration."""
+        state: _SemanticState = {
+            hit.song_id: {
+                "score": hit.score,
+                "matched": [
+                    MatchedField(field=field, lang=lang) for field, lang in hit.matched
+                ],
+            }
+            for hit in song_hits
+        }
         return (
             RankedList(
                 name="semantic",
-                songs=[sid for sid, _ in ordered],
-                scores=[entry["score"] for _, entry in ordered],
+                songs=list(state),
+                scores=[entry["score"] for entry in state.values()],
             ),
             state,
         )
 
+    def _lexical_ranked_list(self, query: str, top_k: int | None = None) -> RankedList:
+        """BM25 top songs for the query text (`search_candidates` of them by
+        default); empty without a lexical index."""
+        if self.lexical is None:
+            return RankedList(name="lexical", songs=[], scores=[])
+        hits = self.lexical.search(
+            query,
+            top_k=top_k or settings.search_candidates,
+            max_postings=settings.lexical_max_postings or None,
+        )
+        return RankedList(
+            name="lexical",
+            songs=[sid for sid, _ in hits],
+            scores=[score for _, score in hits],
+        )
+
     def _filter_ranked_list(
         self, filters: dict[str, str], candidates: list[str]
     ) -> RankedList:
@@ -131,18 +711,12 @@ class SearchService:
         semantics we want."""
         if not filters:
             return RankedList(name="filter", songs=[], scores=[])
-        ranked: list[tuple[str, float]] = []
-        for song_id in candidates:
-            song = self.store.load("songs", song_id, Song)
-            if song is None:
-                continue
-            matched = sum(
-                1
-                for key, value in filters.items()
-                if value.lower() in str(song.metadata.get(key, "")).lower()
-            )
-            if matched > 0:
-                ranked.append((song_id, matched / len(filters)))
+        scores = self.catalog.filter_scores(filters, candidates)
+        ranked = [
+            (song_id, score)
+            for song_id, score in zip(candidates, scores, strict=True)
+            if score > 0
+        ]
         ranked.sort(key=lambda kv: kv[1], reverse=True)
         return RankedList(
             name="filter",
@@ -153,17 +727,73 @@ class SearchService:
     def _hydrate(
         self, song_id: str, score: float, state: _SemanticState
     ) -> SearchResult | None:
-        song = self.store.load("songs", song_id, Song)
-        if song is None:
-            return None
-        translation = self.store.load("translations", song_id, SongTranslation)
-        return SearchResult(
-            song_id=song_id,
-            score=score,
-            title=song.title,
-            title_en=translation.title_en if translation else None,
-            title_translit=translation.title_translit if translation else None,
-            raag=song.metadata.get("raag"),
-            taal=song.metadata.get("taal"),
-            matched=state.get(song_id, {}).get("matched", []),
+        return self.catalog.result(
+            song_id, score, state.get(song_id, {}).get("matched", [])
         )
+
+
+class _Batch:
+    """One `search_many` call in flight: what `_start` resolved and `_finish` fills."""
+
+    def __init__(
+        self,
+        queries: list[str],
+        top_k: int,
+        filters: dict[str, str],
+        strategy: FusionStrategy,
+        trace: SearchTrace,
+    ):
+        self.normalized = [normalize_text(q) for q in queries]
+        self.top_k = top_k
+        self.filters = filters
+        self.strategy = strategy
+        self.trace = trace
+        self.keys: list[tuple | None] = []
+        self.out: list[list[SearchResult]] = [[] for _ in queries]
+        self.pending: list[int] = []  # indexes still to embed + rank
+
+    def texts(self) -> list[str]:
+        return [self.normalized[i] for i in self.pending]
+
+
+def _stream_cached(results: list[SearchResult]) -> Iterator[SearchFrame]:
+    yield SearchRanking(
+        ranking=[RankedSong(song_id=r.song_id, score=r.score) for r in results]
+    )
+    yield from results
+
+
+class _Snapshot:
+    """A paginated query's fused ranking, kept for `SearchService.page`."""
+
+    def __init__(
+        self,
+        song_ids: list[str],
+        scores: list[float],
+        matched: dict[str, list[MatchedField]],
+    ):
+        self.song_ids = song_ids
+        self.scores = scores
+        self.matched = matched
+
+
+def _parse_cursor(cursor: str) -> tuple[str, int]:
+    snapshot_id, sep, offset = cursor.partition(".")
+    if not (snapshot_id and sep and offset.isdigit()):
+        raise ValueError(f"malformed cursor: {cursor!r}")
+    return snapshot_id, int(offset)
+
+
+def _new_trace() -> SearchTrace:
+    return SearchTrace() if settings.search_metrics else DISABLED
+
+
+def _count_store_reads(n: int) -> None:
+    if settings.search_metrics:
+        _STORE_READS.inc(n)
+
+
+def _fusion_key(strategy: FusionStrategy) -> Hashable:
+    """A strategy's class and parameters (e.g. RRF's `k`), not its identity — the api
+    builds a fresh instance for every per-call override."""
+    return (type(strategy).__name__, tuple(sorted(vars(strategy).items())))
@@ -0,0 +1,171 @@
+"""SimilarityGraph — precomputed "more like this": each song's k nearest songs.
+
+A song is represented by the centroid of its multi-vectors (every title / lyrics /
+context chunk, each unit-normalized, averaged and re-normalized), and neighbours are
+ranked by centroid cosine. The index stage computes the full kNN graph once per
+version with blocked matrix products, so serving a "related songs" list is a row
+lookup — no query embedding, no scan:
+
+    song_ids.json   row -> song id
+    neighbors.npy   int32   (songs, k)  neighbour rows, best first; -1 pads
+    scores.npy      float16 (songs, k)  their cosine similarity
+    centroids.npy   float16 (songs, dims)  kept so an incremental build only
+                                           re-reads the songs whose vectors changed
+
+Stored in `{version dir}/similar/`, next to the vector index.
+"""
+
+from collections.abc import Iterable
+from pathlib import Path
+
+import numpy as np
+import structlog
+
+from core.domain import Embedding, SongEmbeddings
+from core.files import load_dir, save_dir
+from core.ports import DocumentStore
+
+logger = structlog.get_logger(__name__).bind(class_name="SimilarityGraph")
+
+_DIR = "similar"
+_SONG_IDS_FILE = "song_ids.json"
+_NEIGHBORS_FILE = "neighbors.npy"
+_SCORES_FILE = "scores.npy"
+_CENTROIDS_FILE = "centroids.npy"
+
+_BLOCK = 1024  # songs per matrix-product block while building
+
+
+def song_centroid(items: Iterable[Embedding]) -> np.ndarray | None:
+    """Unit-norm mean of a song's unit-normalized vectors; None without any."""
+    vectors = [item.vector for item in items if item.vector is not None]
+    if not vectors:
+        return None
+    matrix = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    centroid = (matrix / np.where(norms == 0, 1, norms)).mean(axis=0)
+    norm = np.linalg.norm(centroid)
+    return centroid / norm if norm > 0 else None
+
+
+class SimilarityGraph:
+    def __init__(
+        self,
+        song_ids: list[str],
+        neighbors: np.ndarray,
+        scores: np.ndarray,
+        centroids: np.ndarray,
+    ):
+        self.song_ids = song_ids
+        self._rows = {sid: row for row, sid in enumerate(song_ids)}
+        self._neighbors = neighbors
+        self._scores = scores
+        self._centroids = centroids
+
+    @classmethod
+    def build(
+        cls, centroids: Iterable[tuple[str, np.ndarray]], k: int = 20
+    ) -> "SimilarityGraph":
+        """`centroids`: (song_id, unit-norm centroid) per song."""
+        song_ids: list[str] = []
+        rows: list[np.ndarray] = []
+        for song_id, centroid in centroids:
+            song_ids.append(song_id)
+            rows.append(centroid)
+        n = len(song_ids)
+        matrix = np.asarray(rows, dtype=np.float16).reshape(n, -1 if n else 0)
+        k = max(min(k, n - 1), 0)
+        neighbors = np.full((n, k), -1, dtype=np.int32)
+        scores = np.zeros((n, k), dtype=np.float16)
+        vectors = matrix.astype(np.float32)
+        for start in range(0, n if k > 0 else 0, _BLOCK):
+            block = vectors[start : start + _BLOCK] @ vectors.T
+            own = np.arange(block.shape[0])
+            block[own, own + start] = -np.inf  # a song is not its own neighbour
+            top = np.argpartition(-block, k - 1, axis=1)[:, :k]
+            top_scores = np.take_along_axis(block, top, axis=1)
+            order = np.argsort(-top_scores, axis=1, kind="stable")
+            neighbors[start : start + _BLOCK] = np.take_along_axis(top, order, axis=1)
+            scores[start : start + _BLOCK] = np.take_along_axis(
+                top_scores, order, axis=1
+            )
+        logger.info("built", songs=n, k=k)
+        return cls(song_ids, neighbors, scores, matrix)
+
+    @classmethod
+    def from_store(
+        cls,
+        store: DocumentStore,
+        k: int = 20,
+        reuse: dict[str, np.ndarray] | None = None,
+    ) -> "SimilarityGraph":
+        """Graph over every song with embeddings. Songs in `reuse` (centroids from
+        the previous version, minus changed songs) aren't re-read."""
+        reuse = reuse or {}
+
+        def centroids():
+            for song_id in store.ids("embeddings"):
+                centroid = reuse.get(song_id)
+                if centroid is None:
+                    record = store.load("embeddings", song_id, SongEmbeddings)
+                    centroid = song_centroid(record.items) if record else None
+                if centroid is not None:
+                    yield song_id, centroid
+
+        return cls.build(centroids(), k)
+
+    def __len__(self) -> int:
+        return len(self.song_ids)
+
+    def __contains__(self, song_id: str) -> bool:
+        return song_id in self._rows
+
+    def centroids(self) -> dict[str, np.ndarray]:
+        return dict(zip(self.song_ids, self._centroids, strict=True))
+
+    def neighbors(self, song_id: str, limit: int = 10) -> list[tuple[str, float]]:
+        """`[(song_id, cosine)]` of the songs most like `song_id`, best first (at
+        most the graph's k); empty for a song not in the graph."""
+        row = self._rows.get(song_id)
+        if row is None:
+            return []
+        return [
+            (self.song_ids[n], float(score))
+            for n, score in zip(
+                self._neighbors[row, :limit].tolist(),
+                self._scores[row, :limit].tolist(),
+                strict=True,
+            )
+            if n >= 0
+        ]
+
+    # --- persistence: `{index_dir}/similar/` ---
+
+    @staticmethod
+    def exists(index_dir: Path) -> bool:
+        return (Path(index_dir) / _DIR / _SONG_IDS_FILE).exists()
+
+    def save(self, index_dir: Path) -> None:
+        target = Path(index_dir) / _DIR
+        save_dir(
+            target,
+            {
+                _NEIGHBORS_FILE: self._neighbors,
+                _SCORES_FILE: self._scores,
+                _CENTROIDS_FILE: self._centroids,
+                _SONG_IDS_FILE: self.song_ids,  # marker: `exists` checks it
+            },
+        )
+        logger.info("saved", dir=str(target), songs=len(self))
+
+    @classmethod
+    def load(cls, index_dir: Path) -> "SimilarityGraph":
+        source = Path(index_dir) / _DIR
+        graph = cls(
+            *load_dir(
+                source,
+                (_SONG_IDS_FILE, _NEIGHBORS_FILE, _SCORES_FILE, _CENTROIDS_FILE),
+            )
+        )
+        logger.info("loaded", dir=str(source), songs=len(graph))
+        return graph
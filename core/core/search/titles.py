@@ -0,0 +1,189 @@
+"""TitleIndex — prefix index over song titles, for typeahead without an embedder.
+
+Every title (Bengali, English translation, transliteration) is folded the way
+`LexicalIndex` tokenizes — lower-cased, NFC, Latin diacritics stripped, ZWJ/ZWNJ
+dropped, punctuation gone, words joined by one space — and indexed from each word
+start, so "pran" completes "Amar praner manush" as well as "Praner ...". The keys
+live in one sorted list; a prefix is two `bisect`s giving the contiguous slice of
+matching keys, ranked with numpy over parallel arrays:
+
+    rows     song row (into `song_ids`)
+    sources  which title matched: 0 Bengali, 1 English, 2 transliteration
+    ranks    lower is better: word position (title start first), then title length
+
+A song matching several ways is suggested once, by its best key. Built by the index
+stage into `{version dir}/titles/`, next to `lexical/`, and rebuilt whenever a song or
+translation record changes — a title edit publishes a new version even when no
+vector changed.
+"""
+
+from bisect import bisect_left
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Literal
+
+import numpy as np
+import structlog
+
+from core.domain import Song, SongTranslation
+from core.files import load_dir, save_dir
+from core.ports import DocumentStore
+from core.search.lexical import tokenize
+
+logger = structlog.get_logger(__name__).bind(class_name="TitleIndex")
+
+TitleSource = Literal["bn", "en", "translit"]
+SOURCES: tuple[TitleSource, ...] = ("bn", "en", "translit")
+
+_DIR = "titles"
+_KEYS_FILE = "keys.json"
+_SONG_IDS_FILE = "song_ids.json"
+_ROWS_FILE = "rows.npy"
+_SOURCES_FILE = "sources.npy"
+_RANKS_FILE = "ranks.npy"
+
+_MAX_LENGTH = 999  # title lengths beyond this rank alike
+_END = chr(0x10FFFF)  # sorts after every continuation of a prefix
+
+
+def fold(text: str) -> str:
+    """A title or typed prefix as an index key (see module docstring)."""
+    return " ".join(tokenize(text))
+
+
+class TitleIndex:
+    def __init__(
+        self,
+        song_ids: list[str],
+        keys: list[str],
+        rows: np.ndarray,
+        sources: np.ndarray,
+        ranks: np.ndarray,
+    ):
+        self.song_ids = song_ids
+        self._keys = keys
+        self._rows = rows
+        self._sources = sources
+        self._ranks = ranks
+
+    @classmethod
+    def build(
+        cls, titles: Iterable[tuple[str, list[tuple[str | None, TitleSource]]]]
+    ) -> "TitleIndex":
+        """`titles`: (song_id, [(title, source), ...]) — missing titles are None."""
+        song_ids: list[str] = []
+        entries: list[tuple[str, int, int, int]] = []  # key, row, source, rank
+        for song_id, variants in titles:
+            row = len(song_ids)
+            song_ids.append(song_id)
+            for title, source in variants:
+                words = tokenize(title) if title else []
+                length = min(len(" ".join(words)), _MAX_LENGTH)
+                for position in range(len(words)):
+                    entries.append(
+                        (
+                            " ".join(words[position:]),
+                            row,
+                            SOURCES.index(source),
+                            position * (_MAX_LENGTH + 1) + length,
+                        )
+                    )
+        entries.sort()
+        index = cls(
+            song_ids,
+            [key for key, _, _, _ in entries],
+            np.asarray([e[1] for e in entries], dtype=np.int32),
+            np.asarray([e[2] for e in entries], dtype=np.int8),
+            np.asarray([e[3] for e in entries], dtype=np.int32),
+        )
+        logger.info("built", songs=len(song_ids), keys=len(entries))
+        return index
+
+    @classmethod
+    def from_store(cls, store: DocumentStore) -> "TitleIndex":
+        translations = {
+            t.song_id: t for t in store.iter("translations", SongTranslation)
+        }
+
+        def titles():
+            for song in store.iter("songs", Song):
+                t = translations.get(song.id)
+                yield (
+                    song.id,
+                    [
+                        (song.title, "bn"),
+                        (t.title_en if t else None, "en"),
+                        (t.title_translit if t else None, "translit"),
+                    ],
+                )
+
+        return cls.build(titles())
+
+    def __len__(self) -> int:
+        return len(self.song_ids)
+
+    def complete(self, prefix: str, limit: int = 10) -> list[tuple[str, TitleSource]]:
+        """`[(song_id, source)]` of titles with a word sequence starting with
+        `prefix`, best first, one per song."""
+        key = fold(prefix)
+        if not key or limit <= 0:
+            return []
+        lo = bisect_left(self._keys, key)
+        hi = bisect_left(self._keys, key + _END, lo)
+        ranks = np.asarray(self._ranks[lo:hi])
+        # a song has a few keys at most, so `limit * 4` best keys nearly always
+        # hold `limit` songs; otherwise rank the whole slice
+        for want in (limit * 4, ranks.size):
+            best = _best(ranks, want)
+            out: dict[int, int] = {}  # row -> source, first (best) match only
+            for i in best.tolist():
+                out.setdefault(int(self._rows[lo + i]), int(self._sources[lo + i]))
+                if len(out) == limit:
+                    break
+            if len(out) == limit or best.size == ranks.size:
+                break
+        return [(self.song_ids[row], SOURCES[source]) for row, source in out.items()]
+
+    # --- persistence: `{index_dir}/titles/` ---
+
+    @staticmethod
+    def exists(index_dir: Path) -> bool:
+        return (Path(index_dir) / _DIR / _KEYS_FILE).exists()
+
+    def save(self, index_dir: Path) -> None:
+        target = Path(index_dir) / _DIR
+        save_dir(
+            target,
+            {
+                _ROWS_FILE: self._rows,
+                _SOURCES_FILE: self._sources,
+                _RANKS_FILE: self._ranks,
+                _SONG_IDS_FILE: self.song_ids,
+                _KEYS_FILE: self._keys,  # marker: `exists` checks it
+            },
+        )
+        logger.info("saved", dir=str(target), keys=len(self._keys))
+
+    @classmethod
+    def load(cls, index_dir: Path) -> "TitleIndex":
+        source = Path(index_dir) / _DIR
+        index = cls(
+            *load_dir(
+                source,
+                (_SONG_IDS_FILE, _KEYS_FILE, _ROWS_FILE, _SOURCES_FILE, _RANKS_FILE),
+            )
+        )
+        logger.info("loaded", dir=str(source), songs=len(index))
+        return index
+
+
+def _best(ranks: np.ndarray, k: int) -> np.ndarray:
+    """Positions of the `k` lowest ranks (more on a tie), best first; ties keep key
+    order."""
+    if k < ranks.size:
+        # everything tied with the k-th rank stays in, so ties break by key order
+        kth = np.partition(ranks, k - 1)[k - 1]
+        top = np.flatnonzero(ranks <= kth)
+    else:
+        top = np.arange(ranks.size)
+    return top[np.lexsort((top, ranks[top]))]
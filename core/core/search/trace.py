@@ -0,0 +1,88 @@
+"""SearchTrace — per-stage timers and counters for one `SearchService` call.
+
+The service opens a trace per `search_many`, wraps each stage in `trace.stage(name)`
+and bumps `trace.count(event)`; when the call ends, `record()` feeds the process-wide
+histograms and counters that `/metrics` exposes:
+
+    ira_search_seconds                    whole call
+    ira_search_stage_seconds{stage}       result_cache, embed, semantic_cache, scan,
+                                          lexical, filter, fusion, hydrate
+    ira_search_events_total{event}        queries, result_cache_hit, semantic_cache_hit,
+                                          candidates, matched_fields, lexical_hits, ...
+
+A caller can pass its own trace to read the numbers back (the api turns them into a
+`Server-Timing` header). With `search_metrics` off the service uses `DISABLED`, whose
+methods do nothing — no clock reads, no dict updates.
+"""
+
+import time
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+
+from core.metrics import REGISTRY
+
+_SEARCH_SECONDS = REGISTRY.histogram(
+    "ira_search_seconds", "Wall time of one SearchService call."
+)
+_STAGE_SECONDS = REGISTRY.histogram(
+    "ira_search_stage_seconds", "Time spent per search stage.", ("stage",)
+)
+_EVENTS = REGISTRY.counter(
+    "ira_search_events_total", "Search-path events and item counts.", ("event",)
+)
+
+_NO_STAGE = nullcontext()
+
+
+class SearchTrace:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.stages: dict[str, float] = {}  # stage -> seconds (summed over queries)
+        self.counts: dict[str, int] = {}
+
+    def stage(self, name: str) -> AbstractContextManager:
+        return self._timed(name)
+
+    @contextmanager
+    def _timed(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + (
+                time.perf_counter() - start
+            )
+
+    def count(self, event: str, n: int = 1) -> None:
+        self.counts[event] = self.counts.get(event, 0) + n
+
+    def record(self) -> None:
+        """Publish this call's numbers to the process-wide metrics."""
+        _SEARCH_SECONDS.observe(time.perf_counter() - self.started)
+        for name, seconds in self.stages.items():
+            _STAGE_SECONDS.observe(seconds, stage=name)
+        for event, n in self.counts.items():
+            _EVENTS.inc(n, event=event)
+
+    def server_timing(self) -> str:
+        """The stages as a `Server-Timing` header value (milliseconds)."""
+        return ", ".join(
+            f"{name};dur={seconds * 1000:.2f}" for name, seconds in self.stages.items()
+        )
+
+
+class _DisabledTrace(SearchTrace):
+    def __init__(self):
+        self.started = 0.0
+        self.stages, self.counts = {}, {}
+
+    def stage(self, name: str) -> AbstractContextManager:
+        return _NO_STAGE
+
+    def count(self, event: str, n: int = 1) -> None:
+        pass
+
+    def record(self) -> None:
+        pass
+
+
+DISABLED = _DisabledTrace()
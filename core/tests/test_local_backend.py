@@ -0,0 +1,157 @@
+"""LocalSearchBackend (and subclass) persistence: derived structures — scan copies,
+ANN files — must follow the base they were built from, whatever settings or backend
+type the process that last rewrote the base ran with."""
+
+import numpy as np
+
+from core.adapters.search_backend import (
+    HNSWSearchBackend,
+    IVFSearchBackend,
+    LocalSearchBackend,
+)
+from core.domain import Embedding, Field, Lang
+
+DIMS = 64
+SONGS = 300
+ROWS_PER_SONG = 4
+
+
+def _embeddings(seed: int = 0) -> list[Embedding]:
+    rng = np.random.default_rng(seed)
+    out = []
+    for s in range(SONGS):
+        song_id = f"song-{s:04d}"
+        for chunk in range(ROWS_PER_SONG):
+            out.append(
+                Embedding(
+                    id=Embedding.make_id(song_id, Field.LYRICS, Lang.EN, chunk),
+                    song_id=song_id,
+                    field=Field.LYRICS,
+                    lang=Lang.EN,
+                    chunk_index=chunk,
+                    text="",
+                    vector=rng.standard_normal(DIMS).tolist(),
+                )
+            )
+    return out
+
+
+def _top_song(backend: LocalSearchBackend, vector: list[float]) -> str:
+    return backend.search_songs_many([vector], top_k=1)[0][0].song_id
+
+
+def test_scan_copy_rebuilt_after_base_rewritten_under_other_quantization(tmp_path):
+    embeddings = _embeddings()
+    built = LocalSearchBackend(tmp_path, quantization="float16")
+    built.index(embeddings)
+    built.save()
+
+    # another process, configured without quantization, compacts and saves
+    plain = LocalSearchBackend(tmp_path, quantization="none").load()
+    for s in range(60):
+        plain.delete(f"song-{s:04d}")
+    plain.compact()
+    plain.save()
+    assert not (tmp_path / "vectors.f16.npy").exists()
+
+    reloaded = LocalSearchBackend(tmp_path, quantization="float16").load()
+    assert reloaded._scan.shape == reloaded._vectors.shape
+    probe = next(e for e in embeddings if e.song_id == "song-0200")
+    assert _top_song(reloaded, probe.vector) == "song-0200"
+
+
+def test_scan_copy_derived_on_load_is_saved_with_the_next_save(tmp_path):
+    plain = LocalSearchBackend(tmp_path)
+    plain.index(_embeddings())
+    plain.save()
+
+    int8 = LocalSearchBackend(tmp_path, quantization="int8").load()
+    int8.delete("song-0000")
+    int8.save()  # base untouched: only a tombstone, but the copy is new
+
+    reloaded = LocalSearchBackend(tmp_path, quantization="int8").load()
+    assert reloaded._structure_files == ["vectors.i8.npy", "i8_scale.npy"]
+    assert reloaded._scan.shape == reloaded._vectors.shape
+
+
+def test_prefix_scan_copy_rebuilt_after_base_rewritten_without_prefix(tmp_path):
+    embeddings = _embeddings()
+    built = LocalSearchBackend(tmp_path, prefix_dims=16)
+    built.index(embeddings)
+    built.save()
+    assert (tmp_path / "vectors.p16.npy").exists()
+
+    plain = LocalSearchBackend(tmp_path).load()
+    for s in range(60):
+        plain.delete(f"song-{s:04d}")
+    plain.compact()
+    plain.save()
+    assert not (tmp_path / "vectors.p16.npy").exists()
+
+    reloaded = LocalSearchBackend(tmp_path, prefix_dims=16).load()
+    assert reloaded._scan.shape == (reloaded._vectors.shape[0], 16)
+    probe = next(e for e in embeddings if e.song_id == "song-0200")
+    assert _top_song(reloaded, probe.vector) == "song-0200"
+
+
+def test_ivf_lists_retrained_after_base_rewritten_by_local_backend(tmp_path):
+    embeddings = _embeddings()
+    built = IVFSearchBackend(tmp_path)
+    built.index(embeddings)
+    built.save()
+
+    plain = LocalSearchBackend(tmp_path).load()
+    for s in range(60):
+        plain.delete(f"song-{s:04d}")
+    plain.compact()
+    plain.save()
+    assert not (tmp_path / "ivf_rows.npy").exists()
+
+    reloaded = IVFSearchBackend(tmp_path, nprobe=10_000).load()
+    assert reloaded._list_rows.size == reloaded._vectors.shape[0]
+    probe = next(e for e in embeddings if e.song_id == "song-0200")
+    assert _top_song(reloaded, probe.vector) == "song-0200"
+
+
+def test_ivf_emptied_base_searches_only_deltas(tmp_path):
+    embeddings = _embeddings()
+    backend = IVFSearchBackend(tmp_path)
+    backend.index(embeddings[: 2 * ROWS_PER_SONG])
+    backend.delete("song-0000")
+    backend.delete("song-0001")
+    backend.compact()
+    backend.upsert("song-0005", [e for e in embeddings if e.song_id == "song-0005"])
+    probe = next(e for e in embeddings if e.song_id == "song-0005")
+    assert _top_song(backend, probe.vector) == "song-0005"
+
+
+def test_hnsw_graph_rebuilt_after_base_rewritten_by_local_backend(tmp_path):
+    embeddings = _embeddings()[: 40 * ROWS_PER_SONG]
+    built = HNSWSearchBackend(tmp_path)
+    built.index(embeddings)
+    built.save()
+
+    plain = LocalSearchBackend(tmp_path).load()
+    for s in range(10):
+        plain.delete(f"song-{s:04d}")
+    plain.compact()
+    plain.save()
+    assert not (tmp_path / "hnsw.npz").exists()
+
+    reloaded = HNSWSearchBackend(tmp_path).load()
+    assert reloaded._layer0.shape[0] == reloaded._vectors.shape[0]
+    probe = next(e for e in embeddings if e.song_id == "song-0020")
+    assert _top_song(reloaded, probe.vector) == "song-0020"
+
+
+def test_hnsw_emptied_base_searches_only_deltas(tmp_path):
+    embeddings = _embeddings()
+    backend = HNSWSearchBackend(tmp_path)
+    backend.index(embeddings[: 2 * ROWS_PER_SONG])
+    backend.delete("song-0000")
+    backend.delete("song-0001")
+    backend.compact()
+    backend.upsert("song-0005", [e for e in embeddings if e.song_id == "song-0005"])
+    probe = next(e for e in embeddings if e.song_id == "song-0005")
+    assert _top_song(backend, probe.vector) == "song-0005"
+    assert backend.search(probe.vector, top_k=1)[0].song_id == "song-0005"
@@ -0,0 +1,141 @@
+"""bench: recall / latency report for the search backend variants.
+
+Every variant indexes the same stored embeddings and is scored against exact float32
+brute force, so the numbers isolate what the variant trades away. Queries are held
+out: a random sample of stored chunk vectors is left out of the index and used as
+the query vectors — no embedding calls, so it runs offline, and (unlike a query that
+is a noisy copy of an indexed row) no query has one dominant exact match, so the
+top_k is a close race among real neighbours, where quantization and approximate
+search actually lose recall. Each query also runs once restricted to English lyrics,
+since filters are where approximate indexes tend to lose the most.
+
+    uv run python -m pipeline.cli bench --queries 200 --top-k 10
+"""
+
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+import structlog
+from core.adapters.search_backend import (
+    HNSWSearchBackend,
+    IVFSearchBackend,
+    LocalSearchBackend,
+    ShardedSearchBackend,
+)
+from core.domain import Embedding, Field, Hit, Lang, SongEmbeddings
+from core.ports import DocumentStore, SearchBackend
+from pydantic import BaseModel
+
+logger = structlog.get_logger(__name__).bind(stage="bench")
+
+FILTER_FIELDS = [Field.LYRICS]
+FILTER_LANGS = [Lang.EN]
+
+
+class BenchRow(BaseModel):
+    """One variant's line in the report."""
+
+    variant: str
+    build_seconds: float
+    recall: float  # mean recall@top_k against the exact float32 top_k
+    recall_filtered: float  # same, restricted to FILTER_FIELDS / FILTER_LANGS
+    p50_ms: float
+    p95_ms: float
+
+
+def default_variants(scratch_dir: Path) -> dict[str, Callable[[], SearchBackend]]:
+    """Exact float32 first (the reference), then quantized and Matryoshka-prefix scans,
+    a 4-way sharded exact scan, IVF probes, and HNSW beams — exact vs. partitioned vs.
+    graph search over the same rows."""
+    return {
+        "float32": lambda: LocalSearchBackend(scratch_dir),
+        "float16": lambda: LocalSearchBackend(scratch_dir, quantization="float16"),
+        "int8": lambda: LocalSearchBackend(scratch_dir, quantization="int8"),
+        "prefix/128": lambda: LocalSearchBackend(
+            scratch_dir, prefix_dims=128, rescore_factor=10
+        ),
+        "prefix/256": lambda: LocalSearchBackend(
+            scratch_dir, prefix_dims=256, rescore_factor=10
+        ),
+        "sharded/4": lambda: ShardedSearchBackend(scratch_dir, shards=4),
+        "ivf/4": lambda: IVFSearchBackend(scratch_dir, nprobe=4),
+        "ivf/16": lambda: IVFSearchBackend(scratch_dir, nprobe=16),
+        "hnsw/32": lambda: HNSWSearchBackend(scratch_dir, ef_search=32),
+        "hnsw/128": lambda: HNSWSearchBackend(scratch_dir, ef_search=128),
+    }
+
+
+def run_bench(
+    store: DocumentStore,
+    variants: dict[str, Callable[[], SearchBackend]],
+    queries: int = 200,
+    top_k: int = 10,
+    seed: int = 0,
+) -> list[BenchRow]:
+    """Build each variant, run the same queries through it, report against the first
+    variant (which must be exact)."""
+    embeddings = [
+        item
+        for song_emb in store.iter("embeddings", SongEmbeddings)
+        for item in song_emb.items
+    ]
+    if len(embeddings) < 2:
+        raise SystemExit("no embeddings stored — run `embed` first")
+    embeddings, query_vectors = _held_out(embeddings, queries, seed)
+
+    rows: list[BenchRow] = []
+    reference: tuple[list[set[tuple]], list[set[tuple]]] | None = None
+    for name, make in variants.items():
+        backend = make()
+        started = time.perf_counter()
+        backend.index(embeddings)
+        build_seconds = time.perf_counter() - started
+
+        latencies: list[float] = []
+        results: list[set[tuple]] = []
+        for vector in query_vectors:
+            started = time.perf_counter()
+            hits = backend.search(vector, top_k=top_k)
+            latencies.append((time.perf_counter() - started) * 1000)
+            results.append(_keys(hits))
+        filtered = [
+            _keys(backend.search(v, top_k, FILTER_FIELDS, FILTER_LANGS))
+            for v in query_vectors
+        ]
+        if reference is None:
+            reference = (results, filtered)
+        row = BenchRow(
+            variant=name,
+            build_seconds=build_seconds,
+            recall=_recall(results, reference[0]),
+            recall_filtered=_recall(filtered, reference[1]),
+            p50_ms=float(np.percentile(latencies, 50)),
+            p95_ms=float(np.percentile(latencies, 95)),
+        )
+        logger.info("bench", **row.model_dump())
+        rows.append(row)
+    return rows
+
+
+def _keys(hits: list[Hit]) -> set[tuple]:
+    return {(h.song_id, h.field, h.lang, h.chunk_index) for h in hits}
+
+
+def _recall(got: list[set[tuple]], want: list[set[tuple]]) -> float:
+    return float(
+        np.mean([len(g & w) / max(len(w), 1) for g, w in zip(got, want, strict=True)])
+    )
+
+
+def _held_out(
+    embeddings: list[Embedding], n: int, seed: int
+) -> tuple[list[Embedding], list[list[float]]]:
+    """(embeddings to index, query vectors): `n` random chunks (at most half the
+    corpus) are removed from the index and become the queries."""
+    rng = np.random.default_rng(seed)
+    size = min(n, len(embeddings) // 2)
+    picks = set(rng.choice(len(embeddings), size=size, replace=False).tolist())
+    indexed = [e for i, e in enumerate(embeddings) if i not in picks]
+    return indexed, [embeddings[i].vector for i in sorted(picks)]
@@ -6,7 +6,9 @@ ports. Run from anywhere in the workspace:
     uv run python -m pipeline.cli ingest
     uv run python -m pipeline.cli all                 # ingest -> translate -> embed -> index
     uv run python -m pipeline.cli all --fake          # no API key needed (plumbing test)
+    uv run python -m pipeline.cli index --full        # rebuild instead of incremental
     uv run python -m pipeline.cli search "monsoon longing"
+    uv run python -m pipeline.cli bench               # backend recall/latency report
 
 Uses Gemini when GEMINI_API_KEY is set, else falls back to the fake providers.
 """
@@ -14,15 +16,18 @@ Uses Gemini when GEMINI_API_KEY is set, else falls back to the fake providers.
 import argparse
 
 from core.adapters.document_store import LocalDocumentStore
-from core.adapters.search_backend import LocalSearchBackend
+from core.adapters.search_backend import LocalSearchBackend, ShardedSearchBackend
 from core.config import settings
 from core.factory import (
     build_embedding_provider,
     build_fusion_strategy,
+    build_index_versions,
+    build_search_backend,
     build_translation_provider,
 )
-from core.search import SearchService
+from core.search import LexicalIndex, SearchService
 
+from pipeline.bench import default_variants, run_bench
 from pipeline.stages import run_embed, run_index, run_ingest, run_translate
 
 
@@ -30,13 +35,19 @@ def main() -> None:
     parser = argparse.ArgumentParser(prog="ira-pipeline")
     parser.add_argument(
         "command",
-        choices=["ingest", "translate", "embed", "index", "all", "search"],
+        choices=["ingest", "translate", "embed", "index", "all", "search", "bench"],
     )
     parser.add_argument("query", nargs="?", help="search query (for `search`)")
     parser.add_argument(
         "--fake", action="store_true", help="use offline fake providers"
     )
     parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument(
+        "--queries", type=int, default=200, help="held-out queries for `bench`"
+    )
+    parser.add_argument(
+        "--full", action="store_true", help="rebuild the index instead of updating it"
+    )
     parser.add_argument(
         "--fusion",
         choices=["rrf", "weighted_sum"],
@@ -46,7 +57,8 @@ def main() -> None:
     args = parser.parse_args()
 
     store = LocalDocumentStore(settings.data_dir)
-    backend = LocalSearchBackend(settings.data_dir / "index")
+    backend = build_search_backend()
+    versions = build_index_versions()
 
     match args.command:
         case "ingest":
@@ -56,19 +68,21 @@ def main() -> None:
         case "embed":
             run_embed(store, build_embedding_provider(args.fake))
         case "index":
-            run_index(store, backend)
+            run_index(store, build_search_backend, versions, full=args.full)
         case "all":
             run_ingest(store, settings.source_jsonl)
             run_translate(store, build_translation_provider(args.fake))
             run_embed(store, build_embedding_provider(args.fake))
-            run_index(store, backend)
+            run_index(store, build_search_backend, versions, full=args.full)
         case "search":
             _search(store, backend, args.query, args.top_k, args.fake, args.fusion)
+        case "bench":
+            _bench(store, args.queries, args.top_k)
 
 
 def _search(
     store: LocalDocumentStore,
-    backend: LocalSearchBackend,
+    backend: LocalSearchBackend | ShardedSearchBackend,
     query: str | None,
     top_k: int,
     fake: bool,
@@ -82,6 +96,9 @@ def _search(
         backend,
         build_embedding_provider(fake),
         build_fusion_strategy(),
+        lexical=(
+            LexicalIndex.load(backend.dir) if LexicalIndex.exists(backend.dir) else None
+        ),
     )
     fusion_override = build_fusion_strategy(fusion_name) if fusion_name else None
     for result in service.search(query, top_k=top_k, fusion=fusion_override):
@@ -89,5 +106,18 @@ def _search(
         print(f"{result.score:.3f}  {result.title}  ({matched})")
 
 
+def _bench(store: LocalDocumentStore, queries: int, top_k: int) -> None:
+    variants = default_variants(settings.data_dir / "bench")
+    print(
+        f"{'variant':<10} {'build s':>8} {'recall':>7} {'filtered':>8} "
+        f"{'p50 ms':>7} {'p95 ms':>7}"
+    )
+    for row in run_bench(store, variants, queries=queries, top_k=top_k):
+        print(
+            f"{row.variant:<10} {row.build_seconds:>8.2f} {row.recall:>7.3f} "
+            f"{row.recall_filtered:>8.3f} {row.p50_ms:>7.2f} {row.p95_ms:>7.2f}"
+        )
+
+
 if __name__ == "__main__":
     main()
@@ -1,14 +1,118 @@
-"""index: load all stored embeddings into the SearchBackend and persist it."""
+"""index: load stored embeddings into the SearchBackend and publish it as a new version.
+
+Each run builds into a fresh version dir (see `core.index_versions`) and flips
+`CURRENT` only once the index is completely saved, so a running api never sees a
+half-written index — it picks the new version up and swaps to it while serving.
+
+Incremental for the local backends: each version keeps a `sources.json` of every
+song's embeddings-, song- and translation-record stamps (see `DocumentStore.stamp`)
+as of its build, so a re-run only upserts songs whose embeddings record changed and
+deletes songs whose record is gone
+— a one-song fix costs one record load and one small delta segment, on top of a
+hard-linked copy of the current version, not a full rebuild. Once deltas + tombstones
+exceed `index_compact_fraction` of the rows the backend is compacted. `full=True` (or
+no published version with `sources.json`) rebuilds from scratch; a run with nothing to
+change publishes nothing.
+
+Every published version also gets a BM25 `LexicalIndex` (`lexical/`) and a title
+prefix `TitleIndex` (`titles/`, for typeahead) over the song and translation records;
+both are rebuilt in full each time — they are small and quick next to the vectors.
+A run where only song or translation records changed still publishes a version: the
+vector index is carried over untouched and these text indexes are rebuilt.
+With `similar_songs_k > 0` it also gets a song kNN `SimilarityGraph` (`similar/`,
+"more like this"); an incremental run reuses the previous version's song centroids
+and re-reads only the changed songs' embeddings.
+"""
+
+import json
+from collections.abc import Callable
+from pathlib import Path
 
 import structlog
-from core.adapters.search_backend import LocalSearchBackend
+from core.adapters.search_backend import LocalSearchBackend, ShardedSearchBackend
+from core.config import settings
 from core.domain import SongEmbeddings
+from core.files import write_json
+from core.index_versions import IndexVersions
 from core.ports import DocumentStore, SearchBackend
+from core.search import LexicalIndex, SimilarityGraph, TitleIndex
 
 logger = structlog.get_logger(__name__).bind(stage="index")
 
+_SOURCES_FILE = "sources.json"
+# collections whose stamps `sources.json` records; the vectors follow "embeddings",
+# the text indexes (lexical, titles) follow the song + translation records
+_SOURCES = ("embeddings", "songs", "translations")
+_TEXT_SOURCES = ("songs", "translations")
+
+# Backends that persist to an index dir (and support incremental updates there).
+_OnDisk = LocalSearchBackend | ShardedSearchBackend
+
+
+def run_index(
+    store: DocumentStore,
+    build_backend: Callable[[Path], SearchBackend],
+    versions: IndexVersions,
+    full: bool = False,
+) -> int:
+    """Returns the number of vectors (re)indexed. `build_backend(dir)` makes the
+    (unloaded) backend for a version dir."""
+    stamps = {
+        collection: {sid: store.stamp(collection, sid) for sid in store.ids(collection)}
+        for collection in _SOURCES
+    }
+    current = versions.current_dir()
+    previous = None if full or current is None else _read_sources(current)
+    removed: list[str] = []
+    changed: list[str] = []
+    if previous is not None:
+        embeddings = stamps["embeddings"]
+        removed = [sid for sid in previous["embeddings"] if sid not in embeddings]
+        changed = [
+            sid
+            for sid, stamp in embeddings.items()
+            if stamp is None or previous["embeddings"].get(sid) != stamp
+        ]
+        text_changed = any(
+            previous.get(collection) != stamps[collection]
+            or None in stamps[collection].values()
+            for collection in _TEXT_SOURCES
+        )
+        if not removed and not changed and not text_changed:
+            logger.info("indexed", vectors=0, mode="incremental", note="up to date")
+            return 0
+
+    target = versions.create(copy_from=current if previous is not None else None)
+    try:
+        backend = build_backend(target)
+        if not isinstance(backend, _OnDisk):
+            # self-persisting backend: nothing to version, just (re)index it
+            versions.discard(target)
+            return _run_full(store, backend)
+        vectors_changed = previous is None or bool(changed or removed)
+        if previous is None:
+            count = _run_full(store, backend)
+        elif vectors_changed:
+            count = _run_incremental(store, backend, changed, removed)
+        else:
+            # only song / translation records changed: keep the copied vectors
+            count = 0
+            logger.info("indexed", vectors=0, mode="incremental", note="text only")
+        if vectors_changed:
+            backend.save()
+        LexicalIndex.from_store(store).save(target)
+        TitleIndex.from_store(store).save(target)
+        if settings.similar_songs_k > 0 and vectors_changed:
+            _build_similar(store, target, changed if previous is not None else None)
+        _write_sources(target, stamps)
+    except BaseException:
+        versions.discard(target)
+        raise
+    versions.publish(target)
+    return count
+
 
-def run_index(store: DocumentStore, backend: SearchBackend) -> int:
+def _run_full(store: DocumentStore, backend: SearchBackend) -> int:
     count = 0
 
     def all_embeddings():
@@ -19,8 +123,74 @@ def run_index(store: DocumentStore, backend: SearchBackend) -> int:
                 yield item
 
     backend.index(all_embeddings())
-    # Local backend persists to disk so the api can load it; other backends self-persist.
-    if isinstance(backend, LocalSearchBackend):
-        backend.save()
-    logger.info("indexed", vectors=count)
+    logger.info("indexed", vectors=count, mode="full")
     return count
+
+
+def _run_incremental(
+    store: DocumentStore, backend: _OnDisk, changed: list[str], removed: list[str]
+) -> int:
+    try:
+        backend.load()
+    except FileNotFoundError as e:
+        # the current version was built with another layout (sharded vs. not), so
+        # there is nothing of this backend's to update in place
+        raise RuntimeError(
+            f"cannot update the current index incrementally ({e}): it was built "
+            "with different backend settings; rebuild with --full"
+        ) from e
+    count = 0
+    for song_id in removed:
+        backend.delete(song_id)
+    for song_id in changed:
+        song_emb = store.load("embeddings", song_id, SongEmbeddings)
+        if song_emb is None:
+            backend.delete(song_id)
+            continue
+        backend.upsert(song_id, song_emb.items)
+        count += len(song_emb.items)
+    if backend.dead_fraction > settings.index_compact_fraction:
+        backend.compact()
+    logger.info(
+        "indexed",
+        vectors=count,
+        mode="incremental",
+        changed=len(changed),
+        removed=len(removed),
+    )
+    return count
+
+
+def _build_similar(
+    store: DocumentStore, target: Path, changed: list[str] | None
+) -> None:
+    """`changed` None: full build. Otherwise `target` is a copy of the previous
+    version, whose centroids are reused for every song not in `changed`."""
+    reuse = None
+    if changed is not None and SimilarityGraph.exists(target):
+        skip = set(changed)
+        reuse = {
+            sid: centroid
+            for sid, centroid in SimilarityGraph.load(target).centroids().items()
+            if sid not in skip
+        }
+    SimilarityGraph.from_store(store, settings.similar_songs_k, reuse).save(target)
+
+
+def _read_sources(version_dir: Path) -> dict[str, dict[str, str | None]] | None:
+    """`{collection: {id: stamp}}` as of the version's build. A version written
+    before song / translation stamps were recorded holds only the embeddings map;
+    its text collections read as missing, so the next run rebuilds the text
+    indexes."""
+    path = version_dir / _SOURCES_FILE
+    if not path.exists():
+        return None
+    sources = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(sources.get("embeddings"), dict):
+        sources = {"embeddings": sources}
+    return sources
+
+
+def _write_sources(version_dir: Path, stamps: dict[str, dict[str, str | None]]) -> None:
+    # the file may be a hard link shared with the previous version
+    write_json(version_dir / _SOURCES_FILE, stamps)